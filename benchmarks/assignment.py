@@ -0,0 +1,35 @@
+"""
+Assignment fast path and auction against VAM + MODI on random n×n assignment problems.
+
+Usage: python benchmarks/assignment.py [n ...]   (default: 500 1000 2000 3000)
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solvers import TransportationProblem  # noqa: E402
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(sizes):
+    rng = np.random.default_rng(0)
+    print(f"{'n':>6} {'MODI (s)':>10} {'ASSIGNMENT (s)':>15} {'speedup':>8} {'AUCTION (s)':>12}  same cost")
+    for n in sizes:
+        problem = TransportationProblem(rng.integers(1, 1000, (n, n)).astype(float), np.ones(n), np.ones(n))
+        modi, modi_time = timed(lambda: problem.ModiMethod(compact=True))
+        fast, fast_time = timed(lambda: problem.solve('ASSIGNMENT', compact=True))
+        auction, auction_time = timed(lambda: problem.solve('AUCTION', compact=True))
+        print(f"{n:>6} {modi_time:>10.2f} {fast_time:>15.3f} {modi_time / fast_time:>7.0f}x {auction_time:>12.2f}  "
+              f"{np.isclose(modi.total_cost, fast.total_cost) and np.isclose(fast.total_cost, auction.total_cost)}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [500, 1000, 2000, 3000])
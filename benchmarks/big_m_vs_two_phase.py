@@ -0,0 +1,73 @@
+"""
+Big M against the two-phase simplex on generated LPs with >=, <= and = rows.
+
+Each instance minimizes a positive objective whose costs span the given magnitude
+over rows built around a known nonnegative point, so every instance is feasible and
+bounded and any answer other than an optimum is wrong. For each size it prints the
+mean pivots and time of both methods, the share of two-phase pivots spent in
+Phase I, and how many answers were wrong (not optimal, or a worse value than the
+other method found).
+
+Usage: python benchmarks/big_m_vs_two_phase.py [rows columns cost_magnitude ...]
+       (default: 20 30 1e2  20 30 1e4  20 30 1e5  100 150 1e2  100 150 1e5)
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solvers import big_m_method, two_phase_method  # noqa: E402
+
+# Instances per size
+INSTANCES = 10
+
+
+def instance(m, n, magnitude, rng):
+    A = rng.uniform(0, 10, (m, n)) * (rng.random((m, n)) < 0.3)
+    A[rng.integers(0, m, n), np.arange(n)] = rng.uniform(1, 10, n)
+    activity = A @ rng.uniform(0, 5, n)
+    types = rng.choice(['>=', '<=', '='], m, p=[0.5, 0.3, 0.2])
+    b = np.where(types == '>=', activity * 0.9, np.where(types == '<=', activity * 1.1, activity))
+    c = rng.uniform(1, magnitude, n)
+    return c, A, b, list(types)
+
+
+def timed(method, c, A, b, types):
+    start = time.perf_counter()
+    value, _, basis = method(c, A, b, types, Min=True, return_basis=True)
+    return value, basis, time.perf_counter() - start
+
+
+def main(cases):
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>5} {'cols':>5} {'costs':>7} {'Big M pivots':>13} {'time (s)':>9} {'wrong':>6} "
+          f"{'2-phase pivots':>15} {'Phase I':>8} {'time (s)':>9} {'wrong':>6}")
+    for m, n, magnitude in cases:
+        runs = {big_m_method: [], two_phase_method: []}
+        for _ in range(INSTANCES):
+            c, A, b, types = instance(m, n, magnitude, rng)
+            for method, results in runs.items():
+                results.append(timed(method, c, A, b, types))
+        best = [min(run[k][0] for run in runs.values() if not isinstance(run[k][0], str))
+                for k in range(INSTANCES)]
+        row = f"{m:>5} {n:>5} {magnitude:>7.0e}"
+        for method, results in runs.items():
+            wrong = sum(isinstance(value, str) or value > best[k] + 1e-6 * max(1.0, abs(best[k]))
+                        for k, (value, _, _) in enumerate(results))
+            solved = [basis for _, basis, _ in results if basis is not None]
+            pivots = np.mean([basis.iterations for basis in solved]) if solved else float('nan')
+            seconds = np.mean([elapsed for _, _, elapsed in results])
+            if method is big_m_method:
+                row += f" {pivots:>13.1f} {seconds:>9.3f} {wrong:>6}"
+            else:
+                phase_one = np.mean([basis.phase_one_iterations for basis in solved]) if solved else float('nan')
+                row += f" {pivots:>15.1f} {phase_one / pivots:>8.0%} {seconds:>9.3f} {wrong:>6}"
+        print(row)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    cases = [(int(args[k]), int(args[k + 1]), float(args[k + 2])) for k in range(0, len(args), 3)]
+    main(cases or [(20, 30, 1e2), (20, 30, 1e4), (20, 30, 1e5), (100, 150, 1e2), (100, 150, 1e5)])
@@ -0,0 +1,55 @@
+"""
+Interior point against simplex_method on generated sparse LPs.
+
+Each instance maximizes a positive objective over A x <= b, x >= 0, where A has the
+given density of nonzeros (mixed signs) and every column has a positive entry. For
+each size it prints the interior-point iterations and time with and without
+crossover, and the simplex pivots and time.
+
+Usage: python benchmarks/interior_point.py [rows columns density ...]
+       (default: 500 2500 0.01  1000 5000 0.005  2000 10000 0.0025)
+"""
+import os
+import sys
+import time
+
+import numpy as np
+from scipy import sparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solvers import interior_point_method, simplex_method  # noqa: E402
+
+
+def instance(m, n, density, rng):
+    A = sparse.random(m, n, density=density, format="csc", random_state=rng,
+                      data_rvs=lambda k: rng.uniform(-1, 10, k))
+    # One positive entry per column keeps the problem bounded
+    A = A + sparse.csc_matrix((rng.uniform(1, 10, n), (rng.integers(0, m, n), np.arange(n))), shape=(m, n))
+    return rng.uniform(1, 10, n), A, rng.uniform(10, 100, m)
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(cases):
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>6} {'cols':>7} {'IPM iters':>10} {'IPM (s)':>8} {'crossover (s)':>14} {'pivots':>7} "
+          f"{'simplex pivots':>15} {'simplex (s)':>12}  same value")
+    for m, n, density in cases:
+        c, A, b = instance(m, n, density, rng)
+        (value, _, stats), ipm_time = timed(lambda: interior_point_method(c, A, b, return_stats=True))
+        (_, _, crossed), crossover_time = timed(
+            lambda: interior_point_method(c, A, b, crossover=True, return_stats=True))
+        (simplex_value, _, basis), simplex_time = timed(lambda: simplex_method(c, A, b, return_basis=True))
+        print(f"{m:>6} {n:>7} {stats['iterations']:>10} {ipm_time:>8.2f} {crossover_time:>14.2f} "
+              f"{crossed['crossover_pivots']:>7} {basis.iterations:>15} {simplex_time:>12.2f}  "
+              f"{np.isclose(value, simplex_value)}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    cases = [(int(args[k]), int(args[k + 1]), float(args[k + 2])) for k in range(0, len(args), 3)]
+    main(cases or [(500, 2500, 0.01), (1000, 5000, 0.005), (2000, 10000, 0.0025)])
@@ -0,0 +1,67 @@
+"""
+Cost of one widget interaction on the Linear Programming page.
+
+Streamlit reruns the whole script on every interaction, except inside an
+st.fragment, which reruns only its own function, and an st.form, which does not
+rerun until it is submitted. With every tab sized to an n×n model, it prints the
+time of a full script run and of each tab fragment's body, which is what an edit in
+that tab now costs. On a tree without fragments only the full run is reported.
+
+Usage: python benchmarks/page_reruns.py [size ...] [--page path] [--runs k]
+       (default: 10 40, pages/LinearProgramingProblem.py, 5 runs)
+"""
+import argparse
+import os
+import time
+from collections import defaultdict
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIZE_KEYS = ["simplex_num_vars", "simplex_num_constr", "bigm_num_vars", "bigm_num_constr",
+             "int_num_vars", "int_num_constr", "ipm_num_vars", "ipm_num_constr"]
+
+fragment_times = defaultdict(list)
+_fragment = streamlit.fragment
+
+
+def timed_fragment(func=None, **kwargs):
+    """st.fragment that also records how long each run of the function takes."""
+    if func is None:
+        return lambda f: timed_fragment(f, **kwargs)
+
+    def run(*args, **kw):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kw)
+        finally:
+            fragment_times[func.__name__].append(time.perf_counter() - start)
+    run.__name__ = func.__name__
+    return _fragment(run, **kwargs)
+
+
+def main(sizes, page, runs):
+    streamlit.fragment = timed_fragment
+    print(f"{'size':>5} {'full run (ms)':>14}  fragment bodies (ms)")
+    for n in sizes:
+        at = AppTest.from_file(page, default_timeout=120).run()
+        for key in SIZE_KEYS:
+            at.number_input(key=key).set_value(n)
+        at.run()
+        fragment_times.clear()
+        start = time.perf_counter()
+        for _ in range(runs):
+            at.run()
+        full = (time.perf_counter() - start) / runs
+        bodies = "  ".join(f"{name} {1000 * sum(t) / len(t):.0f}" for name, t in fragment_times.items())
+        print(f"{n:>5} {1000 * full:>14.0f}  {bodies or '-'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sizes", nargs="*", type=int, default=[10, 40])
+    parser.add_argument("--page", default=os.path.join(ROOT, "pages", "LinearProgramingProblem.py"))
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    main(args.sizes, os.path.abspath(args.page), args.runs)
@@ -0,0 +1,57 @@
+"""
+Sparse against dense constraint matrices in simplex_method on generated LPs.
+
+Each instance maximizes a positive objective over A x <= b, x >= 0, where A has the
+given density of nonzeros (mixed signs) and every column has a positive entry.
+
+Usage: python benchmarks/sparse_lp.py [rows columns density ...]
+       (default: 500 2500 0.01  1000 5000 0.005  2000 10000 0.0025)
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from scipy import sparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from solvers import simplex_method  # noqa: E402
+
+
+def instance(m, n, density, rng):
+    A = sparse.random(m, n, density=density, format="csc", random_state=rng,
+                      data_rvs=lambda k: rng.uniform(-1, 10, k))
+    # One positive entry per column keeps the problem bounded
+    A = A + sparse.csc_matrix((rng.uniform(1, 10, n), (rng.integers(0, m, n), np.arange(n))), shape=(m, n))
+    return rng.uniform(1, 10, n), A, rng.uniform(10, 100, m)
+
+
+def measured(func):
+    """Result, seconds, and peak MiB allocated (from a second, traced run)."""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 2 ** 20
+
+
+def main(cases):
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>6} {'cols':>7} {'nnz':>8} {'sparse (s)':>11} {'MiB':>7} {'dense (s)':>10} {'MiB':>7}  same value")
+    for m, n, density in cases:
+        c, A, b = instance(m, n, density, rng)
+        (value, _), sparse_time, sparse_peak = measured(lambda: simplex_method(c, A, b))
+        dense = A.toarray()
+        (dense_value, _), dense_time, dense_peak = measured(lambda: simplex_method(c, dense, b))
+        print(f"{m:>6} {n:>7} {A.nnz:>8} {sparse_time:>11.2f} {sparse_peak:>7.1f} {dense_time:>10.2f} "
+              f"{dense_peak:>7.1f}  {np.isclose(value, dense_value)}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    cases = [(int(args[k]), int(args[k + 1]), float(args[k + 2])) for k in range(0, len(args), 3)]
+    main(cases or [(500, 2500, 0.01), (1000, 5000, 0.005), (2000, 10000, 0.0025)])
@@ -1,7 +1,13 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from OTTools import graphical_method, simplex_method, big_m_method, integer_simplex
+import pandas as pd
+import altair as alt
+import io
+import os
+import time
+from solvers import (default_cache, graphical_method, simplex_method, big_m_method, two_phase_method,
+                     interior_point_method, BranchAndBound)
+from solvers.linear_programming import CUT_ROUNDS
 
 # Page configuration
 st.set_page_config(page_title="Linear Programming Solver", layout="wide")
@@ -316,6 +322,8 @@ with st.sidebar:
     """)
     st.markdown("---")
     st.caption("© 2025 OTTools Team")
+    # Refreshed by each tab's fragment, which reruns without the rest of the page
+    cache_counter = st.empty()
 
 st.title("Linear Programming Problem Solver")
 st.markdown("""
@@ -324,7 +332,13 @@ Use the tabs below to select a method and input your problem parameters.
 """)
 
 # Create a mini navigation bar using tabs
-tabs = st.tabs(["Graphical Method", "Simplex Method", "Big M Method", "Integer Simplex Method"])
+tabs = st.tabs(["Graphical Method", "Simplex Method", "Big M Method", "Integer Simplex Method",
+                "Interior Point Method"])
+
+def show_cache_stats():
+    """Solve cache counters in the sidebar, including this run's solve."""
+    cache_stats = default_cache().stats()
+    cache_counter.caption(f"🗄️ Solve cache: {cache_stats['hits']} hits · {cache_stats['misses']} misses")
 
 # Helper function to display solution in a consistent and appealing way
 def display_solution(method_name, optimal_value, solution, obj_type, coeffs=None, additional_info=None):
@@ -350,13 +364,13 @@ def display_solution(method_name, optimal_value, solution, obj_type, coeffs=None
         
         # If there are more variables than columns
         remaining_vars = solution[len(var_cols):]
-        if remaining_vars:
+        if len(remaining_vars):
             st.write("Additional variables:")
             for i, value in enumerate(remaining_vars, start=len(var_cols)):
                 st.write(f"x{i+1} = {value:.4f}")
         
         # Display objective function evaluation
-        if coeffs:
+        if coeffs is not None:
             st.markdown("#### Objective Function")
             obj_terms = [f"{c:.2f}×{value:.4f}" for c, value in zip(coeffs, solution)]
             obj_expression = " + ".join(obj_terms)
@@ -373,106 +387,272 @@ def display_solution(method_name, optimal_value, solution, obj_type, coeffs=None
         st.info(f"The optimal solution {obj_verb} the objective function at Z = {optimal_value:.4f}. "
                 f"This means you should produce the quantities shown above to achieve the best outcome.")
 
+def _resized(values, shape, default):
+    """values cut or padded to shape; new cells take default(i, j)."""
+    grown = np.array([[default(i, j) for j in range(shape[1])] for i in range(shape[0])]).reshape(shape)
+    if values is not None:
+        rows, cols = min(shape[0], values.shape[0]), min(shape[1], values.shape[1])
+        grown[:rows, :cols] = values[:rows, :cols]
+    return grown
+
+
+def coefficient_grid(prefix, num_vars, num_constr, default_c, default_a, default_rhs, operators=("<=",)):
+    """
+    Objective row and constraint grid (coefficients, operator, RHS) of an LP tab, each
+    one st.data_editor instead of one widget per number.
+
+    The values live in session state as NumPy arrays ({prefix}_c, {prefix}_A, {prefix}_b,
+    {prefix}_ops). The tables behind the editors are only rebuilt from them when the
+    model changes size, so a rerun costs the same however large the model is.
+
+    Returns:
+    (c, A, b, constraint_types) as the solvers take them
+    """
+    n, m = int(num_vars), int(num_constr)
+    columns = [f"x{j+1}" for j in range(n)]
+    if st.session_state.get(f"{prefix}_A", np.zeros((0, 0))).shape != (m, n):
+        c = _resized(st.session_state.get(f"{prefix}_c"), (1, n), lambda i, j: default_c(j))
+        A = _resized(st.session_state.get(f"{prefix}_A"), (m, n), default_a)
+        b = _resized(st.session_state.get(f"{prefix}_b"), (m, 1), lambda i, j: default_rhs(i))
+        ops = _resized(st.session_state.get(f"{prefix}_ops"), (m, 1), lambda i, j: operators[0])
+        st.session_state[f"{prefix}_objective_table"] = pd.DataFrame(c, columns=columns, index=["c"])
+        st.session_state[f"{prefix}_constraint_table"] = pd.DataFrame(
+            A, columns=columns, index=[f"Constraint {i+1}" for i in range(m)]).assign(Operator=ops[:, 0], RHS=b[:, 0])
+    
+    numbers = {column: st.column_config.NumberColumn(column, required=True) for column in columns}
+    objective = st.data_editor(st.session_state[f"{prefix}_objective_table"], column_config=numbers,
+                               key=f"{prefix}_objective_editor")
+    st.markdown("**Constraint coefficients**")
+    table = st.data_editor(st.session_state[f"{prefix}_constraint_table"], key=f"{prefix}_constraint_editor",
+                           column_config={**numbers,
+                                          "Operator": st.column_config.SelectboxColumn(
+                                              options=list(operators), required=True, disabled=len(operators) == 1),
+                                          "RHS": st.column_config.NumberColumn(required=True)})
+    
+    st.session_state[f"{prefix}_c"] = objective[columns].to_numpy(dtype=float)
+    st.session_state[f"{prefix}_A"] = table[columns].to_numpy(dtype=float)
+    st.session_state[f"{prefix}_b"] = table[["RHS"]].to_numpy(dtype=float)
+    st.session_state[f"{prefix}_ops"] = table[["Operator"]].to_numpy(dtype=object)
+    return (st.session_state[f"{prefix}_c"][0], st.session_state[f"{prefix}_A"], st.session_state[f"{prefix}_b"][:, 0],
+            list(st.session_state[f"{prefix}_ops"][:, 0]))
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def graphical_plot_data(constraints, vertices):
+    """Plot window and the ends of every constraint line inside it, from the corner points."""
+    if len(vertices):
+        limit = 1.1 * max(1.0, float(vertices.max()))
+    else:
+        limit = 1.1 * max(1.0, max(abs(cons[3]) for cons in constraints))
+    segments = []
+    for a1, a2, op, rhs in constraints:
+        label = f"{a1:g}x₁ + {a2:g}x₂ {op} {rhs:g}"
+        if a2:
+            ends = [(0.0, rhs / a2), (limit, (rhs - a1 * limit) / a2)]
+        elif a1:
+            ends = [(rhs / a1, 0.0), (rhs / a1, limit)]
+        else:
+            continue
+        segments += [{"constraint": label, "x1": x1, "x2": x2} for x1, x2 in ends]
+    return limit, pd.DataFrame(segments, columns=["constraint", "x1", "x2"])
+
+
+def graphical_chart(c, constraints, vertices, solution, optimal_value):
+    """
+    Vega-Lite chart of a graphical solution, drawn in the browser: pan and zoom, and an
+    objective slider that moves the iso-line Z = c₁x₁ + c₂x₂, never rerun the script.
+    """
+    limit, segments = graphical_plot_data(constraints, vertices)
+    x = alt.X("x1:Q", title="x₁", scale=alt.Scale(domain=[0, limit]))
+    y = alt.Y("x2:Q", title="x₂", scale=alt.Scale(domain=[0, limit]))
+    layers = []
+    if len(vertices):
+        corners = pd.DataFrame({"x1": vertices[:, 0], "x2": vertices[:, 1], "Z": vertices @ np.asarray(c)})
+        region = pd.concat([corners, corners.iloc[:1]], ignore_index=True).reset_index()
+        layers.append(alt.Chart(region).mark_line(fill="#FFA28B", fillOpacity=0.4, stroke="#FFA28B")
+                      .encode(x, y, order="index:O"))
+    layers.append(alt.Chart(segments).mark_line(clip=True).encode(x, y, color=alt.Color("constraint:N", title=None)))
+    if len(vertices):
+        layers.append(alt.Chart(corners).mark_circle(size=70, color="#58A6FF")
+                      .encode(x, y, tooltip=[alt.Tooltip("x1:Q", format=".4g"), alt.Tooltip("x2:Q", format=".4g"),
+                                             alt.Tooltip("Z:Q", format=".4g")]))
+    if solution is not None:
+        layers.append(alt.Chart(pd.DataFrame({"x1": [solution[0]], "x2": [solution[1]]}))
+                      .mark_point(shape="diamond", size=200, filled=True, color="gold").encode(x, y))
+    chart = alt.layer(*layers)
+    if len(vertices) and any(c):
+        # The iso-line is two points computed from the slider value on the client
+        low, high = float(corners["Z"].min()), float(corners["Z"].max())
+        objective = alt.param(name="Z", value=min(max(optimal_value, low), high) if solution is not None else high,
+                              bind=alt.binding_range(min=low, max=high, step=(high - low) / 200 or 1, name="Z "))
+        if c[1]:
+            ends = {"x1": "datum.t", "x2": f"(Z - {c[0]} * datum.t) / {c[1]}"}
+        else:
+            ends = {"x1": f"Z / {c[0]}", "x2": "datum.t"}
+        iso_line = (alt.Chart(pd.DataFrame({"t": [0.0, limit]})).transform_calculate(**ends)
+                    .mark_line(strokeDash=[6, 4], color="purple", clip=True).encode(x, y))
+        chart = alt.layer(chart, iso_line).add_params(objective)
+    return chart.interactive().properties(height=450)
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def graphical_png(c, constraints, vertices, solution, optimal_value):
+    """The same plot rendered with matplotlib, as PNG bytes for download."""
+    from matplotlib.figure import Figure
+    
+    limit, segments = graphical_plot_data(constraints, vertices)
+    fig = Figure(figsize=(7, 5))
+    ax = fig.subplots()
+    if len(vertices):
+        ax.fill(vertices[:, 0], vertices[:, 1], color="#FFA28B", alpha=0.4, label="Feasible Region")
+        ax.scatter(vertices[:, 0], vertices[:, 1], color="#58A6FF", zorder=3, label="Corner Points")
+    for label, line in segments.groupby("constraint", sort=False):
+        ax.plot(line["x1"], line["x2"], label=label)
+    if solution is not None:
+        if c[1]:
+            x1 = np.array([0.0, limit])
+            ax.plot(x1, (optimal_value - c[0] * x1) / c[1], "--", color="purple", label=f"Z = {optimal_value:.4g}")
+        ax.scatter(*solution, marker="*", s=250, color="gold", zorder=4, label="Optimal")
+    ax.set_xlim(0, limit)
+    ax.set_ylim(0, limit)
+    ax.set_xlabel("x₁")
+    ax.set_ylabel("x₂")
+    ax.legend(loc="upper right", fontsize="small")
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=150, bbox_inches="tight")
+    return buffer.getvalue()
+
+
 # ----------------------------------------------------------------------------
 # Graphical Method Tab (2-variable problems only)
 # ----------------------------------------------------------------------------
-with tabs[0]:
+@st.fragment
+def graphical_tab():
     st.header("Graphical Method")
     st.markdown("#### Define Your Problem (2 variables only)")
     
-    col1, col2 = st.columns(2)
-    with col1:
-        obj_type = st.selectbox("Objective", ["Maximize", "Minimize"], key="graph_obj")
-    with col2:
-        st.write("Objective: Z = c₁x₁ + c₂x₂")
-    
-    c1 = st.number_input("Coefficient for x₁", value=3.0, key="graph_c1")
-    c2 = st.number_input("Coefficient for x₂", value=2.0, key="graph_c2")
-    
-    st.markdown("**Constraints**")
     num_constraints = st.number_input("Number of Constraints", min_value=1, value=2, step=1, key="graph_num_constr")
-    constraints = []
-    for i in range(int(num_constraints)):
-        col1, col2, col3, col4 = st.columns(4)
+    
+    # Nothing below reruns until the form is submitted
+    with st.form("graph_form", border=False):
+        col1, col2 = st.columns(2)
         with col1:
-            a = st.number_input(f"x₁ coeff in constraint {i+1}", value=2.0 if i == 0 else 1.0, key=f"graph_a{i}")
+            obj_type = st.selectbox("Objective", ["Maximize", "Minimize"], key="graph_obj")
         with col2:
-            b = st.number_input(f"x₂ coeff in constraint {i+1}", value=1.0 if i == 0 else 2.0, key=f"graph_b{i}")
-        with col3:
-            op = st.selectbox(f"Operator {i+1}", ["<=", ">="], key=f"graph_op{i}")
-        with col4:
-            rhs = st.number_input(f"RHS {i+1}", value=8.0 if i == 0 else 6.0, key=f"graph_rhs{i}")
-        # For visualization, we assume constraints are in a form suitable for plotting (typically ≤)
-        constraints.append([a, b, op, rhs])
+            st.write("Objective: Z = c₁x₁ + c₂x₂")
+        
+        c1 = st.number_input("Coefficient for x₁", value=3.0, key="graph_c1")
+        c2 = st.number_input("Coefficient for x₂", value=2.0, key="graph_c2")
+        
+        st.markdown("**Constraints**")
+        constraints = []
+        for i in range(int(num_constraints)):
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                a = st.number_input(f"x₁ coeff in constraint {i+1}", value=2.0 if i == 0 else 1.0, key=f"graph_a{i}")
+            with col2:
+                b = st.number_input(f"x₂ coeff in constraint {i+1}", value=1.0 if i == 0 else 2.0, key=f"graph_b{i}")
+            with col3:
+                op = st.selectbox(f"Operator {i+1}", ["<=", ">="], key=f"graph_op{i}")
+            with col4:
+                rhs = st.number_input(f"RHS {i+1}", value=8.0 if i == 0 else 6.0, key=f"graph_rhs{i}")
+            constraints.append([a, b, op, rhs])
+        
+        solve_graph = st.form_submit_button("Visualize Graphical Solution", key="graphical_solve")
     
-    if st.button("Visualize Graphical Solution", key="graphical_solve"):
+    if solve_graph:
         # Build parameters for the graphical method
         c = [c1, c2]
-        # For plotting, we take only the coefficients and RHS values.
         A = [[cons[0], cons[1]] for cons in constraints]
+        ops = [cons[2] for cons in constraints]
         b_vals = [cons[3] for cons in constraints]
+        minimize_graph = obj_type == "Minimize"
         
-        # The graphical_method function is assumed to return the solution
         try:
-            optimal_value, solution = graphical_method(c, A, b_vals)
-            
+            # Kept in the session so the chart survives reruns without another solve
+            st.session_state.graphical = (c, constraints, obj_type) + default_cache().call(
+                graphical_method, c, A, b_vals, ops, Min=minimize_graph, return_vertices=True)
+        except Exception as e:
+            st.session_state.pop("graphical", None)
+            st.error(f"Error solving problem: {str(e)}")
+            st.info("Make sure your problem has a feasible solution and is properly formulated.")
+    
+    if "graphical" in st.session_state:
+        graph_c, graph_constraints, graph_obj, optimal_value, solution, vertices = st.session_state.graphical
+        if isinstance(optimal_value, str):
+            st.error(optimal_value)
+        
+        # Feasible region, constraint lines and the objective iso-line, drawn in the browser
+        st.altair_chart(graphical_chart(graph_c, graph_constraints, vertices, solution, optimal_value),
+                        use_container_width=True)
+        st.download_button("Download plot (PNG)",
+                           graphical_png(graph_c, graph_constraints, vertices, solution, optimal_value),
+                           file_name="graphical_method.png", mime="image/png", key="graph_png")
+        
+        if solution is not None:
             # Display the optimization results
             display_solution("Graphical Method", 
                             optimal_value, 
                             solution, 
-                            obj_type, 
-                            coeffs=[c1, c2],
+                            graph_obj, 
+                            coeffs=graph_c,
                             additional_info="The graphical solution is shown in the plot above.")
-            
-            # Add explanation of the feasible region
-            st.markdown("#### Feasible Region")
-            st.info("""
-                The shaded area represents the feasible region defined by your constraints.
-                The optimal solution occurs at the corner point shown in the plot.
-                Each line represents one constraint equation.
-            """)
-            
-        except Exception as e:
-            st.error(f"Error solving problem: {str(e)}")
-            st.info("Make sure your problem has a feasible solution and is properly formulated.")
+        
+        # Add explanation of the feasible region
+        st.markdown("#### Feasible Region")
+        st.info("""
+            The shaded area represents the feasible region defined by your constraints.
+            The optimal solution occurs at the corner point shown in the plot.
+            Each line represents one constraint equation. Drag or scroll to pan and zoom,
+            and move the Z slider to sweep the objective line across the region.
+        """)
+    
+    show_cache_stats()
+
+
+with tabs[0]:
+    graphical_tab()
 
 # ----------------------------------------------------------------------------
 # Simplex Method Tab
 # ----------------------------------------------------------------------------
-with tabs[1]:
+@st.fragment
+def simplex_tab():
     st.header("Simplex Method")
     st.markdown("#### Define Your Problem")
     
-    col1, col2 = st.columns(2)
-    with col1:
-        obj_type_simplex = st.selectbox("Objective", ["Maximize", "Minimize"], key="simplex_obj")
-    with col2:
-        st.write("Objective: Z = c₁x₁ + c₂x₂ + ...")
-    
     num_vars_simplex = st.number_input("Number of Variables", min_value=1, value=2, step=1, key="simplex_num_vars")
-    coeffs_simplex = [
-        st.number_input(f"Coefficient for x{i+1}", value=3.0 if i == 0 else 2.0, key=f"simplex_c{i}")
-        for i in range(int(num_vars_simplex))
-    ]
-    
-    st.markdown("**Constraints**")
     num_constr_simplex = st.number_input("Number of Constraints", min_value=1, value=2, step=1, key="simplex_num_constr")
-    A_simplex = []
-    b_simplex = []
-    # For simplicity, assume all constraints are of type ≤.
-    for i in range(int(num_constr_simplex)):
-        constr_coeffs = [
-            st.number_input(f"x{j+1} coeff in constraint {i+1}", value=2.0 if (i == 0 and j == 0) else (1.0), key=f"simplex_a{i}{j}")
-            for j in range(int(num_vars_simplex))
-        ]
-        rhs = st.number_input(f"RHS for constraint {i+1}", value=8.0 if i == 0 else 6.0, key=f"simplex_rhs{i}")
-        A_simplex.append(constr_coeffs)
-        b_simplex.append(rhs)
-    
-    if st.button("Solve with Simplex Method", key="simplex_solve"):
+    
+    # Nothing below reruns until the form is submitted
+    with st.form("simplex_form", border=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            obj_type_simplex = st.selectbox("Objective", ["Maximize", "Minimize"], key="simplex_obj")
+        with col2:
+            st.write("Objective: Z = c₁x₁ + c₂x₂ + ...")
+        
+        st.markdown("**Objective coefficients**")
+        # The simplex method takes ≤ constraints only
+        coeffs_simplex, A_simplex, b_simplex, _ = coefficient_grid(
+            "simplex", num_vars_simplex, num_constr_simplex, default_c=lambda j: 3.0 if j == 0 else 2.0,
+            default_a=lambda i, j: 2.0 if (i == 0 and j == 0) else 1.0, default_rhs=lambda i: 8.0 if i == 0 else 6.0)
+        
+        solve_simplex = st.form_submit_button("Solve with Simplex Method", key="simplex_solve")
+    
+    if solve_simplex:
         try:
-            # Call the simplex_method with syntax: simplex_method(c, A, b)
-            optimal_value, solution = simplex_method(coeffs_simplex, A_simplex, b_simplex)
+            # Same problem solved before (by any session): reuse it. Otherwise the dual
+            # simplex repairs the last optimal basis after RHS tweaks or added constraints.
+            # Keeping the basis means solving without presolve, whose rows it would not match
+            (optimal_value, solution, basis), cache_hit = default_cache().fetch(
+                "simplex_method", (coeffs_simplex, A_simplex, b_simplex),
+                lambda: simplex_method(coeffs_simplex, A_simplex, b_simplex, return_basis=True,
+                                       warm_start=st.session_state.get('simplex_basis')))
+            if basis is not None:
+                st.session_state.simplex_basis = basis
+            if not cache_hit and basis is not None and basis.warm_started:
+                st.caption(f"♻️ Re-optimized from the previous basis in {basis.iterations} pivots")
             
             # Enhanced display of solution
             additional_info = """
@@ -490,49 +670,79 @@ with tabs[1]:
         except Exception as e:
             st.error(f"Error solving problem: {str(e)}")
             st.info("Make sure your problem has a feasible solution and is properly formulated.")
+    
+    show_cache_stats()
+
+
+with tabs[1]:
+    simplex_tab()
 
 # ----------------------------------------------------------------------------
 # Big M Method Tab
 # ----------------------------------------------------------------------------
-with tabs[2]:
+@st.fragment
+def big_m_tab():
     st.header("Big M Method")
     st.markdown("#### Define Your Problem")
     
-    col1, col2 = st.columns(2)
-    with col1:
-        obj_type_bigm = st.selectbox("Objective", ["Maximize", "Minimize"], key="bigm_obj")
-    with col2:
-        st.write("Objective: Z = c₁x₁ + c₂x₂ + ...")
-    
     num_vars_bigm = st.number_input("Number of Variables", min_value=1, value=2, step=1, key="bigm_num_vars")
-    coeffs_bigm = [
-        st.number_input(f"Coefficient for x{i+1}", value=2.0 if i == 0 else 3.0, key=f"bigm_c{i}")
-        for i in range(int(num_vars_bigm))
-    ]
-    
-    st.markdown("**Constraints**")
     num_constr_bigm = st.number_input("Number of Constraints", min_value=1, value=3, step=1, key="bigm_num_constr")
-    A_bigm = []
-    b_bigm = []
-    constraint_types = []
-    for i in range(int(num_constr_bigm)):
-        constr_coeffs = [
-            st.number_input(f"x{j+1} coeff in constraint {i+1}", value=1.0, key=f"bigm_a{i}{j}")
-            for j in range(int(num_vars_bigm))
-        ]
-        op = st.selectbox(f"Operator for constraint {i+1}", ["<=", ">=", "="], key=f"bigm_op{i}")
-        rhs = st.number_input(f"RHS for constraint {i+1}", 
-                                value=6.0 if i == 0 else (8.0 if i == 1 else 5.0), key=f"bigm_rhs{i}")
-        A_bigm.append(constr_coeffs)
-        b_bigm.append(rhs)
-        constraint_types.append(op)
-    
-    if st.button("Solve with Big M Method", key="bigm_solve"):
+    
+    # Nothing below reruns until the form is submitted
+    with st.form("bigm_form", border=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            obj_type_bigm = st.selectbox("Objective", ["Maximize", "Minimize"], key="bigm_obj")
+        with col2:
+            st.write("Objective: Z = c₁x₁ + c₂x₂ + ...")
+        
+        st.markdown("**Objective coefficients**")
+        coeffs_bigm, A_bigm, b_bigm, constraint_types = coefficient_grid(
+            "bigm", num_vars_bigm, num_constr_bigm, default_c=lambda j: 2.0 if j == 0 else 3.0,
+            default_a=lambda i, j: 1.0, default_rhs=lambda i: 6.0 if i == 0 else (8.0 if i == 1 else 5.0),
+            operators=("<=", ">=", "="))
+        
+        mode_bigm = st.selectbox("Method", ["Big M", "Two-phase"], key="bigm_mode",
+                                 help="Big M prices artificial variables at a large penalty in one pass; "
+                                      "two-phase first minimizes the artificials alone, then drops them")
+        compare_bigm = st.checkbox("Compare both methods", key="bigm_compare",
+                                   help="Solve the problem from scratch with each method and show their "
+                                        "iterations and runtime side by side")
+        
+        solve_bigm = st.form_submit_button("Solve with Big M Method", key="bigm_solve")
+    
+    if solve_bigm:
         try:
             # For maximization, we set Min=False as per the sample syntax.
-            optimal_value, solution = big_m_method(
-                coeffs_bigm, A_bigm, b_bigm, constraint_types, Min=False if obj_type_bigm == "Maximize" else True
-            )
+            minimize_bigm = False if obj_type_bigm == "Maximize" else True
+            method_bigm = {"Big M": big_m_method, "Two-phase": two_phase_method}[mode_bigm]
+            # As in the Simplex tab, the basis is kept for warm starts, so there is no presolve
+            (optimal_value, solution, basis), cache_hit = default_cache().fetch(
+                method_bigm.__name__, (coeffs_bigm, A_bigm, b_bigm, constraint_types, minimize_bigm),
+                lambda: method_bigm(coeffs_bigm, A_bigm, b_bigm, constraint_types, Min=minimize_bigm,
+                                    return_basis=True, warm_start=st.session_state.get('bigm_basis')))
+            if basis is not None:
+                st.session_state.bigm_basis = basis
+            if not cache_hit and basis is not None and basis.warm_started:
+                st.caption(f"♻️ Re-optimized from the previous basis in {basis.iterations} pivots")
+            
+            if compare_bigm:
+                # Cold solves without presolve, so the counts are the methods' own
+                comparison = []
+                for label, method in (("Big M", big_m_method), ("Two-phase", two_phase_method)):
+                    start = time.perf_counter()
+                    value, _, cold_basis = method(coeffs_bigm, A_bigm, b_bigm, constraint_types,
+                                                  Min=minimize_bigm, return_basis=True)
+                    elapsed = time.perf_counter() - start
+                    comparison.append({
+                        "Method": label,
+                        "Result": value if isinstance(value, str) else f"{value:.4f}",
+                        "Phase I Iterations": (None if cold_basis is None or method is big_m_method
+                                               else cold_basis.phase_one_iterations),
+                        "Total Iterations": None if cold_basis is None else cold_basis.iterations,
+                        "Runtime (ms)": elapsed * 1000})
+                st.markdown("#### ⚖️ Big M vs Two-Phase")
+                st.dataframe(comparison, hide_index=True, use_container_width=True)
             
             # Enhanced display of solution
             additional_info = """
@@ -540,7 +750,13 @@ with tabs[2]:
             constraints or "≥" constraints. It introduces artificial variables with very high penalties 
             to find a feasible solution.
             """
-            display_solution("Big M Method", 
+            if mode_bigm == "Two-phase":
+                additional_info = """
+            The Two-Phase Method handles the same "≥" and equality constraints without a penalty:
+            Phase I minimizes the artificial variables alone to reach a feasible corner point, and
+            Phase II drops them and optimizes the real objective from there.
+            """
+            display_solution("Big M Method" if mode_bigm == "Big M" else "Two-Phase Method", 
                             optimal_value, 
                             solution, 
                             obj_type_bigm, 
@@ -550,42 +766,89 @@ with tabs[2]:
         except Exception as e:
             st.error(f"Error solving problem: {str(e)}")
             st.info("Check if your problem has a feasible solution and is properly formulated.")
+    
+    show_cache_stats()
+
+
+with tabs[2]:
+    big_m_tab()
 
 # ----------------------------------------------------------------------------
 # Integer Simplex Method Tab
 # ----------------------------------------------------------------------------
-with tabs[3]:
+@st.fragment
+def integer_tab():
     st.header("Integer Simplex Method")
     st.markdown("#### Define Your Problem (with integer constraints)")
     
-    col1, col2 = st.columns(2)
-    with col1:
-        obj_type_int = st.selectbox("Objective", ["Maximize", "Minimize"], key="int_obj")
-    with col2:
-        st.write("Objective: Z = c₁x₁ + c₂x₂ + ... (x must be integers)")
-    
     num_vars_int = st.number_input("Number of Variables", min_value=1, value=2, step=1, key="int_num_vars")
-    coeffs_int = [
-        st.number_input(f"Coefficient for x{i+1}", value=3.0 if i == 0 else 2.0, key=f"int_c{i}")
-        for i in range(int(num_vars_int))
-    ]
-    
-    st.markdown("**Constraints**")
     num_constr_int = st.number_input("Number of Constraints", min_value=1, value=2, step=1, key="int_num_constr")
-    A_int = []
-    b_int = []
-    for i in range(int(num_constr_int)):
-        constr_coeffs = [
-            st.number_input(f"x{j+1} coeff in constraint {i+1}", value=1.0, key=f"int_a{i}{j}")
-            for j in range(int(num_vars_int))
-        ]
-        rhs = st.number_input(f"RHS for constraint {i+1}", value=8.0 if i == 0 else 6.0, key=f"int_rhs{i}")
-        A_int.append(constr_coeffs)
-        b_int.append(rhs)
-    
-    if st.button("Solve with Integer Simplex Method", key="int_solve"):
+    
+    # Nothing below reruns until the form is submitted
+    with st.form("int_form", border=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            obj_type_int = st.selectbox("Objective", ["Maximize", "Minimize"], key="int_obj")
+        with col2:
+            st.write("Objective: Z = c₁x₁ + c₂x₂ + ... (x must be integers)")
+        
+        st.markdown("**Objective coefficients**")
+        # Branch and bound takes ≤ constraints only
+        coeffs_int, A_int, b_int, _ = coefficient_grid(
+            "int", num_vars_int, num_constr_int, default_c=lambda j: 3.0 if j == 0 else 2.0,
+            default_a=lambda i, j: 1.0, default_rhs=lambda i: 8.0 if i == 0 else 6.0)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            branching_int = st.selectbox("Branching rule", ["pseudocost", "most_fractional"], key="int_branching",
+                                         help="Pseudo-costs learn how much rounding each variable costs; "
+                                              "most fractional branches on the value closest to .5")
+        with col2:
+            workers_int = st.number_input("Worker processes", min_value=1, max_value=os.cpu_count() or 1, value=1,
+                                          step=1, key="int_workers",
+                                          help="Node LPs are solved on this many processes (1 solves in-app)")
+        with col3:
+            cuts_label_int = st.selectbox("Gomory cuts", ["None", "Root", "Root and nodes"], key="int_cuts",
+                                          help="Tighten the LP relaxation with Gomory mixed-integer cuts before branching")
+            cuts_int = {"None": None, "Root": "root", "Root and nodes": "nodes"}[cuts_label_int]
+        
+        solve_int = st.form_submit_button("Solve with Integer Simplex Method", key="int_solve")
+    
+    if solve_int:
         try:
-            optimal_value, solution = integer_simplex(coeffs_int, A_int, b_int)
+            progress_int = st.empty()
+            
+            def show_progress(tree):
+                gap = "—" if tree.incumbent is None else f"{tree.gap:.2%}"
+                progress_int.caption(f"🌳 {tree.nodes} nodes solved · {tree.open_nodes} open · gap {gap}")
+            
+            # Every BranchAndBound option, so the cache key covers all of them
+            options_int = {"Min": False, "branching": branching_int, "max_workers": int(workers_int),
+                           "mip_gap": 0.0, "max_nodes": None, "cuts": cuts_int,
+                           "max_cut_rounds": CUT_ROUNDS, "presolve": True}
+            
+            def solve_int():
+                tree = BranchAndBound(coeffs_int, A_int, b_int, **options_int)
+                return (*tree.run(progress=show_progress), tree.stats())
+            
+            optimal_value, solution, tree_stats = default_cache().fetch(
+                "integer_simplex", (coeffs_int, A_int, b_int, options_int), solve_int)[0]
+            progress_int.empty()
+            
+            # Search tree of the branch-and-bound run
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Nodes Solved", tree_stats["nodes"], help=f"{tree_stats['pruned']} more pruned by bound")
+            col2.metric("Open Nodes", tree_stats["open_nodes"])
+            col3.metric("MIP Gap", "—" if tree_stats["incumbent"] is None else f"{tree_stats['gap']:.2%}")
+            if tree_stats["presolve"]:
+                st.caption("🧹 Presolve: " + tree_stats["presolve"])
+            if tree_stats["cut_rounds"]:
+                with st.expander(f"✂️ {len(tree_stats['cut_rounds'])} cut rounds moved the root bound "
+                                 f"from {tree_stats['root_bound']:.4f} to {tree_stats['cut_bound']:.4f}"):
+                    st.dataframe(
+                        [{"Round": r["round"], "Cuts Added": r["cuts"], "Cuts in LP": r["active"],
+                          "Bound": r["bound"], "Improvement": r["improvement"]} for r in tree_stats["cut_rounds"]],
+                        hide_index=True, use_container_width=True)
             
             # Check if solution values are (approximately) integers
             is_integer_solution = all(abs(x - round(x)) < 1e-6 for x in solution)
@@ -609,12 +872,89 @@ with tabs[3]:
             
             # Round solution for display
             rounded_solution = [round(x) for x in solution]
-            if rounded_solution != solution:
+            if not np.array_equal(rounded_solution, solution):
                 st.info(f"Rounded integer solution: {rounded_solution}")
                 
         except Exception as e:
             st.error(f"Error solving problem: {str(e)}")
             st.info("Integer programming problems may be infeasible or unbounded. Check your constraints.")
+    
+    show_cache_stats()
+
+
+with tabs[3]:
+    integer_tab()
+
+# ----------------------------------------------------------------------------
+# Interior Point Method Tab
+# ----------------------------------------------------------------------------
+@st.fragment
+def interior_point_tab():
+    st.header("Interior Point Method")
+    st.markdown("#### Define Your Problem")
+    
+    num_vars_ipm = st.number_input("Number of Variables", min_value=1, value=2, step=1, key="ipm_num_vars")
+    num_constr_ipm = st.number_input("Number of Constraints", min_value=1, value=2, step=1, key="ipm_num_constr")
+    
+    # Nothing below reruns until the form is submitted
+    with st.form("ipm_form", border=False):
+        col1, col2 = st.columns(2)
+        with col1:
+            obj_type_ipm = st.selectbox("Objective", ["Maximize", "Minimize"], key="ipm_obj")
+        with col2:
+            st.write("Objective: Z = c₁x₁ + c₂x₂ + ...")
+        
+        st.markdown("**Objective coefficients**")
+        coeffs_ipm, A_ipm, b_ipm, constraint_types_ipm = coefficient_grid(
+            "ipm", num_vars_ipm, num_constr_ipm, default_c=lambda j: 3.0 if j == 0 else 2.0,
+            default_a=lambda i, j: 2.0 if (i == 0 and j == 0) else 1.0, default_rhs=lambda i: 8.0 if i == 0 else 6.0,
+            operators=("<=", ">=", "="))
+        
+        crossover_ipm = st.checkbox("Crossover to a corner point", key="ipm_crossover",
+                                    help="The interior point stops in the middle of the optimal face; crossover "
+                                         "finishes with the simplex to return a basic solution")
+        
+        solve_ipm = st.form_submit_button("Solve with Interior Point Method", key="ipm_solve")
+    
+    if solve_ipm:
+        try:
+            minimize_ipm = obj_type_ipm == "Minimize"
+            optimal_value, solution, ipm_stats = default_cache().fetch(
+                "interior_point_method",
+                (coeffs_ipm, A_ipm, b_ipm, constraint_types_ipm, minimize_ipm, crossover_ipm),
+                lambda: interior_point_method(coeffs_ipm, A_ipm, b_ipm, constraint_types_ipm, Min=minimize_ipm,
+                                              crossover=crossover_ipm, return_stats=True))[0]
+            
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Iterations", ipm_stats["iterations"])
+            col2.metric("Crossover Pivots", "—" if ipm_stats["crossover_pivots"] is None
+                        else ipm_stats["crossover_pivots"])
+            col3.metric("Primal Residual", f"{ipm_stats['primal_residual']:.1e}",
+                        help=f"Dual residual {ipm_stats['dual_residual']:.1e} (both relative)")
+            
+            # Enhanced display of solution
+            additional_info = """
+            The Interior Point Method follows a path through the inside of the feasible region instead of
+            walking along its corner points. Each iteration solves one system of normal equations, and the
+            number of iterations barely grows with the problem size, which makes it the method of choice
+            for very large problems.
+            """
+            display_solution("Interior Point Method", 
+                            optimal_value, 
+                            solution, 
+                            obj_type_ipm, 
+                            coeffs=coeffs_ipm,
+                            additional_info=additional_info)
+            
+        except Exception as e:
+            st.error(f"Error solving problem: {str(e)}")
+            st.info("Check if your problem has a feasible solution and is properly formulated.")
+    
+    show_cache_stats()
+
+
+with tabs[4]:
+    interior_point_tab()
 
 st.markdown("---")
-st.write("Switch between the tabs above to explore each method.")
\ No newline at end of file
+st.write("Switch between the tabs above to explore each method.")
@@ -1,7 +1,19 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from OTTools import TransportationProblem
+import math
+import os
+import tempfile
+import weakref
+from solvers import TransportationProblem, default_cache
+from solvers.ingest import allocate, read_matrix, read_vector, table_shape
+
+# Rows and columns per page of an uploaded matrix preview
+PREVIEW_SIZE = 50
+# Uploaded cost matrices larger than this are kept in a memory-mapped temp file
+MEMMAP_BYTES = 256 << 20
+# Largest allocation the full result matrices are offered for
+FULL_MATRIX_CELLS = 1_000_000
 
 st.title("🚚 Transportation Problem Solver")
 st.markdown("""
@@ -314,6 +326,8 @@ with st.sidebar:
     """)
     st.markdown("---")
     st.caption("© 2025 OTTools Team")
+    # Refreshed by the fragments below, which rerun without the rest of the page
+    cache_counter = st.empty()
 
 with st.expander("📌 How to Use"):
     st.markdown("""
@@ -321,111 +335,317 @@ with st.expander("📌 How to Use"):
     2. Fill in the transportation costs, supply values, and demand values
     3. Select your preferred solution method
     4. Click "Solve" to see the optimal allocation and total cost
-    """)
 
-# Step 1: Matrix size inputs
-col1, col2 = st.columns(2)
-with col1:
-    m = st.number_input("Number of Sources", min_value=1, value=3, step=1)
-with col2:
-    n = st.number_input("Number of Destinations", min_value=1, value=4, step=1)
-
-# Initialize or update dataframe
-if 'transport_df' not in st.session_state or st.session_state.get('m') != m or st.session_state.get('n') != n:
-    # Create empty dataframe with proper dimensions
-    data = np.zeros((m + 1, n + 1))
-    columns = [f"D{i+1}" for i in range(n)] + ["Supply"]
-    index = [f"S{i+1}" for i in range(m)] + ["Demand"]
-    df = pd.DataFrame(data, columns=columns, index=index)
-    
-    st.session_state.transport_df = df
-    st.session_state.m = m
-    st.session_state.n = n
+    For large problems choose **Matrix file** and upload the cost matrix (CSV or Parquet)
+    with supply and demand files. For large networks where only some routes exist,
+    choose **Lane list** and upload the allowed lanes instead of filling in the full grid.
+    Assignment problems (square, every supply and demand equal to 1) solve fastest with **ASSIGNMENT**.
+    """)
 
-# Step 2: Editable dataframe
-st.subheader("Transportation Table")
-edited_df = st.data_editor(
-    st.session_state.transport_df,
-    use_container_width=True,
-    key="transport_editor"
-)
+def show_cache_stats():
+    """Solve cache counters in the sidebar, including this run's solve."""
+    cache_stats = default_cache().stats()
+    cache_counter.caption(f"🗄️ Solve cache: {cache_stats['hits']} hits · {cache_stats['misses']} misses")
 
-# Step 3: Method selection
-method = st.selectbox(
-    "Solution Method",
-    options=["NWCR", "LCM", "VAM", "MODI"],
-    index=0
-)
 
-# Step 4: Solve button
-if st.button("🚀 Solve"):
-    try:
-        # Extract data
-        cost_matrix = edited_df.iloc[:m, :n].astype(float).to_numpy()
-        supply = edited_df.iloc[:m, n].astype(float).to_numpy()
-        demand = edited_df.iloc[m, :n].astype(float).to_numpy()
-        
-        # Validate inputs
-        if np.any(cost_matrix < 0) or np.any(supply < 0) or np.any(demand < 0):
-            st.error("❌ All values must be non-negative")
-            st.stop()
-            
-        total_supply = np.sum(supply)
-        total_demand = np.sum(demand)
-        
-        if not np.isclose(total_supply, total_demand):
-            st.warning(f"⚠️ Total Supply ({total_supply:.1f}) ≠ Total Demand ({total_demand:.1f}). The problem is unbalanced.")
+# Step 5: Results of the last solve; paging through routes reruns only this part
+@st.fragment
+def transportation_results():
+    result = st.session_state.get('transport_result')
+    if result is not None:
+        solution, m, n = result["solution"], result["m"], result["n"]
+        if result["note"]:
+            st.caption(result["note"])
+    
+        # Display solution - basic cells only; a dummy source/destination added
+        # by balancing sits past the last real index
+        st.subheader("Solution")
+        rows_total, cols_total = solution.shape
+    
+        # 1. Total Cost
+        st.success(f"### Total Transportation Cost: {solution.total_cost:.2f}")
+    
+        if solution.penalty_cost > 0:
+            st.caption(f"Includes {solution.penalty_cost:.2f} in penalties for unused supply and unmet demand")
+    
+        # 2. Route Details, most expensive first, one page at a time; dummy routes
+        # are listed separately below
+        st.subheader("Transportation Routes")
+        route_costs = solution.quantities * solution.costs
+        order = np.argsort(-route_costs, kind="stable")
+        order = order[~solution.dummy[order]]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            top_k = st.number_input("Top routes by total cost (0 = all)", min_value=0, value=0, step=10,
+                                    key="route_top_k")
+        if top_k:
+            order = order[:top_k]
+        with col2:
+            page_size = st.selectbox("Routes per page", [25, 50, 100, 500], index=1, key="route_page_size")
+        with col3:
+            route_page = st.number_input("Page", min_value=1, value=1, step=1, key="route_page",
+                                         max_value=max(1, math.ceil(len(order) / page_size)))
+        shown = order[(route_page - 1) * page_size:route_page * page_size]
+        rows, cols = solution.rows[shown], solution.cols[shown]
+        st.dataframe(pd.DataFrame({
+            "From": np.where(rows < m, np.char.add("Source ", (rows + 1).astype(str)), "Dummy"),
+            "To": np.where(cols < n, np.char.add("Dest ", (cols + 1).astype(str)), "Dummy"),
+            "Units": solution.quantities[shown],
+            "Unit Cost": solution.costs[shown],
+            "Total Cost": route_costs[shown]
+        }), use_container_width=True, hide_index=True)
+        st.caption(f"{len(order)} of {len(solution) - int(solution.dummy.sum())} routes")
+    
+        # Unused supply and unmet demand, i.e. the routes through the dummy line
+        unused, unmet = solution.unused_supply, solution.unmet_demand
+        if unused.any() or unmet.any():
+            st.subheader("Unused Supply / Unmet Demand")
+            sources, dests = np.flatnonzero(unused), np.flatnonzero(unmet)
+            dummy_routes = solution.dummy
+            penalties = np.bincount(np.where(solution.cols[dummy_routes] >= n, solution.rows[dummy_routes],
+                                             m + solution.cols[dummy_routes]),
+                                    route_costs[dummy_routes], minlength=m + n)
+            st.dataframe(pd.DataFrame({
+                "Location": [f"Source {i+1}" for i in sources] + [f"Dest {j+1}" for j in dests],
+                "Kind": ["Unused supply"] * len(sources) + ["Unmet demand"] * len(dests),
+                "Units": np.concatenate([unused[sources], unmet[dests]]),
+                "Penalty": np.concatenate([penalties[sources], penalties[m + dests]])
+            }), use_container_width=True, hide_index=True)
+    
+        # 3. Full matrices, on request only
+        too_large = rows_total * cols_total > FULL_MATRIX_CELLS
+        if st.checkbox("Show allocation and cost breakdown matrices", key="show_matrices", disabled=too_large,
+                       help="Only available up to 1,000,000 cells" if too_large else None):
+            source_names = [f"Source {i+1}" for i in range(m)] + ["Dummy"] * (rows_total - m)
+            dest_names = [f"Dest {j+1}" for j in range(n)] + ["Dummy"] * (cols_total - n)
         
-        # Solve the problem
-        tp = TransportationProblem(cost_matrix, supply, demand)
-        solution = tp.solve(method)
+            st.write("📦 **Allocation Matrix** (Units to transport)")
+            allocation_df = pd.DataFrame(solution.to_dense(), index=source_names, columns=dest_names)
+            st.dataframe(allocation_df, use_container_width=True)
         
-        if solution is None:
-            st.error("❌ No solution found. Please check your inputs.")
-            st.stop()
+            st.write("💰 **Cost Breakdown**")
+            cost_breakdown = np.zeros(solution.shape)
+            cost_breakdown[solution.rows, solution.cols] = route_costs
+            cost_breakdown_df = pd.DataFrame(cost_breakdown, index=source_names, columns=dest_names)
+            st.dataframe(cost_breakdown_df, use_container_width=True)
+
+
+# Steps 1-4 and the results: widgets here rerun this fragment, not the whole page
+@st.fragment
+def transportation_solver():
+    input_mode = st.radio("Input Format", ["Grid", "Matrix file", "Lane list"], horizontal=True)
+
+    if input_mode == "Grid":
+        # Step 1: Matrix size inputs
+        col1, col2 = st.columns(2)
+        with col1:
+            m = st.number_input("Number of Sources", min_value=1, value=3, step=1)
+        with col2:
+            n = st.number_input("Number of Destinations", min_value=1, value=4, step=1)
+
+        # Initialize or update dataframe
+        if 'transport_df' not in st.session_state or st.session_state.get('m') != m or st.session_state.get('n') != n:
+            # Create empty dataframe with proper dimensions
+            data = np.zeros((m + 1, n + 1))
+            columns = [f"D{i+1}" for i in range(n)] + ["Supply"]
+            index = [f"S{i+1}" for i in range(m)] + ["Demand"]
+            df = pd.DataFrame(data, columns=columns, index=index)
         
-        # Display solution - assuming solution is an allocation matrix
-        st.subheader("Solution")
+            st.session_state.transport_df = df
+            st.session_state.m = m
+            st.session_state.n = n
+            st.session_state.pop('transport_solution', None)
+            st.session_state.pop('transport_result', None)
+    elif input_mode == "Matrix file":
+        # Step 1-2: The cost matrix streams from the file into one float array in
+        # batches; the browser only ever receives one preview page of it
+        st.subheader("Matrix File")
+        st.caption("Cost matrix with one row per source and one column per destination. "
+                   "Supply and demand files hold one value per row.")
+        header = st.checkbox("CSV files start with a header row", value=False)
+        cost_file = st.file_uploader("Cost Matrix", type=["csv", "parquet"], key="cost_file")
+        col1, col2 = st.columns(2)
+        with col1:
+            supply_file = st.file_uploader("Supply", type=["csv", "parquet"], key="matrix_supply_file")
+        with col2:
+            demand_file = st.file_uploader("Demand", type=["csv", "parquet"], key="matrix_demand_file")
+
+        cost_upload = None
+        if cost_file is not None:
+            path = None
+            try:
+                # Parse once per upload rather than on every rerun
+                if st.session_state.get('cost_upload_key') != (cost_file.file_id, header):
+                    st.session_state.pop('cost_upload', None)
+                    cleanup = st.session_state.pop('cost_upload_cleanup', None)
+                    if cleanup is not None:
+                        cleanup()
+                    shape = table_shape(cost_file, header=header)
+                    if shape[0] * shape[1] * 8 > MEMMAP_BYTES:
+                        handle, path = tempfile.mkstemp(prefix="ottools-cost-", suffix=".f8")
+                        os.close(handle)
+                    matrix = read_matrix(cost_file, header=header, out=allocate(shape, path))
+                    if path is not None:
+                        # The file goes with the session's array: on the next upload, once the
+                        # ended session is collected, or at interpreter exit
+                        st.session_state.cost_upload_cleanup = weakref.finalize(matrix, os.remove, path)
+                    st.session_state.cost_upload = matrix
+                    st.session_state.cost_upload_key = (cost_file.file_id, header)
+                cost_upload = st.session_state.cost_upload
+            except Exception as e:
+                st.session_state.pop('cost_upload_key', None)
+                if path is not None and os.path.exists(path):
+                    os.remove(path)
+                st.error(f"❌ Could not read the cost matrix: {str(e)}")
+
+        if cost_upload is not None:
+            rows_total, cols_total = cost_upload.shape
+            st.write(f"Loaded **{rows_total} sources × {cols_total} destinations**")
+            col1, col2 = st.columns(2)
+            with col1:
+                row_page = st.number_input("Source page", min_value=1, value=1, step=1,
+                                           max_value=math.ceil(rows_total / PREVIEW_SIZE))
+            with col2:
+                col_page = st.number_input("Destination page", min_value=1, value=1, step=1,
+                                           max_value=math.ceil(cols_total / PREVIEW_SIZE))
+            r0, c0 = (row_page - 1) * PREVIEW_SIZE, (col_page - 1) * PREVIEW_SIZE
+            preview = cost_upload[r0:r0 + PREVIEW_SIZE, c0:c0 + PREVIEW_SIZE]
+            st.dataframe(pd.DataFrame(
+                preview,
+                index=[f"S{i+1}" for i in range(r0, r0 + preview.shape[0])],
+                columns=[f"D{j+1}" for j in range(c0, c0 + preview.shape[1])]
+            ), use_container_width=True)
+    else:
+        # Step 1-2: Allowed lanes only, so nothing scales with sources × destinations
+        st.subheader("Lane List")
+        st.caption("Lanes CSV with columns `source`, `destination`, `cost` (sources and destinations "
+                   "numbered from 1). Supply and demand CSVs hold one value per row. "
+                   "Routes missing from the lane list are not allowed.")
+        lanes_file = st.file_uploader("Allowed Lanes", type="csv", key="lanes_file")
+        col1, col2 = st.columns(2)
+        with col1:
+            supply_file = st.file_uploader("Supply", type="csv", key="supply_file")
+        with col2:
+            demand_file = st.file_uploader("Demand", type="csv", key="demand_file")
+    
+    # Table edits, penalties and the method are only sent when the form is submitted
+    with st.form("transport_form", border=False):
+        if input_mode == "Grid":
+            # Step 2: Editable dataframe
+            st.subheader("Transportation Table")
+            edited_df = st.data_editor(
+                st.session_state.transport_df,
+                use_container_width=True,
+                key="transport_editor"
+            )
         
-        # 1. Allocation Matrix
-        st.write("📦 **Allocation Matrix** (Units to transport)")
-        allocation_df = pd.DataFrame(
-            solution, 
-            index=[f"Source {i+1}" for i in range(m)], 
-            columns=[f"Dest {i+1}" for i in range(n)]
+        # Penalties for unbalanced problems: the dummy source/destination's per-lane costs
+        with st.expander("⚖️ Unbalanced problems"):
+            col1, col2 = st.columns(2)
+            with col1:
+                shortage_cost = st.number_input("Penalty per unit of unmet demand", min_value=0.0, value=0.0,
+                                                key="shortage_cost")
+            with col2:
+                surplus_cost = st.number_input("Penalty per unit of unused supply", min_value=0.0, value=0.0,
+                                               key="surplus_cost")
+
+        # Step 3: Method selection
+        method = st.selectbox(
+            "Solution Method",
+            options=["NWCR", "LCM", "VAM", "MODI", "ASSIGNMENT"],
+            index=0,
+            help="ASSIGNMENT solves square problems whose supplies and demands are all equal "
+                 "(e.g. all 1) optimally; MODI switches to it on such problems by itself."
         )
-        st.dataframe(allocation_df, use_container_width=True)
+
+        # Step 4: Solve button
+        solve = st.form_submit_button("🚀 Solve")
+    
+    if solve:
+        try:
+            st.session_state.pop('transport_result', None)
+            if input_mode == "Grid":
+                # Extract data
+                cost_matrix = edited_df.iloc[:m, :n].astype(float).to_numpy()
+                supply = edited_df.iloc[:m, n].astype(float).to_numpy()
+                demand = edited_df.iloc[m, :n].astype(float).to_numpy()
+                costs = cost_matrix
+            elif input_mode == "Matrix file":
+                if cost_upload is None or supply_file is None or demand_file is None:
+                    st.error("❌ Upload the cost matrix, supply and demand files")
+                    st.stop()
+                cost_matrix = cost_upload
+                supply = read_vector(supply_file, header=header)
+                demand = read_vector(demand_file, header=header)
+                m, n = len(supply), len(demand)
+                if cost_matrix.shape != (m, n):
+                    st.error(f"❌ The cost matrix is {cost_matrix.shape[0]}×{cost_matrix.shape[1]} but there are "
+                             f"{m} supply and {n} demand values")
+                    st.stop()
+                if np.isnan(cost_matrix).any() or np.isnan(supply).any() or np.isnan(demand).any():
+                    st.error("❌ The uploaded files have empty cells")
+                    st.stop()
+                costs = cost_matrix
+            else:
+                if lanes_file is None or supply_file is None or demand_file is None:
+                    st.error("❌ Upload the lane list, supply and demand files")
+                    st.stop()
+                lanes = pd.read_csv(lanes_file)
+                supply = pd.read_csv(supply_file).iloc[:, 0].astype(float).to_numpy()
+                demand = pd.read_csv(demand_file).iloc[:, 0].astype(float).to_numpy()
+                m, n = len(supply), len(demand)
+                lane_rows = lanes["source"].to_numpy(dtype=int) - 1
+                lane_cols = lanes["destination"].to_numpy(dtype=int) - 1
+                costs = lanes["cost"].astype(float).to_numpy()
+                if np.any((lane_rows < 0) | (lane_rows >= m) | (lane_cols < 0) | (lane_cols >= n)):
+                    st.error("❌ Lane sources and destinations must be numbered within the supply and demand lists")
+                    st.stop()
         
-        # 2. Cost Breakdown Matrix
-        st.write("💰 **Cost Breakdown**")
-        cost_breakdown = solution * cost_matrix
-        cost_breakdown_df = pd.DataFrame(
-            cost_breakdown,
-            index=[f"Source {i+1}" for i in range(m)], 
-            columns=[f"Dest {i+1}" for i in range(n)]
-        )
-        st.dataframe(cost_breakdown_df, use_container_width=True)
+            # Validate inputs
+            if np.any(costs < 0) or np.any(supply < 0) or np.any(demand < 0):
+                st.error("❌ All values must be non-negative")
+                st.stop()
+            
+            total_supply = np.sum(supply)
+            total_demand = np.sum(demand)
         
-        # 3. Total Cost
-        total_cost = np.sum(cost_breakdown)
-        st.success(f"### Total Transportation Cost: {total_cost:.2f}")
+            if not np.isclose(total_supply, total_demand):
+                st.warning(f"⚠️ Total Supply ({total_supply:.1f}) ≠ Total Demand ({total_demand:.1f}). A dummy {'destination' if total_supply > total_demand else 'source'} balances the problem.")
         
-        # 4. Route Details
-        st.subheader("Transportation Routes")
-        routes = []
-        for i in range(m):
-            for j in range(n):
-                if solution[i, j] > 0:
-                    routes.append({
-                        "From": f"Source {i+1}",
-                        "To": f"Dest {j+1}",
-                        "Units": solution[i, j],
-                        "Unit Cost": cost_matrix[i, j],
-                        "Total Cost": cost_breakdown[i, j]
-                    })
+            # Solve the problem
+            if input_mode == "Lane list":
+                tp = TransportationProblem.from_lanes(lane_rows, lane_cols, costs, supply, demand,
+                                                     surplus_cost=surplus_cost, shortage_cost=shortage_cost)
+            else:
+                tp = TransportationProblem(cost_matrix, supply, demand,
+                                           surplus_cost=surplus_cost, shortage_cost=shortage_cost)
+            # Same scenario solved before (by any session): reuse it. Otherwise MODI
+            # re-optimizes from the last optimal basis and duals after small edits
+            solution, cache_hit = default_cache().fetch(
+                "TransportationProblem.solve", (tp.cost_matrix, tp.supply, tp.demand, tp.surplus_cost,
+                                                  tp.shortage_cost, method),
+                lambda: tp.solve(method, compact=True, warm_start=st.session_state.get('transport_solution')))
+        
+            if solution is None:
+                st.error("❌ No solution found. Please check your inputs.")
+                st.stop()
+            if method == "MODI":
+                st.session_state.transport_solution = solution
+            if cache_hit:
+                note = "⚡ Served from the solve cache"
+            elif solution.warm_started:
+                note = f"♻️ Re-optimized from the previous basis in {solution.iterations} pivots"
+            else:
+                note = None
         
-        if routes:
-            st.table(pd.DataFrame(routes))
+            # Kept across reruns so paging through routes does not need a re-solve
+            st.session_state.transport_result = {"solution": solution, "m": m, "n": n, "note": note}
             
-    except Exception as e:
-        st.error(f"❌ Error: {str(e)}")
\ No newline at end of file
+        except Exception as e:
+            st.error(f"❌ Error: {str(e)}")
+    
+    transportation_results()
+    show_cache_stats()
+
+
+transportation_solver()
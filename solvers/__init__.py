@@ -0,0 +1,9 @@
+from .transportation import TransportationProblem, TransportationSolution
+from .batch import solve_batch
+from .cache import SolveCache, default_cache
+from .linear_programming import (BranchAndBound, SimplexBasis, simplex_method, big_m_method, two_phase_method,
+                                 integer_simplex)
+from .presolve import Presolved, presolve
+from .interior_point import interior_point_method
+from .graphical import graphical_method
+from .model_files import LinearModel, read_lp, read_model, read_mps, solve_model_files
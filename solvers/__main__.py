@@ -0,0 +1,56 @@
+"""
+Solves every MPS and CPLEX LP file in a directory in parallel, without Streamlit.
+
+Each model is read and solved in a worker process, and its result is written to
+<out>/<path below MODELS_DIR>.json; one summary line per model is printed as it
+finishes. A mixed-integer model is solved as an LP unless --method says otherwise;
+its result counts the relaxed integer variables.
+The exit status is 1 if any model could not be read or solved.
+
+Usage: python -m solvers MODELS_DIR [-o OUT_DIR] [--method METHOD] [--workers N] [--recursive]
+"""
+import argparse
+import os
+import sys
+
+from .model_files import METHODS, MODEL_SUFFIXES, solve_model_files
+
+
+def model_paths(directory, recursive=False):
+    """Model files in directory (and its subdirectories with recursive), sorted by name."""
+    if recursive:
+        found = (os.path.join(root, name) for root, _, names in os.walk(directory) for name in names)
+    else:
+        found = (entry.path for entry in os.scandir(directory) if entry.is_file())
+    return sorted(path for path in found if path.lower().endswith(MODEL_SUFFIXES))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m solvers", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("models", help="directory of .mps, .lp, .mps.gz or .lp.gz files")
+    parser.add_argument("-o", "--out", help="directory for the .json results (default: MODELS/results)")
+    parser.add_argument("--method", choices=list(METHODS),
+                        help="solver for every model (default: integer when every variable is integer, "
+                             "simplex when every row is <=, else two_phase)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--recursive", action="store_true", help="also read subdirectories")
+    args = parser.parse_args(argv)
+
+    paths = model_paths(args.models, args.recursive)
+    if not paths:
+        parser.error(f"no model files in {args.models}")
+    out = args.out or os.path.join(args.models, "results")
+    failed = 0
+    for result in solve_model_files(paths, out, args.method, args.workers, root=args.models):
+        failed += result["status"] == 'error'
+        detail = result.get("error") or (f"{result['objective']:.10g}" if result["objective"] is not None else "")
+        if result.get("relaxed_integers"):
+            detail += f" ({result['relaxed_integers']} integer variables relaxed)"
+        print(f"{result['model']:<30} {result['method'] or '-':<15} {result['status']:<11} "
+              f"{result['seconds']:>8.2f}s  {detail}")
+    print(f"{len(paths)} models, {failed} failed; results in {out}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+from scipy import sparse
+
+from .transportation import TransportationProblem
+
+# Dense cost matrices at least this large go to workers through shared memory
+SHARED_MEMORY_BYTES = 1 << 20
+
+
+def _solve_one(cost, supply, demand, method):
+    """Worker: solves one instance; cost is an array or a shared memory (name, shape, dtype)."""
+    block = None
+    if isinstance(cost, tuple):
+        name, shape, dtype = cost
+        block = shared_memory.SharedMemory(name=name)
+        cost = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    try:
+        return TransportationProblem(cost, supply, demand).solve(method, compact=True)
+    finally:
+        if block is not None:
+            del cost
+            block.close()
+
+
+def _share(cost):
+    cost = np.ascontiguousarray(cost, dtype=float)
+    block = shared_memory.SharedMemory(create=True, size=cost.nbytes)
+    np.ndarray(cost.shape, dtype=cost.dtype, buffer=block.buf)[...] = cost
+    return block, (block.name, cost.shape, cost.dtype.str)
+
+
+def solve_batch(instances, max_workers=None, ordered=False, return_exceptions=False,
+                executor=None, shared_memory_bytes=SHARED_MEMORY_BYTES):
+    """
+    Solves many transportation problems across a process pool, yielding each result as it is ready.
+
+    At most two instances per worker are in flight at once, so the input iterable is
+    consumed lazily and only those instances hold shared memory.
+
+    Parameters:
+    instances : iterable - (cost_matrix, supply, demand, method) tuples
+    max_workers : int - Worker processes when no executor is given (default: CPU count)
+    ordered : bool - Yield results in input order instead of completion order
+    return_exceptions : bool - Yield a failed instance's exception instead of raising it
+    executor : ProcessPoolExecutor - Existing pool to use; it is left running
+    shared_memory_bytes : int - Dense cost matrices at least this large are shared, not pickled
+
+    Returns:
+    Generator of (index, TransportationSolution or exception) pairs
+    """
+    # Workers must share the parent's resource tracker, or each one starts its own
+    # and reports the shared blocks it attached to as leaked
+    resource_tracker.ensure_running()
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    window = 2 * (max_workers or getattr(executor, "_max_workers", None) or os.cpu_count())
+    instances = enumerate(instances)
+    pending = {}
+    blocks = {}
+    finished = {}
+    next_index = 0
+    exhausted = False
+    try:
+        while True:
+            # --- Keep the pool busy without reading the whole input ---
+            while not exhausted and len(pending) < window:
+                try:
+                    index, (cost, supply, demand, method) = next(instances)
+                except StopIteration:
+                    exhausted = True
+                    break
+                if not sparse.issparse(cost):
+                    cost = np.asarray(cost)
+                    if cost.nbytes >= shared_memory_bytes:
+                        blocks[index], cost = _share(cost)
+                future = executor.submit(_solve_one, cost, supply, demand, method)
+                pending[future] = index
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                block = blocks.pop(index, None)
+                if block is not None:
+                    block.close()
+                    block.unlink()
+                try:
+                    result = future.result()
+                except Exception as error:
+                    if not return_exceptions:
+                        raise
+                    result = error
+                if not ordered:
+                    yield index, result
+                else:
+                    finished[index] = result
+            while next_index in finished:
+                yield next_index, finished.pop(next_index)
+                next_index += 1
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+        for block in blocks.values():
+            block.close()
+            block.unlink()
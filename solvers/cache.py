@@ -0,0 +1,196 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from scipy import sparse
+
+# Environment variable naming the SQLite file of the shared on-disk tier. Results
+# are unpickled from it, so it must only be writable by users trusted to run code
+CACHE_PATH_ENV = "OTTOOLS_SOLVE_CACHE"
+
+
+def _feed(digest, value):
+    """Hashes a solver input: arrays by dtype, shape and bytes, so [1, 2] and np.array([1., 2.]) agree."""
+    if value is None or isinstance(value, (bool, str)):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, (int, float, np.number)):
+        digest.update(f"num:{float(value)!r};".encode())
+    elif sparse.issparse(value):
+        csr = sparse.csr_matrix(value, dtype=float)
+        csr.sum_duplicates()
+        digest.update(f"sparse:{csr.shape};".encode())
+        for part in (csr.data, csr.indices, csr.indptr):
+            digest.update(np.ascontiguousarray(part).tobytes())
+    elif isinstance(value, dict):
+        digest.update(b"dict:")
+        for key in sorted(value):
+            _feed(digest, key)
+            _feed(digest, value[key])
+    elif isinstance(value, (list, tuple, np.ndarray)):
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            array = None
+        if array is None or array.dtype == object:
+            digest.update(f"seq:{len(value)};".encode())
+            for item in value:
+                _feed(digest, item)
+        else:
+            if array.dtype.kind in "biuf":
+                array = array.astype(float)
+            digest.update(f"array:{array.dtype.str}:{array.shape};".encode())
+            digest.update(np.ascontiguousarray(array).tobytes())
+    else:
+        digest.update(f"{type(value).__qualname__}:{value!r};".encode())
+
+
+class SolveCache:
+    """
+    Content-addressed cache of solver results.
+
+    Results are keyed by a hash of the solver name, its input arrays and options, and
+    kept pickled in an in-memory LRU capped at max_bytes. With a path, results also go
+    to a SQLite file shared by every session and process using it, trimmed back to
+    max_disk_bytes by least recent use.
+
+    Results read back from the SQLite file are unpickled, which runs whatever code a
+    crafted entry contains: only point path at a file that no untrusted user can write.
+
+    Parameters:
+    max_bytes : int - Size cap of the in-memory tier
+    path : str - SQLite file for the on-disk tier (None for memory only)
+    max_disk_bytes : int - Size cap of the on-disk tier
+    """
+
+    def __init__(self, max_bytes=64 << 20, path=None, max_disk_bytes=512 << 20):
+        self.max_bytes = max_bytes
+        self.path = path
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        if path is not None:
+            with self._connect() as db:
+                db.execute("CREATE TABLE IF NOT EXISTS results "
+                           "(key TEXT PRIMARY KEY, value BLOB, size INTEGER, used REAL)")
+
+    @staticmethod
+    def key(name, inputs):
+        """Hex digest of a solver name and its inputs."""
+        digest = hashlib.sha256(name.encode() + b"|")
+        _feed(digest, inputs)
+        return digest.hexdigest()
+
+    def fetch(self, name, inputs, compute):
+        """
+        Cached result of compute() for these inputs, computing and storing it on a miss.
+
+        Parameters:
+        name : str - Solver name, part of the key
+        inputs : object - Everything the result depends on (arrays, method, options)
+        compute : callable - Produces the result; exceptions propagate and are not cached
+
+        Returns:
+        (result, hit) - hit is True when the result came from the cache
+        """
+        key = self.key(name, inputs)
+        blob = self._get(key)
+        if blob is not None:
+            with self._lock:
+                self.hits += 1
+            return pickle.loads(blob), True
+        with self._lock:
+            self.misses += 1
+        result = compute()
+        self._put(key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        return result, False
+
+    def call(self, func, *args, **kwargs):
+        """func(*args, **kwargs) through the cache, keyed by the function's name and arguments."""
+        name = f"{func.__module__}.{func.__qualname__}"
+        return self.fetch(name, (args, kwargs), lambda: func(*args, **kwargs))[0]
+
+    def stats(self):
+        """Hit and miss counts plus the size of the in-memory tier."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "entries": len(self._entries), "bytes": self._size}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if self.path is not None:
+            with self._connect() as db:
+                db.execute("DELETE FROM results")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _get(self, key):
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                return blob
+        if self.path is None:
+            return None
+        with self._connect() as db:
+            row = db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+        self._remember(key, row[0])
+        return row[0]
+
+    def _put(self, key, blob):
+        self._remember(key, blob)
+        if self.path is None or len(blob) > self.max_disk_bytes:
+            return
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                       (key, blob, len(blob), time.time()))
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            # --- Evict least recently used rows until the file is back under its cap ---
+            for stale, size in db.execute("SELECT key, size FROM results ORDER BY used").fetchall():
+                if total <= self.max_disk_bytes:
+                    break
+                db.execute("DELETE FROM results WHERE key = ?", (stale,))
+                total -= size
+
+    def _remember(self, key, blob):
+        if len(blob) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._size -= len(self._entries.pop(key))
+            self._entries[key] = blob
+            self._size += len(blob)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def default_cache():
+    """
+    Process-wide cache shared by every page and session.
+
+    The on-disk tier is enabled by pointing the OTTOOLS_SOLVE_CACHE environment
+    variable at a SQLite file, which must be trusted (see SolveCache).
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = SolveCache(path=os.environ.get(CACHE_PATH_ENV))
+        return _default_cache
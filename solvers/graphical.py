@@ -0,0 +1,258 @@
+import numpy as np
+
+from .linear_programming import _result
+
+# Absolute tolerance (on unit-normal rows) for a point to count as inside a half-plane
+GRAPHICAL_TOLERANCE = 1e-9
+# Size of the box that closes an unbounded region, relative to the farthest constraint line
+BOX_SCALE = 1e6
+# Margin of the plotting window around the vertices of an unbounded region
+VIEW_MARGIN = 1.25
+
+
+def _half_planes(A, b, constraint_types):
+    """
+    Rows of A x (types) b as unit-normal rows: '<=' and '>=' rows as half-planes
+    n·x <= d ('>=' rows negated), '=' rows as lines n·x = d.
+
+    Returns:
+    (normals, offsets, line_normals, line_offsets), or None if a zero row can never hold
+    """
+    types = np.asarray(constraint_types)
+    signs = np.where(types == '>=', -1.0, 1.0)
+    normals = A * signs[:, None]
+    offsets = b * signs
+    norms = np.hypot(normals[:, 0], normals[:, 1])
+    empty = norms == 0
+    equal = types == '='
+    if np.any(offsets[empty & ~equal] < -GRAPHICAL_TOLERANCE) or np.any(
+            np.abs(offsets[empty & equal]) > GRAPHICAL_TOLERANCE):
+        return None
+    normals, offsets = normals[~empty] / norms[~empty, None], offsets[~empty] / norms[~empty]
+    equal = equal[~empty]
+    return normals[~equal], offsets[~equal], normals[equal], offsets[equal]
+
+
+def _recession(normals):
+    """
+    Directions along which the region n·x <= d, x >= 0 runs off to infinity.
+
+    In the first quadrant they form one arc of angles: each half-plane keeps the
+    directions d with n·d <= 0, which is [0, r] or [r, π/2] for a normal of mixed
+    signs, all of [0, π/2] for a normal with no positive part, and nothing otherwise.
+
+    Returns:
+    2×2 array of the unit directions at the ends of the arc, or None if the region is bounded
+    """
+    nx, ny = normals[:, 0], normals[:, 1]
+    if np.any((nx > GRAPHICAL_TOLERANCE) & (ny > GRAPHICAL_TOLERANCE)):
+        return None
+    low = np.where((nx > GRAPHICAL_TOLERANCE) & (ny <= GRAPHICAL_TOLERANCE), np.arctan2(nx, -ny), 0.0)
+    high = np.where((ny > GRAPHICAL_TOLERANCE) & (nx <= GRAPHICAL_TOLERANCE), np.arctan2(-nx, ny), np.pi / 2)
+    low = min(low.max(initial=0.0), np.pi / 2)
+    high = max(high.min(initial=np.pi / 2), 0.0)
+    if low > high + GRAPHICAL_TOLERANCE:
+        return None
+    angles = np.array([low, max(low, high)])
+    return np.column_stack([np.cos(angles), np.sin(angles)])
+
+
+def _on_line(normal, offset, normals, offsets):
+    """
+    Interval of t for which the point p + t d of the line normal·x = offset satisfies
+    every half-plane and x >= 0, where p is the line's point nearest the origin and d
+    its direction.
+
+    Returns:
+    (p, d, low, high) - low and high may be infinite; low > high if the line misses the region
+    """
+    point, direction = normal * offset, np.array([-normal[1], normal[0]])
+    normals = np.vstack([normals, [[-1.0, 0.0], [0.0, -1.0]]])
+    offsets = np.concatenate([offsets, [0.0, 0.0]])
+    slope, room = normals @ direction, offsets - normals @ point
+    flat = np.abs(slope) <= GRAPHICAL_TOLERANCE
+    if np.any(room[flat] < -GRAPHICAL_TOLERANCE * max(1.0, abs(offset))):
+        return point, direction, np.inf, -np.inf
+    limits = room[~flat] / slope[~flat]
+    rising = slope[~flat] > 0
+    return (point, direction, limits[~rising].max(initial=-np.inf), limits[rising].min(initial=np.inf))
+
+
+def _box(normals, offsets, size):
+    """Adds x >= 0, y >= 0, x <= size and y <= size to the half-planes."""
+    box = np.array([[-1.0, 0.0], [0.0, -1.0], [1.0, 0.0], [0.0, 1.0]])
+    return np.vstack([normals, box]), np.concatenate([offsets, [0.0, 0.0, size, size]])
+
+
+def _intersect(normals, offsets):
+    """
+    Convex polygon where every half-plane n·x <= d holds (a bounded intersection).
+
+    The half-planes are sorted by the angle of their normal, and only the tightest of
+    those sharing an angle is kept; one sweep with a deque then drops each half-plane
+    whose edge is cut away by the next ones, so the whole is O(k log k).
+
+    Returns:
+    k×2 array of the vertices in counter-clockwise order, empty if the region is
+    empty
+    """
+    # + 0.0 turns -0.0 into 0.0, whose angle is π rather than -π
+    angles = np.arctan2(normals[:, 1] + 0.0, normals[:, 0] + 0.0)
+    order = np.lexsort((offsets, angles))
+    angles = angles[order]
+    first = np.concatenate([[True], np.diff(angles) > GRAPHICAL_TOLERANCE])
+    normals, offsets = normals[order][first], offsets[order][first]
+
+    def corner(i, j):
+        det = normals[i, 0] * normals[j, 1] - normals[i, 1] * normals[j, 0]
+        return ((offsets[i] * normals[j, 1] - normals[i, 1] * offsets[j]) / det,
+                (normals[i, 0] * offsets[j] - offsets[i] * normals[j, 0]) / det)
+
+    def outside(point, k):
+        return normals[k, 0] * point[0] + normals[k, 1] * point[1] > offsets[k] + GRAPHICAL_TOLERANCE
+
+    lines, corners = [], []
+    start = 0
+    for k in range(len(offsets)):
+        while len(corners) > start and outside(corners[-1], k):
+            lines.pop()
+            corners.pop()
+        while len(corners) > start and outside(corners[start], k):
+            start += 1
+        if len(lines) > start:
+            last = lines[-1]
+            # An opposite parallel edge can only follow when nothing is left between them
+            if (abs(normals[last, 0] * normals[k, 1] - normals[last, 1] * normals[k, 0]) <= GRAPHICAL_TOLERANCE
+                    and normals[last] @ normals[k] < 0):
+                return np.zeros((0, 2))
+            corners.append(corner(last, k))
+        lines.append(k)
+    while len(corners) > start + 1 and outside(corners[-1], lines[start]):
+        lines.pop()
+        corners.pop()
+    while len(corners) > start + 1 and outside(corners[start], lines[-1]):
+        start += 1
+    lines, corners = lines[start:], corners[start:]
+    if len(lines) < 3:
+        return np.zeros((0, 2))
+    corners.append(corner(lines[-1], lines[0]))
+    corners = np.array(corners)
+    # The sweep can close a degenerate polygon around an empty region; the centre of a
+    # true one lies inside every half-plane
+    if np.any(normals @ corners.mean(axis=0) > offsets + GRAPHICAL_TOLERANCE * max(1.0, np.abs(corners).max())):
+        return np.zeros((0, 2))
+    # Nearly parallel edges can leave a corner twice, a tolerance apart
+    distinct = (np.abs(corners - np.roll(corners, 1, axis=0)).max(axis=1)
+                > 1e3 * GRAPHICAL_TOLERANCE * np.maximum(1.0, np.abs(corners).max(axis=1)))
+    return corners[distinct | ~distinct.any()] + 0.0
+
+
+def _on_lines(normals, offsets, line_normals, line_offsets, objective, slack):
+    """
+    Corner points of the region cut out of the '=' lines by the half-planes: the
+    crossing point of two lines, or the ends of a segment of one line.
+
+    Returns:
+    (vertices, finite, improving) - vertices is empty if the region is; an unbounded
+    end of a segment is cut off a little beyond its other end, and finite masks the
+    true corner points. improving is the direction along which objective grows
+    without bound (None if there is none).
+    """
+    first = line_normals[0]
+    crossing = np.abs(line_normals[:, 0] * first[1] - line_normals[:, 1] * first[0]) > GRAPHICAL_TOLERANCE
+    if crossing.any():
+        other = np.flatnonzero(crossing)[0]
+        point = np.linalg.solve(line_normals[[0, other]], line_offsets[[0, other]])
+        scale = GRAPHICAL_TOLERANCE * max(1.0, np.abs(point).max())
+        inside = (np.all(np.abs(line_normals @ point - line_offsets) <= scale)
+                  and np.all(normals @ point <= offsets + scale) and point.min() >= -scale)
+        return (point[None, :] if inside else np.zeros((0, 2))), np.array([inside]), None
+
+    point, direction, low, high = _on_line(first, line_offsets[0], normals, offsets)
+    # Parallel '=' rows must be the same line
+    if np.any(np.abs(line_offsets - line_normals @ first * line_offsets[0]) > GRAPHICAL_TOLERANCE
+              * np.maximum(1.0, np.abs(line_offsets))):
+        return np.zeros((0, 2)), np.zeros(0, dtype=bool), None
+    if low > high + GRAPHICAL_TOLERANCE * max([1.0] + [abs(t) for t in (low, high) if np.isfinite(t)]):
+        return np.zeros((0, 2)), np.zeros(0, dtype=bool), None
+    rate = direction @ objective
+    improving = None
+    if rate > slack and np.isinf(high):
+        improving = direction
+    elif rate < -slack and np.isinf(low):
+        improving = -direction
+    finite = np.isfinite([low, high])
+    end = low if finite[0] else high
+    reach = VIEW_MARGIN * max(1.0, np.abs(point).max() + abs(end))
+    ends = np.array([low if finite[0] else end - reach, high if finite[1] else end + reach])
+    if ends[1] <= ends[0]:
+        ends, finite = ends[:1], finite[:1]
+    return point + ends[:, None] * direction, finite, improving
+
+
+def graphical_method(c, A, b, constraint_types=None, Min=False, return_vertices=False):
+    """
+    Solves a 2-variable LPP using the graphical method.
+
+    The feasible region is built as the intersection of the constraint half-planes
+    with the first quadrant, in O(k log k) for k constraints, and the objective is
+    evaluated on all of its corner points at once. '=' rows are kept as exact lines:
+    the region is then a segment or a point on them. The LPP is unbounded when the
+    objective improves along a direction in which the region runs off to infinity.
+
+    Parameters:
+    c : list or array - Coefficients of the objective function (e.g., [3, 2])
+    A : 2D list or array - Coefficients of the constraints (e.g., [[2, 1], [1, 2]])
+    b : list or array - Right-hand side values of the constraints (e.g., [8, 6])
+    constraint_types : list - Types of constraints ('<=', '>=', '='); default all '<='
+    Min : bool - If True, minimize Z; if False (default), maximize Z
+    return_vertices : bool - Also return the corner points of the feasible region,
+        counter-clockwise, for plotting; an unbounded region is cut off a little
+        beyond its last corner point
+
+    Returns:
+    optimal_value : float - Optimal value of the objective function
+    solution : array - Values of x₁ and x₂
+    ("Problem is unbounded", None) or ("Problem is infeasible", None) otherwise
+    """
+    c = np.array(c, dtype=float)
+    A = np.array(A, dtype=float).reshape(-1, 2)
+    b = np.array(b, dtype=float)
+    if len(c) != 2:
+        raise ValueError("Graphical method supports only 2 variables.")
+    if A.shape[0] != len(b):
+        raise ValueError(f"A must have {len(b)} rows to match the number of constraints.")
+    if constraint_types is None:
+        constraint_types = ['<='] * len(b)
+
+    rows = _half_planes(A, b, constraint_types)
+    if rows is None:
+        return _result('infeasible', None, None, np.zeros((0, 2)), return_vertices)
+    normals, offsets, line_normals, line_offsets = rows
+    objective = c if not Min else -c
+    slack = GRAPHICAL_TOLERANCE * max(1.0, np.abs(c).max())
+
+    if len(line_normals):
+        vertices, finite, improving = _on_lines(normals, offsets, line_normals, line_offsets, objective, slack)
+        if not len(vertices):
+            return _result('infeasible', None, None, vertices, return_vertices)
+        finite = vertices[finite]
+        best = finite[np.argmax(finite @ objective)]
+        status = 'optimal' if improving is None else 'unbounded'
+    else:
+        size = BOX_SCALE * max(1.0, np.abs(offsets).max(initial=0.0))
+        vertices = _intersect(*_box(normals, offsets, size))
+        if not len(vertices):
+            return _result('infeasible', None, None, vertices, return_vertices)
+        rays = _recession(normals)
+        # A corner of the box is not a corner of the region
+        finite = vertices[vertices.max(axis=1) < size * (1 - GRAPHICAL_TOLERANCE)]
+        best = finite[np.argmax(finite @ objective)]
+        status = 'unbounded' if rays is not None and (rays @ objective).max() > slack else 'optimal'
+        if rays is not None:
+            view = VIEW_MARGIN * max(1.0, finite.max())
+            vertices = _intersect(*_box(normals, offsets, view))
+    if status != 'optimal':
+        return _result(status, None, None, vertices, return_vertices)
+    solution = np.maximum(best, 0.0)
+    return _result(status, float(c @ solution), solution, vertices, return_vertices)
@@ -0,0 +1,125 @@
+import os
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+# Rows parsed per batch; a batch is the only tabular copy that ever exists
+BATCH_ROWS = 4096
+# CSV bytes pyarrow parses per block
+CSV_BLOCK_BYTES = 4 << 20
+
+
+def _format(source, fmt):
+    if fmt is not None:
+        return fmt
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+    return "parquet" if str(name).lower().endswith((".parquet", ".pq")) else "csv"
+
+
+def _rewind(source):
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return source
+
+
+def _csv_rows(source, header):
+    """Number of non-blank data lines, counted without parsing."""
+    _rewind(source)
+    stream = open(source, "rb") if isinstance(source, (str, os.PathLike)) else source
+    try:
+        rows = sum(1 for line in stream if line.strip())
+    finally:
+        if stream is not source:
+            stream.close()
+    return rows - (1 if header else 0)
+
+
+def _csv_columns(source, header):
+    """Column names from the first line, so every column can be typed float up front."""
+    _rewind(source)
+    stream = open(source, "rb") if isinstance(source, (str, os.PathLike)) else source
+    try:
+        first = next((line for line in stream if line.strip()), b"")
+    finally:
+        if stream is not source:
+            stream.close()
+    cells = first.decode().strip().split(",")
+    return [cell.strip() for cell in cells] if header else [f"f{j}" for j in range(len(cells))]
+
+
+def _batches(source, fmt, header):
+    if fmt == "parquet":
+        yield from pq.ParquetFile(_rewind(source)).iter_batches(batch_size=BATCH_ROWS)
+        return
+    # Typed float from the start: inferring per block would fail on a column whose
+    # first block happens to hold only integers
+    names = _csv_columns(source, header)
+    read_options = pa_csv.ReadOptions(block_size=CSV_BLOCK_BYTES, column_names=names,
+                                      skip_rows=1 if header else 0)
+    convert_options = pa_csv.ConvertOptions(column_types={name: pa.float64() for name in names})
+    yield from pa_csv.open_csv(_rewind(source), read_options=read_options,
+                               convert_options=convert_options)
+
+
+def table_shape(source, fmt=None, header=False):
+    """
+    (rows, columns) of a CSV or Parquet table without loading it.
+
+    Parameters:
+    source : str or file - Path or binary file object (e.g. a Streamlit upload)
+    fmt : str - 'csv' or 'parquet' (default: from the file name, else csv)
+    header : bool - Whether the CSV's first line holds column names
+    """
+    fmt = _format(source, fmt)
+    if fmt == "parquet":
+        metadata = pq.ParquetFile(_rewind(source)).metadata
+        return metadata.num_rows, metadata.num_columns
+    return _csv_rows(source, header), len(_csv_columns(source, header))
+
+
+def allocate(shape, path=None):
+    """Zeroed float matrix in memory, or as an np.memmap backed by path."""
+    if path is None:
+        return np.zeros(shape)
+    return np.memmap(path, dtype=float, mode="w+", shape=shape)
+
+
+def read_matrix(source, fmt=None, header=False, out=None):
+    """
+    Streams a numeric CSV or Parquet table into a float matrix, one batch at a time.
+
+    Parameters:
+    source : str or file - Path or binary file object (e.g. a Streamlit upload)
+    fmt : str - 'csv' or 'parquet' (default: from the file name, else csv)
+    header : bool - Whether the CSV's first line holds column names
+    out : array - Preallocated (rows, columns) array or np.memmap to fill
+        (default: a new in-memory array of the table's shape)
+
+    Returns:
+    out, filled row by row; empty cells become NaN
+    """
+    fmt = _format(source, fmt)
+    if out is None:
+        out = allocate(table_shape(source, fmt, header))
+    row = 0
+    for batch in _batches(source, fmt, header):
+        if batch.num_columns != out.shape[1] or row + batch.num_rows > out.shape[0]:
+            raise ValueError(f"Expected a {out.shape[0]}×{out.shape[1]} table, "
+                             f"found a row with {batch.num_columns} values near row {row + 1}.")
+        block = out[row:row + batch.num_rows]
+        for j, column in enumerate(batch.columns):
+            block[:, j] = column.to_numpy(zero_copy_only=False)
+        row += batch.num_rows
+    if row != out.shape[0]:
+        raise ValueError(f"Expected {out.shape[0]} rows, found {row}.")
+    return out
+
+
+def read_vector(source, fmt=None, header=False):
+    """Supply or demand values from a one-column (or one-row) CSV or Parquet table."""
+    values = read_matrix(source, fmt, header)
+    if min(values.shape) != 1:
+        raise ValueError("Supply and demand files must hold a single column or row of values.")
+    return values.ravel()
@@ -0,0 +1,292 @@
+import warnings
+
+import numpy as np
+from scipy import linalg, sparse
+from scipy.sparse import linalg as sparse_linalg
+
+from .linear_programming import SimplexBasis, _constraint_matrix, _result, _solve, _warm_engine
+from .presolve import presolve as _presolve
+
+# Relative primal residual, dual residual and duality gap at which a point is optimal
+IPM_TOLERANCE = 1e-8
+# Iteration limit of the interior-point method
+IPM_ITERATIONS = 200
+# Share of the distance to the boundary a step may cover
+STEP_DAMPING = 0.995
+# Norm of x (or of the duals) past which the iterates are taken to diverge
+DIVERGENCE = 1e12
+# Diagonal regularization of the normal matrix, relative to each row's diagonal entry
+REGULARIZATION = 1e-12
+# Iterative refinement steps of each normal-equation solve
+REFINEMENT_STEPS = 2
+# Smallest |pivot| the crossover crash accepts when it swaps a variable into the basis
+CRASH_PIVOT = 1e-7
+
+
+class _NormalEquations:
+    """
+    Factorization of the normal matrix A D Aᵀ of one interior-point iteration.
+
+    Dense A gets a Cholesky factorization. Sparse A gets a sparse LU with a symmetric
+    fill-reducing ordering and no pivoting, which on this positive definite matrix is
+    a Cholesky factorization up to a diagonal scaling (SciPy has no sparse Cholesky).
+    Singular matrices (dependent rows, variables at their bounds) are regularized row
+    by row, and iterative refinement against the unregularized matrix recovers the
+    accuracy the regularization and the growing ill-conditioning near the optimum cost.
+    """
+
+    def __init__(self, A, d):
+        self.is_sparse = sparse.issparse(A)
+        if self.is_sparse:
+            normal = sparse.csc_matrix(A @ sparse.diags(d) @ A.T)
+            diagonal = normal.diagonal()
+        else:
+            normal = (A * d) @ A.T
+            diagonal = np.diag(normal).copy()
+        self.normal = normal
+        if not np.all(np.isfinite(diagonal)):
+            raise linalg.LinAlgError("The normal matrix is not finite.")
+        # Each row is shifted relative to its own diagonal: the diagonal spans many orders of
+        # magnitude near the optimum, and one shift for all rows would swamp the small ones
+        shift = REGULARIZATION * np.maximum(diagonal, REGULARIZATION * max(diagonal.max(initial=0.0), 1.0))
+        for _ in range(6):
+            try:
+                if self.is_sparse:
+                    self.factor = sparse_linalg.splu(
+                        normal + sparse.diags(shift, format="csc"),
+                        permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0, options={"SymmetricMode": True})
+                else:
+                    self.factor = linalg.cho_factor(normal + np.diag(shift))
+                return
+            except (linalg.LinAlgError, RuntimeError):
+                shift *= 1e3
+        raise linalg.LinAlgError("The normal equations could not be factored.")
+
+    def _solve(self, rhs):
+        return self.factor.solve(rhs) if self.is_sparse else linalg.cho_solve(self.factor, rhs)
+
+    def solve(self, rhs):
+        """(A D Aᵀ)⁻¹ rhs."""
+        solution = self._solve(rhs)
+        for _ in range(REFINEMENT_STEPS):
+            solution += self._solve(rhs - self.normal @ solution)
+        return solution
+
+
+def _standard_form(A, b, constraint_types):
+    """
+    A x (types) b as [A S] (x, s) = b: one slack (+1) per '<=' row and one surplus (-1)
+    per '>=' row; sparse if A is.
+    """
+    types = np.asarray(constraint_types)
+    rows = np.flatnonzero(types != '=')
+    signs = np.where(types[rows] == '>=', -1.0, 1.0)
+    logical = sparse.csr_matrix((signs, (rows, np.arange(len(rows)))), shape=(len(b), len(rows)))
+    if sparse.issparse(A):
+        return sparse.hstack([A, logical], format="csr")
+    return np.hstack([A, logical.toarray()])
+
+
+def _step(values, direction):
+    """Largest step in [0, 1] that keeps values + step·direction nonnegative."""
+    falling = direction < 0
+    if not falling.any():
+        return 1.0
+    return min(1.0, float(np.min(-values[falling] / direction[falling])))
+
+
+def _mehrotra(c, A, b):
+    """
+    Mehrotra predictor-corrector method on min c·x s.t. A x = b, x >= 0.
+
+    Every iteration factors the normal matrix once and solves with it twice: for the
+    affine-scaling (predictor) direction, and for the corrector that re-centres it
+    by σμ with σ = (μ_aff / μ)³ and compensates its second-order term.
+
+    Returns:
+    (status, x, y, z, iterations) with status 'optimal', 'infeasible', 'unbounded'
+    or 'stalled', y the duals of the rows and z those of the bounds
+    """
+    m, n = A.shape
+    AT = A.T
+    # Mehrotra's starting point: least-norm x and least-squares duals, shifted inside
+    start = _NormalEquations(A, np.ones(n))
+    x = AT @ start.solve(b)
+    y = start.solve(A @ c)
+    z = c - AT @ y
+    x += max(-1.5 * x.min(initial=0.0), 0.0)
+    z += max(-1.5 * z.min(initial=0.0), 0.0)
+    if x @ z <= 0:
+        x += 1.0
+        z += 1.0
+    x += 0.5 * (x @ z) / z.sum()
+    z += 0.5 * (x @ z) / x.sum()
+
+    b_norm, c_norm = 1.0 + np.linalg.norm(b), 1.0 + np.linalg.norm(c)
+    for iteration in range(IPM_ITERATIONS):
+        primal_residual = A @ x - b
+        dual_residual = AT @ y + z - c
+        primal_value, dual_value = c @ x, b @ y
+        if (np.linalg.norm(primal_residual) <= IPM_TOLERANCE * b_norm
+                and np.linalg.norm(dual_residual) <= IPM_TOLERANCE * c_norm
+                and abs(primal_value - dual_value) <= IPM_TOLERANCE * (1.0 + abs(primal_value))):
+            return 'optimal', x, y, z, iteration
+        # Diverging x with a feasible primal is a ray of improvement; diverging duals
+        # with a feasible dual are a certificate that the rows cannot all hold. Either
+        # without the matching feasibility leaves the question open
+        primal_feasible = np.linalg.norm(primal_residual) <= IPM_TOLERANCE ** 0.5 * b_norm
+        dual_feasible = np.linalg.norm(dual_residual) <= IPM_TOLERANCE ** 0.5 * c_norm
+        if np.abs(x).max() > DIVERGENCE:
+            return ('unbounded' if primal_feasible else 'stalled'), x, y, z, iteration
+        if np.abs(y).max() > DIVERGENCE or np.abs(z).max() > DIVERGENCE:
+            return ('infeasible' if dual_feasible else 'stalled'), x, y, z, iteration
+
+        d = x / z
+        try:
+            normal = _NormalEquations(A, d)
+        except linalg.LinAlgError:
+            return 'stalled', x, y, z, iteration
+        mu = (x @ z) / n
+
+        def direction(complementarity):
+            # Z dx + X dz = complementarity, A dx = -primal, Aᵀ dy + dz = -dual
+            dy = normal.solve(-primal_residual - A @ (complementarity / z + d * dual_residual))
+            dz = -dual_residual - AT @ dy
+            return (complementarity - x * dz) / z, dy, dz
+
+        dx, dy, dz = direction(-x * z)
+        primal_step, dual_step = _step(x, dx), _step(z, dz)
+        affine_mu = ((x + primal_step * dx) @ (z + dual_step * dz)) / n
+        sigma = (affine_mu / mu) ** 3
+        dx, dy, dz = direction(-x * z - dx * dz + sigma * mu)
+
+        primal_step = min(1.0, STEP_DAMPING * _step(x, dx))
+        dual_step = min(1.0, STEP_DAMPING * _step(z, dz))
+        x = x + primal_step * dx
+        y = y + dual_step * dy
+        z = z + dual_step * dz
+    return 'stalled', x, y, z, IPM_ITERATIONS
+
+
+def _crossover(c, A, b, constraint_types, Min, x, slacks):
+    """
+    Optimal basic solution near an interior-point optimum.
+
+    A crash starts from the all-logical basis and swaps in the variables that are
+    clearly positive at the interior point, largest first, each for a logical whose
+    slack is (near) zero there; the simplex then re-optimizes from that basis, usually
+    in a few pivots, or starts over when the basis is neither primal nor dual feasible.
+
+    Returns:
+    ('optimal', value, x, basis) or another _solve status
+    """
+    m, n = A.shape
+    cost = c if Min else -c
+    scale = max(1.0, np.abs(x).max(initial=0.0))
+    warm = _warm_engine(A, b, constraint_types, cost, SimplexBasis([], np.arange(m), (m, n)))
+    if warm is not None:
+        engine, _ = warm
+        # Logicals whose row is tight at the interior point may leave the basis
+        replaceable = np.concatenate([np.zeros(n, dtype=bool), slacks <= IPM_TOLERANCE ** 0.5 * scale])
+        for q in np.argsort(-x):
+            if x[q] <= IPM_TOLERANCE ** 0.5 * scale:
+                break
+            d = engine.ftran(engine.column(q))
+            candidates = np.flatnonzero(replaceable[engine.basis] & (np.abs(d) > CRASH_PIVOT))
+            if len(candidates):
+                leaving = candidates[np.argmax(np.abs(d[candidates]))]
+                replaceable[engine.basis[leaving]] = False
+                engine.pivot(q, leaving=leaving)
+        basis = SimplexBasis._of(engine, False)
+    else:
+        basis = None
+    return _solve(c, A, b, constraint_types, Min, warm_start=basis)
+
+
+def _interior_point(c, A, b, constraint_types, Min, crossover):
+    """
+    Interior-point solve of max (or min) c·x s.t. A x (types) b, x >= 0.
+
+    Returns:
+    (status, value, x, stats) with stats the iterations, crossover pivots and
+    final residuals
+    """
+    A = _constraint_matrix(A, len(b), len(c))
+    n = len(c)
+    cost = c if Min else -c
+    standard = _standard_form(A, b, constraint_types)
+    full_cost = np.concatenate([cost, np.zeros(standard.shape[1] - n)])
+    status, z_x, y, z, iterations = _mehrotra(full_cost, standard, b)
+    stats = {"iterations": iterations, "crossover_pivots": None,
+             "primal_residual": float(np.linalg.norm(standard @ z_x - b) / (1.0 + np.linalg.norm(b))),
+             "dual_residual": float(np.linalg.norm(standard.T @ y + z - full_cost)
+                                    / (1.0 + np.linalg.norm(full_cost)))}
+    if status == 'stalled':
+        # Too close to degenerate for the interior point to finish; the simplex decides
+        crossover = True
+    elif status != 'optimal':
+        return status, None, None, stats
+    x = np.maximum(z_x[:n], 0.0)
+    if crossover:
+        slacks = np.abs(A @ x - b)
+        status, value, x, basis = _crossover(c, A, b, constraint_types, Min, x, slacks)
+        if status != 'optimal':
+            return status, None, None, stats
+        stats["crossover_pivots"] = basis.iterations
+        return 'optimal', value, x, stats
+    return 'optimal', float(c @ x), x, stats
+
+
+def interior_point_method(c, A, b, constraint_types=None, Min=False, crossover=False, presolve=True,
+                          return_stats=False):
+    """
+    Solves an LPP using a primal-dual interior-point method (Mehrotra predictor-corrector).
+
+    Instead of walking the corners of the feasible region, the method follows a path
+    through its interior, where each iteration solves the normal equations A D Aᵀ once
+    (a Cholesky factorization, sparse when A is sparse). Its iteration count hardly
+    grows with the problem size, which suits large LPs. The solution it finds lies in
+    the middle of the optimal face; crossover moves it to an optimal corner point, as
+    the simplex methods would return.
+
+    Parameters:
+    c : list or array - Coefficients of the objective function
+    A : 2D list or array, scipy.sparse matrix or (values, (rows, cols)) triple -
+        Coefficients of the constraints (left-hand side)
+    b : list or array - Right-hand side values of the constraints
+    constraint_types : list - Types of constraints ('<=', '>=', '='); default all '<='
+    Min : bool - If True, minimize Z; if False (default), maximize Z
+    crossover : bool - Finish with a basic (corner point) solution via the simplex
+    presolve : bool - Reduce and scale the problem first (default True)
+    return_stats : bool - Also return a dict of iterations, crossover pivots and the
+        relative primal and dual residuals of the interior-point solution
+
+    Returns:
+    optimal_value : float - Optimal value of the objective function
+    solution : array - Values of the decision variables
+    ("Problem is unbounded", None) or ("Problem is infeasible", None) otherwise
+    """
+    c = np.array(c, dtype=float)
+    b = np.array(b, dtype=float)
+    A = _constraint_matrix(A, len(b), len(c))
+    if constraint_types is None:
+        constraint_types = ['<='] * len(b)
+    stats = {"iterations": 0, "crossover_pivots": None, "primal_residual": 0.0, "dual_residual": 0.0}
+    reduced = _presolve(c, A, b, constraint_types, Min) if presolve else None
+    if reduced is None or reduced.status == 'reduced':
+        problem = (c, A, b, constraint_types) if reduced is None else \
+            (reduced.c, reduced.A, reduced.b, reduced.constraint_types)
+        # Diverging iterates overflow on the way to their infeasible, unbounded or
+        # stalled verdict; the solve checks for that itself
+        with warnings.catch_warnings(), np.errstate(over='ignore', invalid='ignore'):
+            warnings.simplefilter('ignore', linalg.LinAlgWarning)
+            status, _, x, stats = _interior_point(*problem, Min, crossover)
+        if status == 'optimal' and reduced is not None:
+            x = reduced.postsolve(x)
+    elif reduced.status == 'solved':
+        status, x = 'optimal', reduced.postsolve(np.zeros(0))
+    else:
+        status, x = reduced.status, None
+    value = float(c @ x) if status == 'optimal' else None
+    result = _result(status, value, x, None, False)
+    return (*result, stats) if return_stats else result
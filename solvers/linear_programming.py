@@ -0,0 +1,1130 @@
+import heapq
+import math
+import multiprocessing
+import warnings
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+import numpy as np
+from scipy import linalg, sparse
+from scipy.sparse import linalg as sparse_linalg
+
+from .presolve import presolve as _presolve
+
+# Pivots between refactorizations of the basis; eta columns carry the updates in between
+REFACTOR_INTERVAL = 64
+# Smallest pricing block: problems with fewer columns are priced in full every iteration
+PRICING_BLOCK = 1024
+# Absolute tolerance for reduced costs, pivot entries and primal feasibility
+SIMPLEX_TOLERANCE = 1e-9
+# Consecutive degenerate pivots after which pricing falls back to Bland's rule
+DEGENERATE_STREAK = 50
+# Penalty on the artificial variables of the Big M method
+BIG_M = 1000
+# Tolerance within which a branch-and-bound value counts as integer
+INTEGER_TOLERANCE = 1e-6
+# Node LPs between two progress reports of a branch-and-bound search
+PROGRESS_INTERVAL = 50
+# Basic values within this of an integer yield no Gomory cut
+CUT_AWAY = 0.01
+# Largest ratio between the biggest and smallest coefficient of a usable cut
+CUT_DYNAMISM = 1e6
+# Violation a cut scaled to unit coefficients must exceed to be added
+CUT_VIOLATION = 1e-6
+# Cuts generated, and added to the LP, per round
+CUTS_PER_ROUND = 20
+# Default limit on rounds of the root cut loop
+CUT_ROUNDS = 10
+# Rounds a cut may stay slack in the LP, or unviolated in the pool, before it goes
+CUT_AGE_LIMIT = 3
+# Root cut rounds stop once a round raises the bound by less than this (relative)
+CUT_TAILING_OFF = 1e-4
+
+
+def _constraint_matrix(A, m, n):
+    """
+    A as a float array, or as a CSC matrix when it is sparse or a
+    (values, (rows, cols)) triple of its m×n nonzeros.
+    """
+    if isinstance(A, tuple) and len(A) == 2 and isinstance(A[1], tuple):
+        A = sparse.coo_matrix(A, shape=(m, n))
+    if sparse.issparse(A):
+        A = sparse.csc_matrix(A, dtype=float)
+        A.sum_duplicates()
+        return A
+    return np.asarray(A, dtype=float)
+
+
+def _standard_form(A, b, constraint_types):
+    """
+    A x (<=, >=, =) b, x >= 0 as A x + L s = b, (x, s) >= 0 with a feasible starting basis.
+
+    A is a float array or CSC matrix (see _constraint_matrix), b a float array.
+
+    Rows with a negative right-hand side are negated first. L holds the logical
+    columns, each a signed unit column: a slack (+1) or surplus (-1) for every
+    inequality, then an artificial (+1) for every row whose slack cannot start basic.
+
+    Returns:
+    (A, b, rows, signs, basis, artificial) - row-signed A and b, row and sign of each
+    logical column, starting basis (one column per row; logical k is column n + k)
+    and a mask of the artificial columns
+    """
+    m, n = A.shape
+    sign = np.where(b < 0, -1.0, 1.0)
+    A = sparse.csc_matrix(sparse.diags(sign) @ A) if sparse.issparse(A) else A * sign[:, None]
+    b = b * sign
+    types = np.asarray(constraint_types)
+    inequality = np.flatnonzero(types != '=')
+    slack_signs = np.where(types[inequality] == '<=', 1.0, -1.0) * sign[inequality]
+
+    basis = np.full(m, -1, dtype=np.intp)
+    usable = slack_signs > 0
+    basis[inequality[usable]] = n + np.flatnonzero(usable)
+    needs = np.flatnonzero(basis < 0)
+    basis[needs] = n + len(inequality) + np.arange(len(needs))
+    rows = np.concatenate([inequality, needs])
+    signs = np.concatenate([slack_signs, np.ones(len(needs))])
+    artificial = np.zeros(n + len(rows), dtype=bool)
+    artificial[basis[needs]] = True
+    return A, b, rows, signs, basis, artificial
+
+
+class _RevisedSimplex:
+    """
+    Revised simplex on min c·z s.t. A x + L s = b, z = (x, s) >= 0, from a primal
+    feasible basis.
+
+    The structural columns A are kept as given, dense or CSC; the logical columns L
+    are signed unit columns stored as a row and a sign each. The basis matrix is kept
+    as an LU factorization (sparse LU when A is sparse) plus a product-form file of
+    eta columns, one per pivot and holding only its nonzeros, and is factored afresh
+    every REFACTOR_INTERVAL pivots. An iteration solves for the duals (BTRAN), prices
+    one block of columns and solves for the entering column (FTRAN); the tableau
+    itself is never formed, so memory follows the nonzeros of A.
+    """
+
+    def __init__(self, A, b, rows, signs, c, basis):
+        self.A = A
+        self.is_sparse = sparse.issparse(A)
+        # Rows of Aᵀ are the columns of A: a CSR view of a CSC matrix, no copy
+        self.AT = A.T
+        self.b = b
+        self.rows = rows
+        self.signs = signs
+        self.c = np.asarray(c, dtype=float)
+        self.m, self.structural = A.shape
+        self.n = self.structural + len(rows)
+        self.basis = np.array(basis, dtype=np.intp)
+        self.is_basic = np.zeros(self.n, dtype=bool)
+        self.is_basic[self.basis] = True
+        # Columns that may never enter, e.g. artificials once phase one is over
+        self.excluded = np.zeros(self.n, dtype=bool)
+        self.iterations = 0
+        self.degenerate = 0
+        self.block_size = max(PRICING_BLOCK, int(math.sqrt(self.n)))
+        self.next_block = 0
+        # Pricing divides reduced costs by the columns' starting steepest-edge norms,
+        # sqrt(1 + |a_j|²), so badly scaled columns do not dominate the choice
+        squares = (A.multiply(A).sum(axis=0).A1 if self.is_sparse else np.einsum('ij,ij->j', A, A))
+        self.weights = np.sqrt(1.0 + np.concatenate([squares, np.ones(len(rows))]))
+        self.factor()
+
+    def column(self, q):
+        """Column q of [A L] as a dense vector."""
+        column = np.zeros(self.m)
+        if q >= self.structural:
+            column[self.rows[q - self.structural]] = self.signs[q - self.structural]
+        elif self.is_sparse:
+            entries = slice(self.A.indptr[q], self.A.indptr[q + 1])
+            column[self.A.indices[entries]] = self.A.data[entries]
+        else:
+            column[:] = self.A[:, q]
+        return column
+
+    def row_products(self, y, start=0, stop=None):
+        """y·a_j for the columns start..stop-1."""
+        stop = self.n if stop is None else stop
+        split = min(max(self.structural, start), stop)
+        products = np.empty(stop - start)
+        products[:split - start] = self.AT[start:split] @ y
+        if stop > split:
+            logical = slice(split - self.structural, stop - self.structural)
+            products[split - start:] = self.signs[logical] * y[self.rows[logical]]
+        return products
+
+    def _basis_matrix(self):
+        if not self.is_sparse:
+            return np.column_stack([self.column(q) for q in self.basis])
+        positions = np.flatnonzero(self.basis < self.structural)
+        structural = self.A[:, self.basis[positions]].tocoo()
+        logical = np.flatnonzero(self.basis >= self.structural)
+        k = self.basis[logical] - self.structural
+        return sparse.csc_matrix(
+            (np.concatenate([structural.data, self.signs[k]]),
+             (np.concatenate([structural.row, self.rows[k]]),
+              np.concatenate([positions[structural.col], logical]))),
+            shape=(self.m, self.m))
+
+    def factor(self):
+        """Refactors the basis matrix and recomputes the basic values from b."""
+        if self.is_sparse:
+            self.lu = sparse_linalg.splu(self._basis_matrix())
+        else:
+            self.lu = linalg.lu_factor(self._basis_matrix())
+        self.etas = []
+        self.x = self.ftran(self.b)
+        self.x[np.abs(self.x) < SIMPLEX_TOLERANCE] = 0.0
+
+    def ftran(self, vector):
+        """B⁻¹ vector."""
+        x = self.lu.solve(vector) if self.is_sparse else linalg.lu_solve(self.lu, vector)
+        for r, pivot_value, indices, values in self.etas:
+            pivot = x[r] / pivot_value
+            x[indices] -= pivot * values
+            x[r] = pivot
+        return x
+
+    def btran(self, vector):
+        """B⁻ᵀ vector."""
+        y = np.array(vector, dtype=float)
+        for r, pivot_value, indices, values in reversed(self.etas):
+            y[r] = (y[r] - values @ y[indices] + pivot_value * y[r]) / pivot_value
+        return self.lu.solve(y, trans='T') if self.is_sparse else linalg.lu_solve(self.lu, y, trans=1)
+
+    def _reduced(self, start, stop, y):
+        reduced = self.c[start:stop] - self.row_products(y, start, stop)
+        reduced[self.is_basic[start:stop] | self.excluded[start:stop]] = np.inf
+        return reduced
+
+    def price(self):
+        """Entering column: most negative weighted reduced cost in the first block that has one."""
+        y = self.btran(self.c[self.basis])
+        blocks = math.ceil(self.n / self.block_size)
+        bland = self.degenerate >= DEGENERATE_STREAK
+        for _ in range(blocks):
+            # Bland's rule scans from the first column for the first negative one
+            block = _ if bland else self.next_block
+            start = block * self.block_size
+            stop = min(start + self.block_size, self.n)
+            if not bland:
+                self.next_block = (self.next_block + 1) % blocks
+            reduced = self._reduced(start, stop, y)
+            negative = np.flatnonzero(reduced < -SIMPLEX_TOLERANCE)
+            if len(negative):
+                if bland:
+                    return start + negative[0]
+                return start + negative[np.argmin(reduced[negative] / self.weights[start + negative])]
+        return None
+
+    def pivot(self, q, leaving=None):
+        """
+        Brings column q into the basis.
+
+        Parameters:
+        q : int - Entering column
+        leaving : int - Basis position to leave (default: by the minimum ratio test)
+
+        Returns:
+        False if column q can increase without bound, else True
+        """
+        d = self.ftran(self.column(q))
+        if leaving is None:
+            rows = np.flatnonzero(d > SIMPLEX_TOLERANCE)
+            if not len(rows):
+                return False
+            ratios = self.x[rows] / d[rows]
+            ties = rows[ratios <= ratios.min()]
+            leaving = ties[np.argmin(self.basis[ties])] if self.degenerate >= DEGENERATE_STREAK else ties[0]
+        theta = self.x[leaving] / d[leaving]
+        self.degenerate = self.degenerate + 1 if theta <= SIMPLEX_TOLERANCE else 0
+
+        self.x -= theta * d
+        self.x[leaving] = theta
+        self.is_basic[self.basis[leaving]] = False
+        self.is_basic[q] = True
+        self.basis[leaving] = q
+        indices = np.flatnonzero(d)
+        self.etas.append((leaving, d[leaving], indices, d[indices]))
+        self.iterations += 1
+        if len(self.etas) >= REFACTOR_INTERVAL:
+            self.factor()
+        return True
+
+    def run(self):
+        """Primal simplex to optimality; returns 'optimal' or 'unbounded'."""
+        while True:
+            q = self.price()
+            if q is None:
+                return 'optimal'
+            if not self.pivot(q):
+                return 'unbounded'
+
+    def run_dual(self, capped, cutoff=np.inf):
+        """
+        Dual simplex from a dual feasible basis to optimality.
+
+        Each iteration drops the basic variable furthest outside its bounds (below
+        zero, or above zero for a capped column) and brings in the column that keeps
+        every reduced cost nonnegative.
+
+        Parameters:
+        capped : array - Mask of the columns fixed at zero, e.g. artificials of equality rows
+        cutoff : float - Stop once the objective, which only rises, reaches this value
+
+        Returns:
+        'optimal', 'infeasible' when a violated row has no column to repair it, or
+        'cutoff'
+        """
+        while True:
+            if self.c[self.basis] @ self.x >= cutoff:
+                return 'cutoff'
+            violation = np.where(capped[self.basis], np.abs(self.x), -self.x)
+            r = int(np.argmax(violation))
+            if violation[r] <= SIMPLEX_TOLERANCE:
+                return 'optimal'
+            unit = np.zeros(self.m)
+            unit[r] = 1.0
+            # Row r of B⁻¹[A L]; the leaving variable moves up to zero if it is
+            # negative and down to zero if it is a positive capped column
+            alpha = self.row_products(self.btran(unit))
+            if self.x[r] > 0:
+                alpha = -alpha
+            reduced = np.maximum(self._reduced(0, self.n, self.btran(self.c[self.basis])), 0.0)
+            candidates = np.flatnonzero((alpha < -SIMPLEX_TOLERANCE) & np.isfinite(reduced))
+            if not len(candidates):
+                return 'infeasible'
+            ratios = reduced[candidates] / -alpha[candidates]
+            ties = candidates[ratios <= ratios.min() + SIMPLEX_TOLERANCE]
+            # Among tied ratios the largest pivot entry is the most stable
+            self.pivot(int(ties[np.argmax(np.abs(alpha[ties]))]), leaving=r)
+
+    def drive_out(self, artificial):
+        """
+        After phase one: pivots basic artificials at zero out of the basis where a real
+        column can replace them, and bars every artificial from entering again.
+        """
+        self.excluded |= artificial
+        for r in np.flatnonzero(artificial[self.basis]):
+            unit = np.zeros(self.m)
+            unit[r] = 1.0
+            row = self.row_products(self.btran(unit))
+            row[self.is_basic | self.excluded] = 0.0
+            q = int(np.argmax(np.abs(row)))
+            if abs(row[q]) > SIMPLEX_TOLERANCE:
+                self.pivot(q, leaving=r)
+
+    def values(self):
+        """Full primal vector z."""
+        z = np.zeros(self.n)
+        z[self.basis] = self.x
+        return z
+
+
+class SimplexBasis:
+    """
+    Optimal basis of a solved LP, for warm-starting the solve of a modified copy.
+
+    A basis is one basic column per constraint row: structural variables, plus the
+    slack, surplus or artificial of the remaining rows. It stays valid when the
+    right-hand side, the objective or the constraint types change and when rows are
+    appended (their slacks join the basis), so the next solve only has to repair it.
+
+    Attributes:
+    variables : array - Basic decision variables
+    rows : array - Rows whose slack (surplus, artificial) is basic
+    shape : tuple - (constraints, variables) of the problem it was found for
+    iterations : int - Pivots taken by the solve that found it, both phases included
+    warm_started : bool - Whether that solve started from an earlier basis
+    phase_one_iterations : int - Of those pivots, the ones a two-phase solve spent
+        finding a feasible basis (0 for Big M and warm-started solves)
+    """
+
+    def __init__(self, variables, rows, shape, iterations=0, warm_started=False, phase_one_iterations=0):
+        self.variables = np.asarray(variables, dtype=np.intp)
+        self.rows = np.asarray(rows, dtype=np.intp)
+        self.shape = tuple(shape)
+        self.iterations = iterations
+        self.warm_started = warm_started
+        self.phase_one_iterations = phase_one_iterations
+
+    @classmethod
+    def _of(cls, engine, warm_started, phase_one_iterations=0):
+        n = engine.structural
+        basis = engine.basis
+        logical = basis[basis >= n] - n
+        return cls(np.sort(basis[basis < n]), np.sort(engine.rows[logical]),
+                   (engine.m, n), engine.iterations, warm_started, phase_one_iterations)
+
+
+def _warm_engine(A, b, constraint_types, cost, warm_start):
+    """
+    Engine on warm_start's basis, extended by the slacks of any appended rows.
+
+    Every row gets one logical column here, with no row negation: a slack (+1) or
+    surplus (-1) for an inequality, an artificial capped at zero for an equality.
+
+    Returns:
+    (engine, capped) with the mask of the capped artificials, or None when the basis
+    does not fit the problem or is singular
+    """
+    m, n = A.shape
+    old_m, old_n = warm_start.shape
+    if old_n != n or old_m > m or len(warm_start.variables) + len(warm_start.rows) != old_m:
+        return None
+    types = np.asarray(constraint_types)
+    signs = np.where(types == '>=', -1.0, 1.0)
+    capped = np.zeros(n + m, dtype=bool)
+    capped[n + np.flatnonzero(types == '=')] = True
+    basis = np.concatenate([warm_start.variables, n + warm_start.rows, n + np.arange(old_m, m)])
+    logical_cost = np.zeros(m)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', linalg.LinAlgWarning)
+            engine = _RevisedSimplex(A, b, np.arange(m), signs, np.concatenate([cost, logical_cost]), basis)
+    except (RuntimeError, ValueError):
+        return None
+    if not np.all(np.isfinite(engine.x)):
+        return None
+    engine.excluded |= capped
+    return engine, capped
+
+
+def _restart(A, b, constraint_types, cost, tolerance, warm_start, cutoff=np.inf):
+    """
+    Re-optimizes from warm_start's basis: the primal simplex when the basis is still
+    primal feasible (objective edits), the dual simplex when it is still dual feasible
+    (right-hand side edits, appended rows).
+
+    Returns:
+    (status, engine), or None when the basis does not fit the problem or is neither
+    primal nor dual feasible, and a cold start is needed
+    """
+    warm = _warm_engine(A, b, constraint_types, cost, warm_start)
+    if warm is None:
+        return None
+    engine, capped = warm
+    # The primal ratio test does not stop a basic artificial from growing, so a basis
+    # holding one goes through the dual simplex, which keeps it at zero
+    if np.all(engine.x >= -tolerance) and not capped[engine.basis].any():
+        return engine.run(), engine
+    reduced = engine._reduced(0, engine.n, engine.btran(engine.c[engine.basis]))
+    if reduced.min() < -SIMPLEX_TOLERANCE:
+        return None
+    return engine.run_dual(capped, cutoff), engine
+
+
+def _solve(c, A, b, constraint_types, Min, big_m=None, warm_start=None, cutoff=np.inf):
+    """
+    Revised simplex on max (or min) c·x s.t. A x (types) b, x >= 0.
+
+    With a usable warm_start basis the solve repairs that basis (see _restart), and
+    gives up with 'cutoff' once the minimized objective (-c·x when maximizing)
+    provably reaches cutoff. Otherwise feasibility comes from a first phase minimizing the sum of the
+    artificials, or with big_m from a single pass pricing each artificial at big_m.
+
+    Returns:
+    ('optimal', value, x, basis), ('unbounded', None, None, None) or
+    ('infeasible', None, None, None) or ('cutoff', None, None, None); basis is a SimplexBasis
+    """
+    c = np.array(c, dtype=float)
+    b = np.array(b, dtype=float)
+    A = _constraint_matrix(A, len(b), len(c))
+    n = len(c)
+    cost = c if Min else -c
+    tolerance = SIMPLEX_TOLERANCE * max(1.0, np.abs(b).max(initial=0.0))
+
+    restarted = None if warm_start is None else _restart(A, b, constraint_types, cost, tolerance,
+                                                         warm_start, cutoff)
+    if restarted is not None:
+        status, engine = restarted
+        if status != 'optimal':
+            return status, None, None, None
+        x = engine.values()[:n]
+        return 'optimal', float(c @ x), x, SimplexBasis._of(engine, True)
+
+    A, b, rows, signs, basis, artificial = _standard_form(A, b, constraint_types)
+    cost = np.concatenate([cost, np.zeros(len(artificial) - n)])
+
+    phase_one = 0
+    if big_m is not None:
+        cost[artificial] = big_m
+        engine = _RevisedSimplex(A, b, rows, signs, cost, basis)
+    elif artificial.any():
+        # --- Phase one: minimize the sum of the artificials ---
+        engine = _RevisedSimplex(A, b, rows, signs, artificial.astype(float), basis)
+        engine.run()
+        if engine.x @ artificial[engine.basis] > tolerance:
+            return 'infeasible', None, None, None
+        engine.drive_out(artificial)
+        phase_one = engine.iterations
+        engine.c = cost
+        engine.degenerate = 0
+    else:
+        engine = _RevisedSimplex(A, b, rows, signs, cost, basis)
+
+    if engine.run() == 'unbounded':
+        return 'unbounded', None, None, None
+    if engine.x @ artificial[engine.basis] > tolerance:
+        return 'infeasible', None, None, None
+    x = engine.values()[:n]
+    return 'optimal', float(c @ x), x, SimplexBasis._of(engine, False, phase_one)
+
+
+def _presolved_solve(c, A, b, constraint_types, Min, big_m=None):
+    """_solve on the presolved problem, its solution mapped back to the original variables."""
+    c = np.array(c, dtype=float)
+    b = np.array(b, dtype=float)
+    reduced = _presolve(c, _constraint_matrix(A, len(b), len(c)), b, constraint_types, Min)
+    if reduced.status in ('infeasible', 'unbounded'):
+        return reduced.status, None, None, None
+    if reduced.status == 'solved':
+        x = reduced.postsolve(np.zeros(0))
+    else:
+        if big_m is not None:
+            # Scaling grows the costs; M must keep dominating them
+            big_m *= max(1.0, np.abs(reduced.c).max(initial=0.0) / max(np.abs(c).max(initial=0.0), 1e-12))
+        status, _, x, _ = _solve(reduced.c, reduced.A, reduced.b, reduced.constraint_types, Min, big_m=big_m)
+        if status != 'optimal':
+            return status, None, None, None
+        x = reduced.postsolve(x)
+    return 'optimal', float(c @ x), x, None
+
+
+def _with_rows(A, b, rows):
+    """
+    A and b with one more row per (columns, values, rhs) in rows, meaning
+    values·x[columns] <= rhs; sparse if A is.
+    """
+    if not rows:
+        return A, b
+    columns, values, rhs = zip(*rows)
+    indptr = np.cumsum([0] + [len(part) for part in columns])
+    extra = sparse.csr_matrix((np.concatenate(values), np.concatenate(columns), indptr),
+                              shape=(len(rows), A.shape[1]))
+    A = sparse.vstack([A, extra], format="csc") if sparse.issparse(A) else np.vstack([A, extra.toarray()])
+    return A, np.concatenate([b, rhs])
+
+
+def _bound(i, sign, rhs):
+    """Branching row sign·x_i <= rhs."""
+    return np.array([i]), np.array([sign]), rhs
+
+
+def _integral_rows(A, b):
+    """Mask of the rows with integer coefficients and right-hand side: their slack is integer too."""
+    if sparse.issparse(A):
+        csr = sparse.csr_matrix(A)
+        fractional = (csr.data != np.round(csr.data)).astype(float)
+        counts = sparse.csr_matrix((fractional, csr.indices, csr.indptr), shape=csr.shape).sum(axis=1).A1
+        integral = counts == 0
+    else:
+        integral = np.all(A == np.round(A), axis=1)
+    return integral & (b == np.round(b))
+
+
+def _cut_key(cut):
+    columns, values, rhs = cut
+    return columns.tobytes(), np.round(values, 9).tobytes(), round(rhs, 9)
+
+
+def _violation(cut, x):
+    columns, values, rhs = cut
+    return values @ x[columns] - rhs
+
+
+def _gomory_cuts(engine, integral, limit=CUTS_PER_ROUND):
+    """
+    Gomory mixed-integer cuts from the optimal tableau of A x <= b, x >= 0 and integer.
+
+    Each comes from the row of a basic variable with a fractional value, most
+    fractional first. The slack of row k is s_k = b_k - A_k x, so a cut on (x, s) is
+    rewritten on x alone.
+
+    Parameters:
+    engine : _RevisedSimplex - Optimal engine in the warm form (see _warm_engine)
+    integral : array - Mask of the rows whose slack is integer
+    limit : int - Most cuts to return
+
+    Returns:
+    list of (columns, values, rhs) cuts violated by the LP optimum, scaled to a largest
+    coefficient of 1
+    """
+    n = engine.structural
+    x = engine.values()[:n]
+    positions = np.flatnonzero(engine.basis < n)
+    fraction = engine.x[positions] - np.floor(engine.x[positions])
+    distance = np.minimum(fraction, 1.0 - fraction)
+    positions = positions[distance > CUT_AWAY][np.argsort(-distance[distance > CUT_AWAY])]
+    integer = np.concatenate([np.ones(n, dtype=bool), integral])
+    cuts = []
+    for r in positions[:limit]:
+        f0 = engine.x[r] - np.floor(engine.x[r])
+        unit = np.zeros(engine.m)
+        unit[r] = 1.0
+        alpha = engine.row_products(engine.btran(unit))
+        fj = alpha - np.floor(alpha)
+        coefficients = np.where(integer, np.where(fj <= f0, fj / f0, (1.0 - fj) / (1.0 - f0)),
+                                np.where(alpha >= 0, alpha / f0, -alpha / (1.0 - f0)))
+        coefficients[engine.is_basic] = 0.0
+        # coefficients·(x, s) >= 1 with s = b - A x, as a <= row on x
+        slack = coefficients[n:]
+        values = engine.AT @ slack - coefficients[:n]
+        rhs = engine.b @ slack - 1.0
+        scale = np.abs(values).max(initial=0.0)
+        if not np.isfinite(scale) or scale <= SIMPLEX_TOLERANCE:
+            continue
+        values /= scale
+        rhs /= scale
+        # Dropping a tiny positive coefficient only weakens the cut; a tiny negative
+        # one would have to stay, and makes the cut too badly scaled to use
+        values[(values > 0) & (values < 1.0 / CUT_DYNAMISM)] = 0.0
+        columns = np.flatnonzero(values)
+        if not len(columns) or np.abs(values[columns]).min() < 1.0 / CUT_DYNAMISM:
+            continue
+        cut = (columns, values[columns], rhs)
+        if _violation(cut, x) > CUT_VIOLATION:
+            cuts.append(cut)
+    return cuts
+
+
+class _CutPool:
+    """
+    Globally valid cuts waiting outside the LP.
+
+    Cuts are deduplicated by their rounded coefficients, including against those in
+    the LP. Each separation round ages the cuts it does not find violated; a cut
+    reaching CUT_AGE_LIMIT is forgotten.
+    """
+
+    def __init__(self):
+        self.cuts = {}
+        self.seen = set()
+
+    def add(self, cuts):
+        for cut in cuts:
+            key = _cut_key(cut)
+            if key not in self.seen:
+                self.seen.add(key)
+                self.cuts[key] = [cut, 0]
+
+    def separate(self, x, limit=CUTS_PER_ROUND):
+        """Takes out the (at most limit) cuts most violated by x, ageing the rest."""
+        violated = []
+        for key, entry in list(self.cuts.items()):
+            violation = _violation(entry[0], x)
+            if violation > CUT_VIOLATION:
+                violated.append((violation, key))
+            else:
+                entry[1] += 1
+                if entry[1] >= CUT_AGE_LIMIT:
+                    del self.cuts[key]
+                    self.seen.discard(key)
+        violated.sort(reverse=True)
+        return [self.cuts.pop(key)[0] for _, key in violated[:limit]]
+
+    def put_back(self, cut):
+        """Returns a cut dropped from the LP to the pool."""
+        self.cuts[_cut_key(cut)] = [cut, 0]
+
+    def rows(self):
+        return [entry[0] for entry in self.cuts.values()]
+
+
+def _node_lp(problem, rows, warm_start, cutoff):
+    """
+    LP relaxation of one branch-and-bound node, re-solved from its parent's basis.
+
+    With node cuts on, a fractional optimum gets one round of Gomory cuts from its own
+    tableau (valid in the node's subtree) and violated cuts from the root pool.
+
+    Returns:
+    (status, value, x, basis, rows) - _solve's result and the node's rows, cuts included
+    """
+    c, A, b, Min, pool, node_cuts = problem
+    A_node, b_node = _with_rows(A, b, rows)
+    types = ['<='] * len(b_node)
+    status, value, x, basis = _solve(c, A_node, b_node, types, Min, warm_start=warm_start, cutoff=cutoff)
+    if not node_cuts or status != 'optimal' or np.allclose(x, np.round(x), atol=INTEGER_TOLERANCE):
+        return status, value, x, basis, rows
+    warm = _warm_engine(A_node, b_node, types, c if Min else -c, basis)
+    cuts = [] if warm is None else _gomory_cuts(warm[0], _integral_rows(A_node, b_node))
+    cuts += [cut for cut in pool if _violation(cut, x) > CUT_VIOLATION]
+    if not cuts:
+        return status, value, x, basis, rows
+    rows = rows + cuts[:CUTS_PER_ROUND]
+    A_node, b_node = _with_rows(A, b, rows)
+    status, value, x, basis = _solve(c, A_node, b_node, ['<='] * len(b_node), Min, warm_start=basis,
+                                     cutoff=cutoff)
+    return status, value, x, basis, rows
+
+
+# (problem, shared incumbent) of a branch-and-bound worker process
+_worker_state = None
+
+
+def _start_worker(problem, incumbent):
+    global _worker_state
+    _worker_state = (problem, incumbent)
+
+
+def _pooled_node_lp(rows, warm_start):
+    """Worker: a node LP that stops early once it cannot beat the shared incumbent."""
+    problem, incumbent = _worker_state
+    return _node_lp(problem, rows, warm_start, incumbent.value)
+
+
+class _Node:
+    """Open branch-and-bound node: the rows it adds to A and what its parent's LP left it."""
+
+    def __init__(self, rows, depth, bound, basis=None, branch=None):
+        # Branching rows and cuts, in the order the parent's basis expects
+        self.rows = rows
+        self.depth = depth
+        # Parent's minimized LP value, a lower bound on the node's
+        self.bound = bound
+        self.basis = basis
+        # (variable, direction, distance rounded) of the branch that made the node
+        self.branch = branch
+
+
+class BranchAndBound:
+    """
+    Branch-and-bound on max (or min) c·x s.t. A x <= b, x >= 0 and integer.
+
+    Open nodes sit in a priority queue. Until a first integer solution is found the
+    search dives depth first, children of the last node first; after that it takes
+    the node with the best bound, deeper nodes first among equal bounds. A node whose
+    bound cannot beat the incumbent is pruned unsolved. Branching picks the most
+    fractional variable, or the one whose pseudo-costs (the average objective loss per
+    unit of rounding seen so far in each direction) predict the largest loss in both
+    children.
+
+    A node's LP adds one bound row to its parent's and is re-solved from the parent's
+    basis by the dual simplex. With max_workers > 1 node LPs run on a process pool; the
+    incumbent is shared with the workers, whose dual simplex stops as soon as the
+    node can no longer beat it.
+
+    With cuts, a root loop first tightens the LP with rounds of Gomory mixed-integer
+    cuts: each round's cuts go to a deduplicating pool, the most violated pool cuts
+    join the LP, and cuts slack for CUT_AGE_LIMIT rounds leave it again. The loop
+    stops when no pool cut is violated or the bound stalls. With cuts='nodes' every
+    fractional node also gets a round of its own cuts and of violated pool cuts.
+
+    Parameters:
+    c : list - Objective function coefficients
+    A : 2D array or scipy.sparse matrix - Constraint coefficients
+    b : list - Right-hand side values
+    Min : bool - If True, minimize Z; if False (default), maximize Z
+    branching : str - 'pseudocost' (default) or 'most_fractional'
+    max_workers : int - Worker processes for node LPs (default 1: solve in-process)
+    mip_gap : float - Stop once the relative gap between incumbent and bound is this small
+    max_nodes : int - Stop after solving this many node LPs (default: no limit)
+    cuts : str - None (default), 'root' for the root cut loop, or 'nodes' for node cuts too
+    max_cut_rounds : int - Limit on rounds of the root cut loop
+    presolve : bool - Presolve the problem first (see presolve); the search then runs on
+        the reduced problem and its result is mapped back
+
+    Attributes:
+    nodes : int - Node LPs solved
+    pruned : int - Nodes discarded by bound without solving their LP
+    open_nodes : int - Nodes still queued or being solved
+    incumbent : float or None - Best integer objective value found
+    best_bound : float or None - Best objective any open node could still reach
+    gap : float - Relative gap |incumbent - best_bound| / |incumbent| (inf with no incumbent)
+    root_bound : float or None - Objective of the root LP before any cut
+    cut_bound : float or None - Objective of the root LP after the cut loop (root_bound without cuts)
+    cut_rounds : list - Per root cut round: cuts added, cuts in the LP, bound and improvement
+    presolved : Presolved or None - The presolve result, with its summary
+    """
+
+    def __init__(self, c, A, b, Min=False, branching='pseudocost', max_workers=1, mip_gap=0.0,
+                 max_nodes=None, cuts=None, max_cut_rounds=CUT_ROUNDS, presolve=True):
+        if branching not in ('pseudocost', 'most_fractional'):
+            raise ValueError(f"Unknown branching rule {branching!r}; use 'pseudocost' or 'most_fractional'.")
+        if cuts not in (None, 'root', 'nodes'):
+            raise ValueError(f"Unknown cut setting {cuts!r}; use None, 'root' or 'nodes'.")
+        self.c = np.array(c, dtype=float)
+        self.b = np.array(b, dtype=float)
+        self.A = _constraint_matrix(A, len(self.b), len(self.c))
+        self.Min = Min
+        self.original_c = self.c
+        # Objective of the original problem minus that of the searched one
+        self.offset = 0.0
+        self.presolved = None
+        if presolve:
+            self.presolved = _presolve(self.c, self.A, self.b, ['<='] * len(self.b), Min, integer=True)
+            if self.presolved.status == 'reduced':
+                self.c = self.presolved.c
+                self.A, self.b = self.presolved.inequalities()
+                self.offset = self.presolved.offset
+        self.branching = branching
+        self.max_workers = max_workers
+        self.mip_gap = mip_gap
+        self.max_nodes = max_nodes
+        self.cuts = cuts
+        self.max_cut_rounds = max_cut_rounds
+        self.nodes = 0
+        self.pruned = 0
+        self.open_nodes = 0
+        self.incumbent = None
+        self.best_bound = None
+        self.gap = float('inf')
+        self.root_bound = None
+        self.cut_bound = None
+        self.cut_rounds = []
+        # Objective loss per unit of rounding, summed and counted for each variable
+        # and direction (0 down, 1 up)
+        self._loss = np.zeros((2, len(self.c)))
+        self._count = np.zeros((2, len(self.c)))
+
+    def run(self, progress=None):
+        """
+        Parameters:
+        progress : callable - Called with this object every PROGRESS_INTERVAL nodes and at the end
+
+        Returns:
+        best_value : float - Optimal integer objective value (-inf, or inf when minimizing,
+            if there is no integer solution)
+        best_solution : array - Optimal integer solution
+        ("Problem is unbounded", None) if a relaxation is unbounded
+        """
+        if self.presolved is not None and self.presolved.status == 'infeasible':
+            return float('inf') if self.Min else float('-inf'), None
+        if self.presolved is not None and self.presolved.status == 'unbounded':
+            return "Problem is unbounded", None
+        if self.presolved is not None and self.presolved.status == 'solved':
+            solution = self.presolved.postsolve(np.zeros(0))
+            self.incumbent = self.best_bound = self.root_bound = self.cut_bound = float(self.original_c @ solution)
+            self.gap = 0.0
+            return self.incumbent, solution
+        if self.cuts is None:
+            root_rows, root_basis, pool = [], None, _CutPool()
+        else:
+            root_rows, root_basis, pool = self._root_cuts()
+        problem = (self.c, self.A, self.b, self.Min, pool.rows() if self.cuts == 'nodes' else [],
+                   self.cuts == 'nodes')
+        best = np.inf  # minimized incumbent: c·x when minimizing, -c·x when maximizing
+        best_solution = None
+        dive = [_Node(root_rows, 0, -np.inf, root_basis)]
+        heap = []
+        pending = {}
+        sequence = 0
+
+        if self.max_workers > 1:
+            incumbent = multiprocessing.Value('d', np.inf, lock=False)
+            executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=_start_worker,
+                                           initargs=(problem, incumbent))
+            window = 2 * self.max_workers
+        else:
+            incumbent = executor = None
+            window = 1
+        try:
+            while dive or heap or pending:
+                # --- Hand out nodes, diving before the first incumbent and best-bound after ---
+                while (dive or heap) and len(pending) < window:
+                    node = dive.pop() if dive else heapq.heappop(heap)[-1]
+                    if node.bound >= best - self._tolerance(best):
+                        self.pruned += 1
+                        continue
+                    cutoff = best - self._tolerance(best)
+                    if executor is None:
+                        future = Future()
+                        future.set_result(_node_lp(problem, node.rows, node.basis, cutoff))
+                    else:
+                        future = executor.submit(_pooled_node_lp, node.rows, node.basis)
+                    pending[future] = node
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = pending.pop(future)
+                    status, value, solution, basis, rows = future.result()
+                    self.nodes += 1
+                    if status == 'unbounded':
+                        return "Problem is unbounded", None
+                    if status != 'optimal':
+                        continue
+                    if self.root_bound is None:
+                        self.root_bound = self.cut_bound = value + self.offset
+                    value = value if self.Min else -value
+                    self._learn(node, value)
+                    if value >= best - self._tolerance(best):
+                        continue
+
+                    fractional = np.flatnonzero(~np.isclose(solution, np.round(solution), atol=INTEGER_TOLERANCE))
+                    if not len(fractional):
+                        best = value
+                        best_solution = solution.copy()
+                        if incumbent is not None:
+                            incumbent.value = best - self._tolerance(best)
+                        # First incumbent: the dive is over, its leftovers join the queue
+                        for leftover in dive:
+                            heapq.heappush(heap, (leftover.bound, -leftover.depth, sequence, leftover))
+                            sequence += 1
+                        dive.clear()
+                        continue
+
+                    # Branch: x_i <= floor(x_i) or -x_i <= -ceil(x_i), the nearer side explored first
+                    i = self._branch_variable(solution, fractional)
+                    fraction = solution[i] - np.floor(solution[i])
+                    children = [_Node(rows + [_bound(i, 1.0, np.floor(solution[i]))], node.depth + 1,
+                                      value, basis, (i, 0, fraction)),
+                                _Node(rows + [_bound(i, -1.0, -np.ceil(solution[i]))], node.depth + 1,
+                                      value, basis, (i, 1, 1.0 - fraction))]
+                    if fraction < 0.5:
+                        children.reverse()
+                    for child in children:
+                        if best_solution is None:
+                            dive.append(child)
+                        else:
+                            heapq.heappush(heap, (child.bound, -child.depth, sequence, child))
+                            sequence += 1
+
+                self._report(best, dive, heap, pending)
+                if progress is not None and self.nodes % PROGRESS_INTERVAL < len(done):
+                    progress(self)
+                if self.gap <= self.mip_gap or (self.max_nodes is not None and self.nodes >= self.max_nodes):
+                    break
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        self._report(best, dive, heap, pending)
+        if progress is not None:
+            progress(self)
+        if best_solution is None:
+            return float('inf') if self.Min else float('-inf'), None
+        if self.presolved is not None:
+            best_solution = self.presolved.postsolve(best_solution)
+        return float(self.original_c @ best_solution), best_solution
+
+    def stats(self):
+        """Node count, open nodes, incumbent, best bound, gap, root cut rounds and presolve summary so far."""
+        return {"nodes": self.nodes, "pruned": self.pruned, "open_nodes": self.open_nodes,
+                "incumbent": self.incumbent, "best_bound": self.best_bound, "gap": self.gap,
+                "root_bound": self.root_bound, "cut_bound": self.cut_bound,
+                "cut_rounds": list(self.cut_rounds),
+                "presolve": self.presolved.describe() if self.presolved is not None else None}
+
+    def _root_cuts(self):
+        """
+        Root cut loop, recording each round in cut_rounds.
+
+        Returns:
+        (rows, basis, pool) - cuts left in the root LP, its optimal basis (None if the
+        root LP is not optimal) and the pool of the remaining cuts
+        """
+        m = len(self.b)
+        cost = self.c if self.Min else -self.c
+        pool = _CutPool()
+        rows, ages = [], []
+        basis = previous = None
+        added = 0
+        for round_number in range(self.max_cut_rounds + 1):
+            A, b = _with_rows(self.A, self.b, rows)
+            types = ['<='] * len(b)
+            status, value, x, basis = _solve(self.c, A, b, types, self.Min, warm_start=basis)
+            if status != 'optimal':
+                return [], None, pool
+            if previous is None:
+                self.root_bound = value + self.offset
+            else:
+                self.cut_rounds.append({"round": round_number, "cuts": added, "active": len(rows),
+                                        "bound": value + self.offset,
+                                        "improvement": abs(value + self.offset - self.cut_bound)})
+            self.cut_bound = value + self.offset
+            bound = value if self.Min else -value
+            if (round_number == self.max_cut_rounds or np.allclose(x, np.round(x), atol=INTEGER_TOLERANCE)
+                    or (previous is not None and bound - previous <= CUT_TAILING_OFF * max(1.0, abs(bound)))):
+                break
+            previous = bound
+            warm = _warm_engine(A, b, types, cost, basis)
+            if warm is not None:
+                pool.add(_gomory_cuts(warm[0], _integral_rows(A, b)))
+
+            # --- Cuts slack for CUT_AGE_LIMIT rounds go back to the pool; their own
+            # slack is basic, so the basis just loses their rows ---
+            ages = [age + 1 if _violation(cut, x) < -CUT_VIOLATION else 0 for cut, age in zip(rows, ages)]
+            basic_rows = set(basis.rows.tolist())
+            kept = [k for k in range(len(rows)) if ages[k] < CUT_AGE_LIMIT or m + k not in basic_rows]
+            new = pool.separate(x)
+            if not new:
+                break
+            for k in set(range(len(rows))) - set(kept):
+                pool.put_back(rows[k])
+            renumber = np.full(len(b), -1)
+            renumber[np.concatenate([np.arange(m), m + np.array(kept, dtype=np.intp)])] = np.arange(m + len(kept))
+            basis = SimplexBasis(basis.variables, renumber[basis.rows][renumber[basis.rows] >= 0],
+                                 (m + len(kept), len(self.c)))
+            rows = [rows[k] for k in kept] + new
+            ages = [ages[k] for k in kept] + [0] * len(new)
+            added = len(new)
+        return rows, basis, pool
+
+    @staticmethod
+    def _tolerance(best):
+        return SIMPLEX_TOLERANCE * max(1.0, abs(best)) if np.isfinite(best) else 0.0
+
+    def _branch_variable(self, solution, fractional):
+        fraction = solution[fractional] - np.floor(solution[fractional])
+        if self.branching == 'most_fractional':
+            return fractional[np.argmax(np.minimum(fraction, 1.0 - fraction))]
+        # Product of the predicted losses of both children; a variable without
+        # history borrows the average pseudo-cost of the others in that direction
+        seen = self._count > 0
+        costs = np.where(seen, self._loss / np.maximum(self._count, 1), 0.0)
+        average = np.array([costs[k][seen[k]].mean() if seen[k].any() else 1.0 for k in range(2)])
+        costs = np.where(seen, costs, average[:, None])[:, fractional]
+        down = np.maximum(costs[0] * fraction, 1e-6)
+        up = np.maximum(costs[1] * (1.0 - fraction), 1e-6)
+        return fractional[np.argmax(down * up)]
+
+    def _learn(self, node, value):
+        """Updates the pseudo-cost of the branch that made this node from its LP value."""
+        if node.branch is None:
+            return
+        i, direction, distance = node.branch
+        self._loss[direction, i] += max(value - node.bound, 0.0) / max(distance, INTEGER_TOLERANCE)
+        self._count[direction, i] += 1
+
+    def _report(self, best, dive, heap, pending):
+        """Refreshes open_nodes, incumbent, best_bound and gap, in the caller's sense of Z."""
+        # Nodes that cannot beat the incumbent any more are as good as pruned
+        open_nodes = [node for node in list(dive) + [entry[-1] for entry in heap] + list(pending.values())
+                      if node.bound < best - self._tolerance(best)]
+        self.open_nodes = len(open_nodes)
+        bound = min((node.bound for node in open_nodes), default=best)
+        sense = 1.0 if self.Min else -1.0
+        self.incumbent = sense * best + self.offset if np.isfinite(best) else None
+        self.best_bound = sense * bound + self.offset if np.isfinite(bound) else None
+        if not np.isfinite(best):
+            self.gap = float('inf')
+        else:
+            self.gap = max(best - bound, 0.0) / max(abs(self.incumbent), 1e-10) if best != bound else 0.0
+
+
+def integer_simplex(c, A, b, Min=False, branching='pseudocost', max_workers=1, mip_gap=0.0, cuts=None):
+    """
+    Solves an Integer LPP using Branch-and-Bound with Simplex Method.
+
+    See BranchAndBound for the search; use it directly for node counts and the gap.
+
+    Parameters:
+    c : list - Objective function coefficients
+    A : 2D array or scipy.sparse matrix - Constraint coefficients; branching rows are
+        appended in the same (dense or sparse) form
+    b : list - Right-hand side values
+    Min : bool - If True, minimize Z; if False (default), maximize Z
+    branching : str - 'pseudocost' (default) or 'most_fractional'
+    max_workers : int - Worker processes for node LPs (default 1: solve in-process)
+    mip_gap : float - Relative gap at which to stop (default 0: prove optimality)
+    cuts : str - Gomory cuts: None (default), 'root', or 'nodes' for root and node cuts
+
+    Returns:
+    best_value : float - Optimal integer objective value
+    best_solution : array - Optimal integer solution
+    ("Problem is unbounded", None) if a relaxation is unbounded
+    """
+    return BranchAndBound(c, A, b, Min, branching=branching, max_workers=max_workers,
+                          mip_gap=mip_gap, cuts=cuts).run()
+
+
+def _result(status, value, x, basis, return_basis):
+    if status != 'optimal':
+        value, x = f"Problem is {status}", None
+    return (value, x, basis) if return_basis else (value, x)
+
+
+def simplex_method(c, A, b, integer=False, Min=False, warm_start=None, return_basis=False, presolve=True):
+    """
+    Solves a Linear Programming Problem using the revised simplex method.
+
+    Maximizes (or minimizes) c·x subject to A x <= b and x >= 0. A right-hand side
+    below zero is handled by a first phase that finds a feasible basis.
+
+    Parameters:
+    c : list or array - Coefficients of the objective function
+    A : 2D list or array, scipy.sparse matrix or (values, (rows, cols)) triple -
+        Coefficients of the constraints (left-hand side); sparse input stays sparse
+    b : list or array - Right-hand side values of the constraints
+    integer : bool - If True, use integer simplex; if False (default), regular simplex
+    Min : bool - If True, minimize Z; if False (default), maximize Z
+    warm_start : SimplexBasis - Optimal basis of an earlier solve with the same
+        variables, returned with return_basis. After right-hand side edits or
+        appended rows the dual simplex repairs it, after objective edits the primal
+        simplex re-optimizes it; otherwise the solve starts over.
+    return_basis : bool - Also return the optimal SimplexBasis (None if not optimal)
+    presolve : bool - Reduce and scale the problem first (default True); skipped when
+        a basis is passed or requested, as bases refer to the original rows
+
+    Returns:
+    optimal_value : float - Optimal value of the objective function
+    solution : array - Values of the decision variables
+    ("Problem is unbounded", None) or ("Problem is infeasible", None) otherwise
+    """
+    if integer:
+        return integer_simplex(c, A, b, Min=Min)
+    if presolve and warm_start is None and not return_basis:
+        return _result(*_presolved_solve(c, A, b, ['<='] * len(b), Min), return_basis)
+    return _result(*_solve(c, A, b, ['<='] * len(b), Min, warm_start=warm_start), return_basis)
+
+
+def big_m_method(c, A, b, constraint_types, Min=False, warm_start=None, return_basis=False, presolve=True):
+    """
+    Solves an LPP using the Big M Method.
+
+    Parameters:
+    c : list - Objective function coefficients (e.g., [3, 2])
+    A : 2D array, scipy.sparse matrix or (values, (rows, cols)) triple - Constraint
+        coefficients (e.g., [[2, 1], [1, 2]])
+    b : list - Right-hand side values (e.g., [8, 6])
+    constraint_types : list - Types of constraints ('<=', '>=', '=')
+    Min : bool - If True, minimize Z; if False (default), maximize Z
+    warm_start : SimplexBasis - Optimal basis of an earlier solve, as for simplex_method;
+        a repaired basis needs no artificials, so no Big M pass is made
+    return_basis : bool - Also return the optimal SimplexBasis (None if not optimal)
+    presolve : bool - Reduce and scale the problem first (default True); skipped when
+        a basis is passed or requested
+
+    Returns:
+    optimal_value : float - Optimal value of Z
+    solution : array - Values of decision variables
+    ("Problem is unbounded", None) or ("Problem is infeasible", None) otherwise
+    """
+    if presolve and warm_start is None and not return_basis:
+        return _result(*_presolved_solve(c, A, b, constraint_types, Min, big_m=BIG_M), return_basis)
+    return _result(*_solve(c, A, b, constraint_types, Min, big_m=BIG_M, warm_start=warm_start),
+                   return_basis)
+
+
+def two_phase_method(c, A, b, constraint_types, Min=False, warm_start=None, return_basis=False, presolve=True):
+    """
+    Solves an LPP with >=, <= and = constraints using the two-phase simplex method.
+
+    Phase I minimizes the sum of the artificial variables alone; a positive minimum
+    proves the problem infeasible. Phase II drops the artificials and optimizes the
+    real objective from the feasible basis Phase I left, so no penalty M has to
+    outweigh the costs and infeasibility is never confused with a large optimum.
+
+    Parameters:
+    c : list - Objective function coefficients (e.g., [3, 2])
+    A : 2D array, scipy.sparse matrix or (values, (rows, cols)) triple - Constraint
+        coefficients (e.g., [[2, 1], [1, 2]])
+    b : list - Right-hand side values (e.g., [8, 6])
+    constraint_types : list - Types of constraints ('<=', '>=', '=')
+    Min : bool - If True, minimize Z; if False (default), maximize Z
+    warm_start : SimplexBasis - Optimal basis of an earlier solve, as for simplex_method
+    return_basis : bool - Also return the optimal SimplexBasis (None if not optimal);
+        its phase_one_iterations tell the pivots of each phase apart
+    presolve : bool - Reduce and scale the problem first (default True); skipped when
+        a basis is passed or requested
+
+    Returns:
+    optimal_value : float - Optimal value of Z
+    solution : array - Values of decision variables
+    ("Problem is unbounded", None) or ("Problem is infeasible", None) otherwise
+    """
+    if presolve and warm_start is None and not return_basis:
+        return _result(*_presolved_solve(c, A, b, constraint_types, Min), return_basis)
+    return _result(*_solve(c, A, b, constraint_types, Min, warm_start=warm_start), return_basis)
@@ -0,0 +1,626 @@
+import gzip
+import json
+import os
+import re
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from scipy import sparse
+
+from .interior_point import interior_point_method
+from .linear_programming import big_m_method, integer_simplex, simplex_method, two_phase_method
+
+# Solvers a LinearModel can be handed to, by name
+METHODS = {
+    'simplex': simplex_method,
+    'big_m': big_m_method,
+    'two_phase': two_phase_method,
+    'interior_point': interior_point_method,
+    'integer': integer_simplex,
+}
+# Model file suffixes picked up by solve_model_files
+MODEL_SUFFIXES = (".mps", ".lp", ".mps.gz", ".lp.gz")
+
+_SENSES = {'L': '<=', 'G': '>=', 'E': '='}
+_MPS_SECTIONS = {'NAME', 'OBJSENSE', 'ROWS', 'COLUMNS', 'RHS', 'RANGES', 'BOUNDS', 'ENDATA'}
+_LP_SECTION = re.compile(r"\s*(maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|subject\s+to|such\s+that|s\.?t\.?"
+                         r"|bounds?|generals?|gen|integers?|binary|binaries|bin|semi-continuous|semis?|sos|end)"
+                         r"(?=\s|$)", re.I)
+_LP_TOKEN = re.compile(r"\s*(?:(?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)|(?P<op><=|>=|=<|=>|<|>|=)"
+                       r"|(?P<sign>[+-])|(?P<colon>:)|(?P<name>[^\s:+\-<>=\d.][^\s:+\-<>=]*))")
+_LP_OPS = {'<=': '<=', '=<': '<=', '<': '<=', '>=': '>=', '=>': '>=', '>': '>=', '=': '='}
+
+
+class LinearModel:
+    """
+    An LP or integer program read from an MPS or LP file: optimize c·x subject to
+    A x (constraint_types) b and x >= 0, with the file's variable bounds appended as rows.
+
+    Attributes:
+    name : str - Model name (from the file, else empty)
+    c : array - Objective coefficients
+    A : scipy.sparse.csr_matrix - Constraint coefficients
+    b : array - Right-hand side values
+    constraint_types : list - '<=', '>=' or '=' per row
+    Min : bool - Whether the objective is minimized
+    integer : array - Mask of the integer variables
+    offset : float - Constant term of the objective
+    variables : list - Variable names, in column order
+    constraints : list - Row names; bound rows are named '<variable>.lower' and so on
+    """
+
+    def __init__(self, name, c, A, b, constraint_types, Min, integer, offset, variables, constraints):
+        self.name = name
+        self.c = c
+        self.A = A
+        self.b = b
+        self.constraint_types = constraint_types
+        self.Min = Min
+        self.integer = integer
+        self.offset = offset
+        self.variables = variables
+        self.constraints = constraints
+
+    def inequalities(self):
+        """
+        The model as A x <= b for simplex_method and integer_simplex: '>=' rows are
+        negated and '=' rows become a pair of opposite rows.
+
+        Returns:
+        (c, A, b) - A stays sparse
+        """
+        types = np.asarray(self.constraint_types)
+        signs = np.where(types == '>=', -1.0, 1.0)
+        equal = np.flatnonzero(types == '=')
+        A = sparse.vstack([sparse.diags(signs) @ self.A, -self.A[equal]], format="csr")
+        return self.c, A, np.concatenate([signs * self.b, -self.b[equal]])
+
+    def default_method(self):
+        """
+        'integer' when every variable is integer, else 'simplex' when every row is
+        '<=', else 'two_phase': Big M's fixed penalty is too small for the large
+        coefficients that imported models often have, and it then misreports them.
+
+        integer_simplex makes every variable integer, so a mixed-integer model gets an
+        LP method, which relaxes its integrality (see relaxed_integers).
+        """
+        if len(self.integer) and self.integer.all():
+            return 'integer'
+        return 'simplex' if all(t == '<=' for t in self.constraint_types) else 'two_phase'
+
+    def relaxed_integers(self, method):
+        """Number of integer variables that method solves as continuous."""
+        return 0 if method == 'integer' else int(self.integer.sum())
+
+    def solve(self, method=None, **options):
+        """
+        Solves the model with one of the METHODS.
+
+        Parameters:
+        method : str - Key of METHODS (default: default_method())
+        **options : Further keyword arguments for the solver
+
+        Returns:
+        optimal_value : float - Optimal value, including the objective's constant term
+        solution : array - Values of the variables
+        ("Problem is unbounded", None) or ("Problem is infeasible", None) otherwise
+        """
+        method = method or self.default_method()
+        if method not in METHODS:
+            raise ValueError(f"Unknown method '{method}'; choose one of {', '.join(METHODS)}.")
+        if method == 'integer':
+            if not self.integer.all():
+                raise ValueError(f"integer_simplex makes every variable integer, but only "
+                                 f"{self.integer.sum()} of {len(self.integer)} are.")
+            value, x = integer_simplex(*self.inequalities(), Min=self.Min, **options)
+            if x is None and not isinstance(value, str):
+                value = "Problem is infeasible"
+        elif method == 'simplex':
+            value, x = simplex_method(*self.inequalities(), Min=self.Min, **options)
+        else:
+            value, x = METHODS[method](self.c, self.A, self.b, self.constraint_types, Min=self.Min, **options)
+        if x is not None:
+            value = float(value) + self.offset
+        return value, x
+
+
+class _Builder:
+    """Collects a model's coefficients as they are read; nothing is densified."""
+
+    def __init__(self):
+        self.name = ""
+        self.Min = True
+        self.columns = {}
+        self.rows = {}
+        self.types = []
+        self.rhs = {}
+        self.ranges = {}
+        self.objective = {}
+        self.offset = 0.0
+        self.lower = {}
+        self.upper = {}
+        self.integer = set()
+        self.entry_rows = array('q')
+        self.entry_columns = array('q')
+        self.entry_values = array('d')
+
+    def column(self, name):
+        return self.columns.setdefault(name, len(self.columns))
+
+    def row(self, name, sense, line):
+        if name in self.rows:
+            raise ValueError(f"Line {line}: row '{name}' is defined twice.")
+        self.rows[name] = len(self.types)
+        self.types.append(sense)
+        return self.rows[name]
+
+    def add(self, row, column, value):
+        self.entry_rows.append(row)
+        self.entry_columns.append(column)
+        self.entry_values.append(value)
+
+    def build(self):
+        m, n = len(self.types), len(self.columns)
+        variables = list(self.columns)
+        constraints = list(self.rows)
+        A = sparse.csr_matrix((np.frombuffer(self.entry_values), (np.frombuffer(self.entry_rows, dtype=np.int64),
+                                                                   np.frombuffer(self.entry_columns, dtype=np.int64))),
+                              shape=(m, n))
+        A.sum_duplicates()
+        b = np.zeros(m)
+        for row, value in self.rhs.items():
+            b[row] = value
+        types = list(self.types)
+        blocks, rhs = [A], [b]
+
+        # A ranged row keeps its own sense and gets a copy bounding it from the other side
+        if self.ranges:
+            ranged = np.array(sorted(self.ranges))
+            copies, ends = [], []
+            for row in ranged:
+                width = self.ranges[row]
+                if types[row] == '<=' or (types[row] == '=' and width < 0):
+                    types[row] = '<='
+                    copies.append('>=')
+                    ends.append(b[row] - abs(width))
+                else:
+                    types[row] = '>='
+                    copies.append('<=')
+                    ends.append(b[row] + abs(width))
+                constraints.append(f"{constraints[row]}.range")
+            blocks.append(A[ranged])
+            rhs.append(np.array(ends))
+            types += copies
+
+        # Bounds other than x >= 0 become rows
+        bound_columns, bound_values = [], []
+        for j, variable in enumerate(variables):
+            lower, upper = self.lower.get(j, 0.0), self.upper.get(j, np.inf)
+            if lower < 0:
+                raise ValueError(f"Variable '{variable}' has a negative lower bound; the solvers need x >= 0.")
+            if lower == upper:
+                bound = [('=', lower, 'fixed')]
+            else:
+                bound = ([('>=', lower, 'lower')] if lower > 0 else []) + \
+                        ([('<=', upper, 'upper')] if np.isfinite(upper) else [])
+            for sense, value, kind in bound:
+                bound_columns.append(j)
+                bound_values.append(value)
+                types.append(sense)
+                constraints.append(f"{variable}.{kind}")
+        if bound_columns:
+            k = len(bound_columns)
+            blocks.append(sparse.csr_matrix((np.ones(k), (np.arange(k), bound_columns)), shape=(k, n)))
+            rhs.append(np.array(bound_values))
+
+        c = np.zeros(n)
+        for j, value in self.objective.items():
+            c[j] += value
+        integer = np.zeros(n, dtype=bool)
+        integer[list(self.integer)] = True
+        return LinearModel(self.name, c, sparse.vstack(blocks, format="csr"), np.concatenate(rhs), types,
+                           self.Min, integer, self.offset, variables, constraints)
+
+
+def _lines(source):
+    """(number, text) of each line of a path (gzip by suffix) or a text or binary file object."""
+    if isinstance(source, (str, os.PathLike)):
+        opener = gzip.open if str(source).lower().endswith(".gz") else open
+        with opener(source, "rt") as stream:
+            yield from enumerate(stream, 1)
+        return
+    for number, line in enumerate(source, 1):
+        yield number, line.decode() if isinstance(line, bytes) else line
+
+
+def _number(token, line):
+    try:
+        return float(token)
+    except ValueError:
+        raise ValueError(f"Line {line}: expected a number, found '{token}'.") from None
+
+
+def read_mps(source):
+    """
+    Reads a free-format MPS file line by line into a LinearModel.
+
+    Supports the NAME, OBJSENSE, ROWS, COLUMNS (with INTORG/INTEND markers), RHS,
+    RANGES and BOUNDS sections. The first N row is the objective; further N rows are
+    dropped. A right-hand side on the objective row sets its constant term to minus
+    that value. Variables must keep x >= 0: MI and FR bounds are rejected.
+
+    Parameters:
+    source : str or file - Path (gzip-compressed if it ends in .gz) or file object
+
+    Returns:
+    LinearModel (minimized unless OBJSENSE says MAX)
+    """
+    model = _Builder()
+    section = None
+    objective = None
+    free_rows = set()
+    integer = False
+    for line, text in _lines(source):
+        if not text.strip() or text.startswith('*'):
+            continue
+        tokens = text.split()
+        if not text[0].isspace():
+            section = tokens[0].upper()
+            if section not in _MPS_SECTIONS:
+                raise ValueError(f"Line {line}: unsupported MPS section '{tokens[0]}'.")
+            if section == 'NAME':
+                model.name = " ".join(tokens[1:])
+            elif section == 'OBJSENSE' and len(tokens) > 1:
+                model.Min = not tokens[1].upper().startswith('MAX')
+            elif section == 'ENDATA':
+                break
+            continue
+
+        if section == 'OBJSENSE':
+            model.Min = not tokens[0].upper().startswith('MAX')
+        elif section == 'ROWS':
+            kind, name = tokens[0].upper(), tokens[1]
+            if kind == 'N':
+                if objective is None:
+                    objective = name
+                else:
+                    free_rows.add(name)
+            elif kind in _SENSES:
+                model.row(name, _SENSES[kind], line)
+            else:
+                raise ValueError(f"Line {line}: unknown row type '{tokens[0]}'.")
+        elif section == 'COLUMNS':
+            if len(tokens) >= 3 and tokens[1].strip("'\"").upper() == 'MARKER':
+                marker = tokens[2].strip("'\"").upper()
+                integer = marker == 'INTORG' if marker in ('INTORG', 'INTEND') else integer
+                continue
+            j = model.column(tokens[0])
+            if integer:
+                model.integer.add(j)
+            for k in range(1, len(tokens) - 1, 2):
+                row, value = tokens[k], _number(tokens[k + 1], line)
+                if row == objective:
+                    model.objective[j] = model.objective.get(j, 0.0) + value
+                elif row in model.rows:
+                    model.add(model.rows[row], j, value)
+                elif row not in free_rows:
+                    raise ValueError(f"Line {line}: column '{tokens[0]}' refers to unknown row '{row}'.")
+        elif section in ('RHS', 'RANGES'):
+            # The set name in front of the (row, value) pairs is optional in free MPS
+            for k in range(len(tokens) % 2, len(tokens) - 1, 2):
+                row, value = tokens[k], _number(tokens[k + 1], line)
+                if row == objective and section == 'RHS':
+                    model.offset = -value
+                elif row in model.rows:
+                    (model.rhs if section == 'RHS' else model.ranges)[model.rows[row]] = value
+                elif row not in free_rows:
+                    raise ValueError(f"Line {line}: unknown row '{row}' in {section}.")
+        elif section == 'BOUNDS':
+            kind = tokens[0].upper()
+            valued = kind in ('UP', 'LO', 'FX', 'LI', 'UI')
+            if kind not in ('UP', 'LO', 'FX', 'LI', 'UI', 'FR', 'MI', 'PL', 'BV'):
+                raise ValueError(f"Line {line}: unsupported bound type '{tokens[0]}'.")
+            # The bound set name is optional too; the column is the last name before the value
+            names = tokens[1:-1] if valued else [t for t in tokens[1:] if t in model.columns] or tokens[1:]
+            if not names:
+                raise ValueError(f"Line {line}: bound without a column.")
+            j = model.column(names[-1])
+            value = _number(tokens[-1], line) if valued else None
+            if kind in ('LI', 'UI', 'BV'):
+                model.integer.add(j)
+            if kind in ('LO', 'LI', 'FX'):
+                model.lower[j] = value
+            if kind in ('UP', 'UI', 'FX'):
+                if value < 0 and j not in model.lower:
+                    model.lower[j] = -np.inf
+                model.upper[j] = value
+            if kind in ('FR', 'MI'):
+                model.lower[j] = -np.inf
+            if kind == 'BV':
+                model.lower[j], model.upper[j] = 0.0, 1.0
+        else:
+            raise ValueError(f"Line {line}: data outside of a section.")
+    return model.build()
+
+
+class _LpStatement:
+    """Terms, sense and right-hand side of one LP-file objective or constraint, fed token by token."""
+
+    def __init__(self):
+        self.label = None
+        self.terms = []
+        self.constant = 0.0
+        self.sign = 1.0
+        self.coefficient = None
+        self.sense = None
+        self.rhs = None
+
+    def empty(self):
+        return not self.terms and self.coefficient is None and self.sense is None and self.sign == 1.0
+
+    def feed(self, kind, token, line):
+        """Takes the next token; returns True once the right-hand side is read."""
+        if self.sense is not None:
+            if kind == 'sign':
+                self.sign *= -1.0 if token == '-' else 1.0
+                return False
+            if kind == 'number' or (kind == 'name' and token.lower() in ('inf', 'infinity')):
+                self.rhs = self.sign * float(token)
+                return True
+            raise ValueError(f"Line {line}: expected a right-hand side value, found '{token}'.")
+        if kind == 'sign':
+            self._close_constant()
+            self.sign *= -1.0 if token == '-' else 1.0
+        elif kind == 'number':
+            if self.coefficient is not None:
+                raise ValueError(f"Line {line}: two numbers in a row ('{token}').")
+            self.coefficient = float(token)
+        elif kind == 'name':
+            self.terms.append((token, self.sign * (1.0 if self.coefficient is None else self.coefficient)))
+            self.sign, self.coefficient = 1.0, None
+        elif kind == 'op':
+            self._close_constant()
+            self.sense = _LP_OPS[token]
+            self.sign = 1.0
+        return False
+
+    def _close_constant(self):
+        if self.coefficient is not None:
+            self.constant += self.sign * self.coefficient
+            self.sign, self.coefficient = 1.0, None
+
+
+def _lp_tokens(text, line):
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _LP_TOKEN.match(text, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Line {line}: cannot read '{text[position:].strip()}'.")
+        position = match.end()
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+    return tokens
+
+
+def _lp_bound(model, tokens, line):
+    """One line of the Bounds section: x free, x op v, v op x or v op x op v."""
+    items = []
+    sign = 1.0
+    for kind, token in tokens:
+        if kind == 'sign':
+            sign *= -1.0 if token == '-' else 1.0
+        elif kind == 'number' or (kind == 'name' and token.lower() in ('inf', 'infinity')):
+            items.append(('value', sign * float(token)))
+            sign = 1.0
+        elif kind == 'name':
+            items.append(('name', token))
+        elif kind == 'op':
+            items.append(('op', _LP_OPS[token]))
+        else:
+            raise ValueError(f"Line {line}: unexpected '{token}' in a bound.")
+    kinds = [kind for kind, _ in items]
+    values = [value for _, value in items]
+    if kinds == ['name', 'name'] and values[1].lower() == 'free':
+        model.lower[model.column(values[0])] = -np.inf
+        return
+    if kinds == ['value', 'op', 'name', 'op', 'value'] and values[1] == values[3] != '=':
+        j = model.column(values[2])
+        low, high = (values[0], values[4]) if values[1] == '<=' else (values[4], values[0])
+        model.lower[j], model.upper[j] = low, high
+        return
+    if kinds == ['value', 'op', 'name']:
+        values = [values[2], {'<=': '>=', '>=': '<=', '=': '='}[values[1]], values[0]]
+    elif kinds != ['name', 'op', 'value']:
+        raise ValueError(f"Line {line}: cannot read this bound.")
+    j = model.column(values[0])
+    if values[1] in ('>=', '='):
+        model.lower[j] = values[2]
+    if values[1] in ('<=', '='):
+        model.upper[j] = values[2]
+
+
+def read_lp(source):
+    """
+    Reads a CPLEX LP file line by line into a LinearModel.
+
+    Supports the objective (Maximize/Minimize), Subject To, Bounds, Generals and
+    Binaries sections, with backslash comments and constraints spread over several
+    lines. Variables must keep x >= 0: free and negative lower bounds are rejected.
+
+    Parameters:
+    source : str or file - Path (gzip-compressed if it ends in .gz) or file object
+
+    Returns:
+    LinearModel
+    """
+    model = _Builder()
+    section = None
+    statement = _LpStatement()
+
+    def finish(line):
+        nonlocal statement
+        if section == 'objective':
+            for name, value in statement.terms:
+                j = model.column(name)
+                model.objective[j] = model.objective.get(j, 0.0) + value
+            statement._close_constant()
+            model.offset += statement.constant
+        elif not statement.empty():
+            if statement.rhs is None:
+                raise ValueError(f"Line {line}: constraint '{statement.label or ''}' has no right-hand side.")
+            row = model.row(statement.label or f"R{len(model.types) + 1}", statement.sense, line)
+            for name, value in statement.terms:
+                model.add(row, model.column(name), value)
+            model.rhs[row] = statement.rhs - statement.constant
+        statement = _LpStatement()
+
+    for line, text in _lines(source):
+        text = text.split('\\', 1)[0]
+        if not text.strip():
+            continue
+        keyword = _LP_SECTION.match(text)
+        if keyword:
+            if section in ('objective', 'constraints'):
+                finish(line)
+            word = re.sub(r"\s+", " ", keyword.group(1).lower())
+            if word.startswith('max') or word.startswith('min'):
+                section = 'objective'
+                model.Min = word.startswith('min')
+            elif word in ('subject to', 'such that', 'st', 's.t.', 's.t', 'st.'):
+                section = 'constraints'
+            elif word.startswith('bound'):
+                section = 'bounds'
+            elif word.startswith(('gen', 'integer')):
+                section = 'generals'
+            elif word.startswith('bin'):
+                section = 'binaries'
+            elif word == 'end':
+                break
+            else:
+                raise ValueError(f"Line {line}: unsupported LP section '{keyword.group(1)}'.")
+            text = text[keyword.end():]
+            if not text.strip():
+                continue
+
+        tokens = _lp_tokens(text, line)
+        if section in ('objective', 'constraints'):
+            for k, (kind, token) in enumerate(tokens):
+                if kind == 'colon':
+                    continue
+                if (kind == 'name' and k + 1 < len(tokens) and tokens[k + 1][0] == 'colon'):
+                    if section == 'constraints' and not statement.empty():
+                        raise ValueError(f"Line {line}: constraint '{token}' starts before the last one ended.")
+                    statement.label = token
+                    continue
+                if statement.feed(kind, token, line) and section == 'constraints':
+                    finish(line)
+        elif section == 'bounds':
+            _lp_bound(model, tokens, line)
+        elif section in ('generals', 'binaries'):
+            for kind, token in tokens:
+                if kind != 'name':
+                    raise ValueError(f"Line {line}: expected variable names, found '{token}'.")
+                j = model.column(token)
+                model.integer.add(j)
+                if section == 'binaries':
+                    model.lower[j], model.upper[j] = 0.0, 1.0
+        else:
+            raise ValueError(f"Line {line}: text before the objective section.")
+    else:
+        if section in ('objective', 'constraints'):
+            finish(line)
+    return model.build()
+
+
+def read_model(source, fmt=None):
+    """
+    Reads an MPS or CPLEX LP file into a LinearModel.
+
+    Parameters:
+    source : str or file - Path (gzip-compressed if it ends in .gz) or file object
+    fmt : str - 'mps' or 'lp' (default: from the file name, else mps)
+    """
+    if fmt is None:
+        name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+        fmt = "lp" if str(name).lower().removesuffix(".gz").endswith(".lp") else "mps"
+    if fmt not in ("mps", "lp"):
+        raise ValueError(f"Unknown model format '{fmt}'; use 'mps' or 'lp'.")
+    return read_mps(source) if fmt == "mps" else read_lp(source)
+
+
+def _status(value, solution):
+    if solution is not None:
+        return 'optimal'
+    return value.removeprefix("Problem is ") if isinstance(value, str) else 'infeasible'
+
+
+def solve_model_file(path, out_dir, method=None, name=None):
+    """
+    Worker: reads and solves one model file and writes <out_dir>/<name>.json.
+
+    The JSON holds the model and method names, the status ('optimal', 'infeasible',
+    'unbounded' or 'error' with a message), the objective value, the variable values
+    by name, the number of integer variables solved as continuous (relaxed_integers),
+    the model size and the seconds spent reading and solving.
+
+    Parameters:
+    name : str - Model name, and path of its result under out_dir (default: the file name)
+
+    Returns:
+    The result dictionary that was written, without the variable values
+    """
+    start = time.perf_counter()
+    name = name or os.path.basename(path)
+    result = {"model": name, "method": method}
+    try:
+        model = read_model(path)
+        result.update(name=model.name, rows=model.A.shape[0], columns=model.A.shape[1],
+                      nonzeros=int(model.A.nnz), read_seconds=time.perf_counter() - start)
+        result["method"] = method = method or model.default_method()
+        result["relaxed_integers"] = model.relaxed_integers(method)
+        value, solution = model.solve(method)
+        result["status"] = _status(value, solution)
+        result["objective"] = value if solution is not None else None
+        result["variables"] = (dict(zip(model.variables, solution.tolist())) if solution is not None else None)
+    except Exception as error:
+        result.update(status='error', error=f"{type(error).__name__}: {error}")
+    result["seconds"] = time.perf_counter() - start
+    out_path = os.path.join(out_dir, name + ".json")
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, "w") as stream:
+        json.dump(result, stream, indent=2)
+    result.pop("variables", None)
+    return result
+
+
+def solve_model_files(paths, out_dir, method=None, max_workers=None, root=None):
+    """
+    Solves model files across a process pool, yielding each summary as it is ready.
+
+    Each worker reads its own file, so no model is pickled between processes. Results
+    mirror the files' paths below root, so models of the same name in different
+    subdirectories keep separate results.
+
+    Parameters:
+    paths : iterable - MPS or LP file paths
+    out_dir : str - Directory for the per-model .json results (created if needed)
+    method : str - Key of METHODS for every model (default: each model's default_method())
+    max_workers : int - Worker processes (default: CPU count)
+    root : str - Directory the result paths are relative to (default: the files' common directory)
+
+    Returns:
+    Generator of the solve_model_file summaries, in completion order
+    """
+    paths = [os.fspath(path) for path in paths]
+    if not paths:
+        return
+    if root is None:
+        root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in paths])
+    names = [os.path.relpath(os.path.abspath(path), os.path.abspath(root)) for path in paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(solve_model_file, path, out_dir, method, name) for path, name in zip(paths, names)]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,398 @@
+import numpy as np
+from scipy import sparse
+
+# Passes of the reduction loop; each pass repeats every reduction once
+PRESOLVE_PASSES = 8
+# Absolute tolerance for presolve feasibility tests and fixed bounds
+PRESOLVE_TOLERANCE = 1e-9
+# Rounds of geometric-mean row and column scaling
+SCALING_PASSES = 4
+
+
+def _row_sums(csr, values):
+    """Per-row sums of values laid out like csr.data (0 for empty rows)."""
+    return np.bincount(np.repeat(np.arange(csr.shape[0]), np.diff(csr.indptr)), weights=values,
+                       minlength=csr.shape[0])
+
+
+def _activities(csr, lower, upper):
+    """
+    Least and greatest value of each row's a·x over lower <= x <= upper.
+
+    Returns:
+    (least, greatest) - ±inf where an unbounded variable can move the row that way
+    """
+    columns = csr.indices
+    low = np.where(csr.data > 0, csr.data * lower[columns], csr.data * upper[columns])
+    high = np.where(csr.data > 0, csr.data * upper[columns], csr.data * lower[columns])
+    least = np.where(_row_sums(csr, np.isinf(low)) > 0, -np.inf, _row_sums(csr, np.where(np.isinf(low), 0.0, low)))
+    greatest = np.where(_row_sums(csr, np.isinf(high)) > 0, np.inf,
+                        _row_sums(csr, np.where(np.isinf(high), 0.0, high)))
+    return least, greatest
+
+
+def _implied_upper(csr, row_high, lower):
+    """
+    Upper bound on each variable that the rows' <= sides imply when x >= lower is the
+    only other bound (inf where they imply none).
+    """
+    least, _ = _activities(csr, lower, np.full(len(lower), np.inf))
+    rows = np.repeat(np.arange(csr.shape[0]), np.diff(csr.indptr))
+    a = csr.data
+    with np.errstate(invalid='ignore'):
+        bound = lower[csr.indices] + (row_high[rows] - least[rows]) / a
+    usable = (a > 0) & np.isfinite(bound)
+    implied = np.full(len(lower), np.inf)
+    np.minimum.at(implied, csr.indices[usable], bound[usable])
+    return implied
+
+
+def _geometric_scales(csr):
+    """
+    Power-of-two row and column factors that bring every row's and column's largest
+    and smallest magnitude towards 1 (geometric mean scaling); exact in floating point.
+    """
+    m, n = csr.shape
+    row_scale, column_scale = np.ones(m), np.ones(n)
+    if not csr.nnz:
+        return row_scale, column_scale
+    rows = np.repeat(np.arange(m), np.diff(csr.indptr))
+    magnitude = np.abs(csr.data)
+    for _ in range(SCALING_PASSES):
+        scaled = magnitude * row_scale[rows] * column_scale[csr.indices]
+        high = np.zeros(m)
+        low = np.full(m, np.inf)
+        np.maximum.at(high, rows, scaled)
+        np.minimum.at(low, rows, scaled)
+        present = high > 0
+        row_scale[present] /= np.sqrt(high[present] * low[present])
+        scaled = magnitude * row_scale[rows] * column_scale[csr.indices]
+        high = np.zeros(n)
+        low = np.full(n, np.inf)
+        np.maximum.at(high, csr.indices, scaled)
+        np.minimum.at(low, csr.indices, scaled)
+        present = high > 0
+        column_scale[present] /= np.sqrt(high[present] * low[present])
+    return np.exp2(np.round(np.log2(row_scale))), np.exp2(np.round(np.log2(column_scale)))
+
+
+def _tolerances(row_low, row_high):
+    """Feasibility tolerance of each row interval, relative to its finite ends."""
+    ends = np.maximum(np.abs(np.where(np.isinf(row_low), 0.0, row_low)),
+                      np.abs(np.where(np.isinf(row_high), 0.0, row_high)))
+    return PRESOLVE_TOLERANCE * np.maximum(1.0, ends)
+
+
+def _spread(csr):
+    """Ratio of the largest to the smallest coefficient magnitude."""
+    magnitude = np.abs(csr.data[csr.data != 0])
+    return float(magnitude.max() / magnitude.min()) if len(magnitude) else 1.0
+
+
+class Presolved:
+    """
+    Reduced copy of an LP, with the postsolve stack that maps its solutions back.
+
+    Attributes:
+    c, A, b, constraint_types - The reduced problem; A is sparse if the input was
+    status : str - 'reduced', 'solved' (no variable left, postsolve(empty) is optimal),
+        'unbounded' (no row left, and a variable whose cost improves without limit)
+        or 'infeasible'
+    offset : float - c·x of the original problem minus c·x of the reduced one at any
+        pair of matching solutions (removed and shifted variables)
+    summary : dict - Counts of each reduction, sizes before and after, and the
+        coefficient spread (largest / smallest magnitude) before and after scaling
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.status = 'reduced'
+        self.offset = 0.0
+        self.stack = []
+        self.summary = {}
+
+    def postsolve(self, x):
+        """Original variables from a solution of the reduced problem, undoing the stack in reverse."""
+        x = np.asarray(x, dtype=float)
+        for kind, data in reversed(self.stack):
+            if kind == 'scale':
+                x = x * data
+            elif kind == 'shift':
+                x = x + data
+            else:
+                kept, fixed_columns, fixed_values, n = data
+                full = np.zeros(n)
+                full[kept] = x
+                full[fixed_columns] = fixed_values
+                x = full
+        return x
+
+    def describe(self):
+        """One-line account of the reductions, for display."""
+        summary = self.summary
+        if self.status == 'infeasible':
+            return "the problem is infeasible"
+        if self.status == 'unbounded':
+            return "the problem is unbounded"
+        removed = [f"{summary[key]} {label}" for key, label in
+                   (("empty_rows", "empty"), ("singleton_rows", "singleton"),
+                    ("duplicate_rows", "duplicate"), ("redundant_rows", "redundant")) if summary[key]]
+        parts = [f"{summary['rows_before']}×{summary['columns_before']} → "
+                 f"{summary['rows_after']}×{summary['columns_after']}"]
+        if removed:
+            parts.append("rows removed: " + ", ".join(removed))
+        if summary["fixed_columns"]:
+            parts.append(f"{summary['fixed_columns']} variables fixed")
+        if summary["tightened_bounds"]:
+            parts.append(f"{summary['tightened_bounds']} bounds tightened")
+        parts.append(f"coefficient spread {summary['spread_before']:.3g} → {summary['spread_after']:.3g}")
+        return "; ".join(parts)
+
+    def inequalities(self):
+        """(A, b) of the reduced problem with every row as a <= row."""
+        types = np.asarray(self.constraint_types)
+        A = sparse.csr_matrix(self.A)
+        equal = np.flatnonzero(types == '=')
+        sign = np.where(types == '>=', -1.0, 1.0)
+        A_le = sparse.vstack([sparse.diags(sign) @ A, -A[equal]], format="csr")
+        b_le = np.concatenate([sign * self.b, -self.b[equal]])
+        return (A_le if sparse.issparse(self.A) else A_le.toarray()), b_le
+
+
+def presolve(c, A, b, constraint_types, Min=False, integer=False):
+    """
+    Reduces max (or min) c·x s.t. A x (types) b, x >= 0 before the simplex sees it.
+
+    Repeats until nothing changes: empty rows are checked and dropped; singleton rows
+    become bounds on their variable; variables with equal bounds, or with an empty
+    column and a cost that pushes them to a bound, are fixed and substituted;
+    duplicate rows (equal up to a factor) are merged; rows that the variable bounds
+    already satisfy are dropped; and bounds implied by the rows fix variables and, for
+    integer problems, tighten to whole numbers. Bounds are then turned back into a
+    shift of each variable and <= rows, the latter only where the remaining rows do
+    not already imply the bound, and rows and columns of continuous problems are
+    scaled by powers of two towards unit geometric mean.
+
+    Parameters:
+    c : list or array - Objective function coefficients
+    A : 2D list or array, or scipy.sparse matrix - Constraint coefficients
+    b : list or array - Right-hand side values
+    constraint_types : list - Types of constraints ('<=', '>=', '=')
+    Min : bool - If True, minimize Z; if False (default), maximize Z
+    integer : bool - All variables are integer: bounds are rounded, nothing is scaled
+
+    Returns:
+    Presolved
+    """
+    c = np.asarray(c, dtype=float)
+    b = np.asarray(b, dtype=float)
+    if not sparse.issparse(A):
+        A = np.asarray(A, dtype=float).reshape(len(b), len(c))
+    m, n = A.shape
+    types = np.asarray(constraint_types)
+    cost = c if Min else -c
+    result = Presolved(n)
+    counts = {"empty_rows": 0, "singleton_rows": 0, "duplicate_rows": 0, "redundant_rows": 0,
+              "fixed_columns": 0, "tightened_bounds": 0}
+    result.summary = {"rows_before": m, "columns_before": n}
+    matrix = sparse.csr_matrix(A, dtype=float)
+    matrix.sum_duplicates()
+    matrix.eliminate_zeros()
+    result.summary["spread_before"] = _spread(matrix)
+
+    # Each row as an interval row_low <= a·x <= row_high
+    row_low = np.where(types == '<=', -np.inf, b)
+    row_high = np.where(types == '>=', np.inf, b)
+    # Bounds that end up in the reduced problem, and the tighter ones the rows imply
+    lower, upper = np.zeros(n), np.full(n, np.inf)
+    rows, columns = np.arange(m), np.arange(n)
+    fixed_columns, fixed_values = [], []
+
+    def infeasible():
+        result.status = 'infeasible'
+        result.summary.update(counts)
+        return result
+
+    def fix(keep_columns, values):
+        nonlocal matrix, columns, lower, upper, cost, c, row_low, row_high
+        drop = ~keep_columns
+        shift = matrix[:, drop] @ values[drop]
+        row_low, row_high = row_low - shift, row_high - shift
+        result.offset += c[drop] @ values[drop]
+        fixed_columns.extend(columns[drop])
+        fixed_values.extend(values[drop])
+        counts["fixed_columns"] += int(drop.sum())
+        matrix = matrix[:, keep_columns]
+        columns, lower, upper = columns[keep_columns], lower[keep_columns], upper[keep_columns]
+        cost, c = cost[keep_columns], c[keep_columns]
+
+    def keep(keep_rows):
+        nonlocal matrix, rows, row_low, row_high
+        matrix = matrix[keep_rows]
+        rows, row_low, row_high = rows[keep_rows], row_low[keep_rows], row_high[keep_rows]
+
+    for _ in range(PRESOLVE_PASSES):
+        size = (len(rows), len(columns), float(np.sum(upper < np.inf)), float(lower.sum()))
+
+        # --- Empty rows: 0 must lie in the interval ---
+        nonzeros = np.diff(matrix.indptr)
+        empty = nonzeros == 0
+        tolerance = _tolerances(row_low, row_high)
+        if np.any((row_low[empty] > tolerance[empty]) | (row_high[empty] < -tolerance[empty])):
+            return infeasible()
+        counts["empty_rows"] += int(empty.sum())
+
+        # --- Singleton rows: a bound on their only variable ---
+        singleton = np.flatnonzero(nonzeros == 1)
+        for r in singleton:
+            j = matrix.indices[matrix.indptr[r]]
+            a = matrix.data[matrix.indptr[r]]
+            low, high = (row_low[r] / a, row_high[r] / a) if a > 0 else (row_high[r] / a, row_low[r] / a)
+            if integer:
+                low, high = np.ceil(low - PRESOLVE_TOLERANCE), np.floor(high + PRESOLVE_TOLERANCE)
+            lower[j], upper[j] = max(lower[j], low), min(upper[j], high)
+        counts["singleton_rows"] += len(singleton)
+        keep(nonzeros > 1)
+        if np.any(lower > upper + PRESOLVE_TOLERANCE * np.maximum(1.0, np.abs(lower))):
+            return infeasible()
+
+        # --- Duplicate rows: scaled to a leading 1, equal rows merge their intervals ---
+        if len(rows):
+            lead = matrix.data[matrix.indptr[:-1]]
+            normal = sparse.diags(1.0 / lead) @ matrix
+            low = np.where(lead > 0, row_low, row_high) / lead
+            high = np.where(lead > 0, row_high, row_low) / lead
+            groups = {}
+            for r in range(len(rows)):
+                entries = slice(normal.indptr[r], normal.indptr[r + 1])
+                key = (normal.indices[entries].tobytes(), np.round(normal.data[entries], 12).tobytes())
+                groups.setdefault(key, []).append(r)
+            duplicates = np.zeros(len(rows), dtype=bool)
+            for members in groups.values():
+                if len(members) > 1:
+                    first = members[0]
+                    low[first] = max(low[r] for r in members)
+                    high[first] = min(high[r] for r in members)
+                    duplicates[members[1:]] = True
+            if np.any(low > high + _tolerances(low, high)):
+                return infeasible()
+            if duplicates.any():
+                counts["duplicate_rows"] += int(duplicates.sum())
+                matrix = normal.tocsr()
+                row_low, row_high = low, high
+                keep(~duplicates)
+
+        # --- Redundant rows: the kept bounds already keep a·x inside the interval ---
+        least, greatest = _activities(matrix, lower, upper)
+        tolerance = _tolerances(row_low, row_high)
+        if np.any((least > row_high + tolerance) | (greatest < row_low - tolerance)):
+            return infeasible()
+        row_low = np.where(least >= row_low - tolerance, -np.inf, row_low)
+        row_high = np.where(greatest <= row_high + tolerance, np.inf, row_high)
+        redundant = np.isinf(row_low) & np.isinf(row_high)
+        counts["redundant_rows"] += int(redundant.sum())
+        keep(~redundant)
+
+        # --- Bounds implied by the rows: fix pinned variables, round integer ones ---
+        implied_lower, implied_upper = lower.copy(), upper.copy()
+        if len(rows):
+            least, greatest = _activities(matrix, lower, upper)
+            entry_rows = np.repeat(np.arange(len(rows)), np.diff(matrix.indptr))
+            a = matrix.data
+            j = matrix.indices
+            with np.errstate(invalid='ignore'):
+                # a x_j <= high - (least - a's own least term), so x_j <= (a > 0) or >= (a < 0)
+                # its least-term value + (high - least) / a; likewise from low and greatest
+                from_high = np.where(a > 0, lower[j], upper[j]) + (row_high[entry_rows] - least[entry_rows]) / a
+                from_low = np.where(a > 0, upper[j], lower[j]) + (row_low[entry_rows] - greatest[entry_rows]) / a
+            usable_high = np.isfinite(from_high)
+            usable_low = np.isfinite(from_low)
+            np.minimum.at(implied_upper, j[usable_high & (a > 0)], from_high[usable_high & (a > 0)])
+            np.maximum.at(implied_lower, j[usable_high & (a < 0)], from_high[usable_high & (a < 0)])
+            np.maximum.at(implied_lower, j[usable_low & (a > 0)], from_low[usable_low & (a > 0)])
+            np.minimum.at(implied_upper, j[usable_low & (a < 0)], from_low[usable_low & (a < 0)])
+        if integer:
+            rounded_lower = np.ceil(implied_lower - PRESOLVE_TOLERANCE)
+            rounded_upper = np.floor(implied_upper + PRESOLVE_TOLERANCE)
+            if np.any(rounded_lower > rounded_upper):
+                return infeasible()
+            # Rounding cuts off fractional points the rows allow, so those bounds are
+            # worth keeping as real bounds
+            tighter_lower = rounded_lower > implied_lower + PRESOLVE_TOLERANCE
+            tighter_upper = rounded_upper < implied_upper - PRESOLVE_TOLERANCE
+            counts["tightened_bounds"] += int(tighter_lower.sum() + tighter_upper.sum())
+            lower = np.where(tighter_lower, rounded_lower, lower)
+            upper = np.where(tighter_upper, rounded_upper, upper)
+            implied_lower, implied_upper = rounded_lower, rounded_upper
+        elif np.any(implied_lower > implied_upper + PRESOLVE_TOLERANCE * np.maximum(1.0, np.abs(implied_lower))):
+            return infeasible()
+
+        # --- Fixed variables, and empty columns whose cost pushes them to a bound ---
+        values = np.where(implied_upper - implied_lower <= PRESOLVE_TOLERANCE * np.maximum(1.0, np.abs(implied_lower)),
+                          implied_lower, np.nan)
+        empty_column = np.diff(matrix.tocsc().indptr) == 0
+        values = np.where(empty_column & (cost >= 0) & np.isnan(values), lower, values)
+        values = np.where(empty_column & (cost < 0) & np.isfinite(upper) & np.isnan(values), upper, values)
+        pinned = ~np.isnan(values)
+        if pinned.any():
+            fix(~pinned, np.where(pinned, values, 0.0))
+
+        if (len(rows), len(columns), float(np.sum(upper < np.inf)), float(lower.sum())) == size:
+            break
+
+    # --- Rows the last fixes emptied ---
+    empty = np.diff(matrix.indptr) == 0
+    tolerance = _tolerances(row_low, row_high)
+    if np.any((row_low[empty] > tolerance[empty]) | (row_high[empty] < -tolerance[empty])):
+        return infeasible()
+    counts["empty_rows"] += int(empty.sum())
+    keep(~empty)
+
+    result.stack.append(('columns', (columns, np.array(fixed_columns, dtype=np.intp),
+                                     np.array(fixed_values, dtype=float), n)))
+
+    # --- Bounds back into the problem: x = lower + x', and x' <= upper - lower rows
+    # only for the bounds the remaining rows do not imply on their own, so the
+    # reduced problem never has more rows than the original ---
+    implied = _implied_upper(matrix, row_high, lower)
+    if integer:
+        implied = np.floor(implied + PRESOLVE_TOLERANCE)
+    slack = PRESOLVE_TOLERANCE * np.maximum(1.0, np.abs(np.where(np.isfinite(upper), upper, 0.0)))
+    bounded = np.flatnonzero(upper < implied - slack)
+    if np.any(lower != 0):
+        shift = matrix @ lower
+        row_low, row_high = row_low - shift, row_high - shift
+        result.offset += c @ lower
+        result.stack.append(('shift', lower.copy()))
+    bound_rows = sparse.csr_matrix((np.ones(len(bounded)), (np.arange(len(bounded)), bounded)),
+                                   shape=(len(bounded), len(columns)))
+    matrix = sparse.vstack([matrix, bound_rows], format="csr")
+    row_low = np.concatenate([row_low, np.full(len(bounded), -np.inf)])
+    row_high = np.concatenate([row_high, upper[bounded] - lower[bounded]])
+
+    # --- Geometric mean scaling; integer problems stay unscaled, so columns keep
+    # their integrality and rows with integer data their integer slacks ---
+    if not integer:
+        row_scale, column_scale = _geometric_scales(matrix)
+        matrix = sparse.csr_matrix(sparse.diags(row_scale) @ matrix @ sparse.diags(column_scale))
+        row_low, row_high = row_low * row_scale, row_high * row_scale
+        result.stack.append(('scale', column_scale))
+        c = c * column_scale
+
+    # --- Intervals back to rows: one row per finite side, one '=' row when they meet ---
+    equal = row_low == row_high
+    upper_side = np.isfinite(row_high) & ~equal
+    lower_side = np.isfinite(row_low) & ~equal
+    order = np.concatenate([np.flatnonzero(equal), np.flatnonzero(upper_side), np.flatnonzero(lower_side)])
+    result.A = matrix[order] if sparse.issparse(A) else matrix[order].toarray()
+    result.b = np.concatenate([row_high[equal], row_high[upper_side], row_low[lower_side]])
+    result.constraint_types = ['='] * int(equal.sum()) + ['<='] * int(upper_side.sum()) + ['>='] * int(lower_side.sum())
+    result.c = c
+    if not len(columns):
+        result.status = 'solved'
+    elif not len(result.b):
+        result.status = 'unbounded'
+    counts["rows_after"], counts["columns_after"] = len(result.b), len(columns)
+    counts["spread_after"] = _spread(matrix)
+    result.summary.update(counts)
+    return result
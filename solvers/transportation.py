@@ -0,0 +1,1277 @@
+import math
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse.csgraph import maximum_bipartite_matching, min_weight_full_bipartite_matching
+
+# Candidate cells are screened this many at a time in the least cost walk
+LCM_CHUNK = 4096
+# Relative tolerance below which a reduced cost counts as negative in MODI
+MODI_TOLERANCE = 1e-9
+# Cost entries the auction prices in one NumPy block (and hands one worker thread)
+AUCTION_BLOCK = 1 << 22
+# Cheapest destinations the auction remembers per source between full row scans
+AUCTION_CANDIDATES = 8
+
+
+class _Lanes:
+    """
+    Allowed source -> destination lanes of a transportation problem, by lane id.
+
+    A dense cost matrix allows every lane and numbers them row-major (id = i*n + j)
+    without copying the matrix; a sparse matrix allows only its stored entries,
+    numbered in CSR order.
+
+    A dummy source (row m) or dummy destination (column n) balancing the problem is
+    given by its lane costs. For a dense matrix it stays virtual: its lanes take the
+    ids after the matrix's own and their costs live in a separate array.
+    """
+
+    def __init__(self, cost_matrix, dummy_row=None, dummy_col=None):
+        self.dummy = None
+        self.dummy_axis = None
+        if sparse.issparse(cost_matrix):
+            csr = cost_matrix.tocsr()
+            rows, cols = self.real_shape = csr.shape
+            # A sparse dummy line costs only m or n extra stored entries
+            if dummy_col is not None:
+                line = sparse.csr_matrix((dummy_col, (np.arange(rows), np.zeros(rows, dtype=int))),
+                                         shape=(rows, 1))
+                csr = sparse.hstack((csr, line), format="csr")
+            elif dummy_row is not None:
+                line = sparse.csr_matrix((dummy_row, (np.zeros(cols, dtype=int), np.arange(cols))),
+                                         shape=(1, cols))
+                csr = sparse.vstack((csr, line), format="csr")
+            csr.sum_duplicates()
+            self.m, self.n = csr.shape
+            self.dense = None
+            self.cost = csr.data
+            self._row = np.repeat(np.arange(self.m), np.diff(csr.indptr))
+            self._col = csr.indices
+            self._indptr = csr.indptr
+            self.base = len(self.cost)
+        else:
+            self.dense = np.asarray(cost_matrix, dtype=float)
+            self.m, self.n = self.real_shape = self.dense.shape
+            self.width = self.n
+            self.cost = self.dense.reshape(-1)
+            self.base = len(self.cost)
+            if dummy_row is not None:
+                self.dummy, self.dummy_axis = np.asarray(dummy_row, dtype=float), 0
+                self.m += 1
+            elif dummy_col is not None:
+                self.dummy, self.dummy_axis = np.asarray(dummy_col, dtype=float), 1
+                self.n += 1
+        self.count = self.base + (len(self.dummy) if self.dummy is not None else 0)
+        self._orders = {}
+
+    def costs(self, ids):
+        """Unit costs of lanes ids (array or single id)."""
+        if self.dummy is None:
+            return self.cost[ids]
+        if np.ndim(ids) == 0:
+            return self.dummy[ids - self.base] if ids >= self.base else self.cost[ids]
+        virtual = ids >= self.base
+        values = self.cost[np.where(virtual, 0, ids)]
+        values[virtual] = self.dummy[ids[virtual] - self.base]
+        return values
+
+    def rows(self, ids):
+        if self.dense is None:
+            return self._row[ids]
+        if self.dummy is None:
+            return ids // self.width
+        if self.dummy_axis == 0:
+            return np.where(ids >= self.base, self.m - 1, ids // self.width)
+        return np.where(ids >= self.base, ids - self.base, ids // self.width)
+
+    def cols(self, ids):
+        if self.dense is None:
+            return self._col[ids]
+        if self.dummy is None:
+            return ids % self.width
+        if self.dummy_axis == 0:
+            return np.where(ids >= self.base, ids - self.base, ids % self.width)
+        return np.where(ids >= self.base, self.width, ids % self.width)
+
+    def lane(self, i, j):
+        """Lane id of cell (i, j), or -1 when the lane is not allowed."""
+        if self.dense is not None:
+            if self.dummy is not None and self.dummy_axis == 0 and i == self.m - 1:
+                return self.base + j
+            if self.dummy is not None and self.dummy_axis == 1 and j == self.width:
+                return self.base + i
+            return i * self.width + j
+        start, stop = self._indptr[i], self._indptr[i + 1]
+        k = start + np.searchsorted(self._col[start:stop], j)
+        return int(k) if k < stop and self._col[k] == j else -1
+
+    def lookup(self, rows, cols):
+        """Lane ids of cells (rows, cols), all of which must be allowed lanes."""
+        if self.dense is None:
+            return np.searchsorted(self._row * self.n + self._col, rows * self.n + cols)
+        ids = rows * self.width + cols
+        if self.dummy is not None:
+            if self.dummy_axis == 0:
+                ids = np.where(rows == self.m - 1, self.base + cols, ids)
+            else:
+                ids = np.where(cols == self.width, self.base + rows, ids)
+        return ids
+
+    def by_row(self):
+        """Lane ids grouped by row, each row sorted by (cost, col), with row pointers."""
+        if "row" not in self._orders:
+            if self.dense is not None:
+                order = self._dense_order(by_col=False)
+                if self.dummy is not None and self.dummy_axis == 0:
+                    order = np.concatenate((order, self.base + np.argsort(self.dummy, kind="stable")))
+                self._orders["row"] = (order, np.arange(0, self.count + 1, self.n))
+            else:
+                order = np.lexsort((self._col, self.cost, self._row))
+                self._orders["row"] = (order, self._indptr)
+        return self._orders["row"]
+
+    def by_col(self):
+        """Lane ids grouped by column, each column sorted by (cost, row), with pointers."""
+        if "col" not in self._orders:
+            if self.dense is not None:
+                order = self._dense_order(by_col=True)
+                if self.dummy is not None and self.dummy_axis == 1:
+                    order = np.concatenate((order, self.base + np.argsort(self.dummy, kind="stable")))
+                self._orders["col"] = (order, np.arange(0, self.count + 1, self.m))
+            else:
+                order = np.lexsort((self._row, self.cost, self._col))
+                indptr = np.concatenate(([0], np.cumsum(np.bincount(self._col, minlength=self.n))))
+                self._orders["col"] = (order, indptr)
+        return self._orders["col"]
+
+    def _dense_order(self, by_col):
+        """
+        Lane ids of each matrix row (or column), sorted by cost. A dummy line crossing
+        them joins every one last among equal costs, as its index is the highest.
+        """
+        lines = self.dense.T if by_col else self.dense
+        count, length = lines.shape
+        order = np.argsort(lines, axis=1, kind="stable")
+        index = np.arange(count)[:, None]
+        order = order * self.width + index if by_col else order + index * self.width
+        if self.dummy is None or self.dummy_axis != (0 if by_col else 1):
+            return order.reshape(-1)
+        at = np.count_nonzero(lines <= self.dummy[:, None], axis=1)
+        slot = np.arange(length + 1)
+        order = np.take_along_axis(order, np.minimum(slot - (slot > at[:, None]), length - 1), axis=1)
+        order[np.arange(count), at] = self.base + np.arange(count)
+        return order.reshape(-1)
+
+    def by_cost(self):
+        """Lane ids with a cost below inf, sorted by cost with row-major ties."""
+        if self.dummy is None:
+            order = np.argsort(self.cost, kind="stable")
+            return order[:np.count_nonzero(self.cost < np.inf)]
+        costs = np.concatenate((self.cost, self.dummy))
+        if self.dummy_axis == 0:
+            order = np.argsort(costs, kind="stable")
+        else:
+            # Row-major position of every lane with the dummy column in place
+            ids = np.arange(self.base)
+            position = np.concatenate((ids + ids // self.width,
+                                       np.arange(len(self.dummy)) * self.n + self.width))
+            order = np.lexsort((position, costs))
+        return order[:np.count_nonzero(costs < np.inf)]
+
+    def reduced(self, start, stop, u, v):
+        """Reduced costs c - u - v of lanes start..stop (dense blocks are whole rows)."""
+        parts = []
+        if self.dense is not None and start < self.base:
+            r0, r1 = start // self.width, min(stop, self.base) // self.width
+            parts.append((self.dense[r0:r1] - u[r0:r1, None] - v[None, :self.width]).reshape(-1))
+            start = min(stop, self.base)
+        if start < stop:
+            ids = np.arange(start, stop)
+            parts.append(self.costs(ids) - u[self.rows(ids)] - v[self.cols(ids)])
+        return parts[0] if len(parts) == 1 else np.concatenate(parts)
+
+    def block_size(self):
+        """Pricing block: about sqrt(lanes), in whole matrix rows when dense."""
+        size = max(1, int(math.sqrt(self.count)))
+        if self.dense is not None:
+            size = max(1, size // self.width) * self.width
+        return size
+
+    def submatrix(self, rows, cols):
+        """Costs of every cell in rows × cols of a dense problem (both sorted)."""
+        if self.dummy is None:
+            return self.dense[np.ix_(rows, cols)]
+        if self.dummy_axis == 0:
+            real = rows[rows < self.m - 1]
+            block = self.dense[np.ix_(real, cols)]
+            return np.vstack((block, self.dummy[cols][None, :])) if len(real) < len(rows) else block
+        real = cols[cols < self.width]
+        block = self.dense[np.ix_(rows, real)]
+        return np.hstack((block, self.dummy[rows][:, None])) if len(real) < len(cols) else block
+
+    def scale(self):
+        """Largest finite absolute unit cost, at least 1."""
+        largest = 1.0
+        for values in (self.cost, self.dummy if self.dummy is not None else np.zeros(0)):
+            finite = values[np.isfinite(values)]
+            if finite.size:
+                largest = max(largest, float(np.abs(finite).max()))
+        return largest
+
+
+class _Pointers:
+    """
+    Pointers to the two cheapest live lanes of every row (or column) for Vogel's method.
+
+    Lines keep their lanes sorted by cost once; a pointer only moves forward, so the
+    penalty of a line is recomputed only when one of its two cheapest lanes dies.
+    """
+
+    def __init__(self, lanes, order, indptr, other_end, other_live):
+        self.lanes = lanes
+        self.order = order
+        self.ends = indptr[1:]
+        self.other_end = other_end
+        self.other_live = other_live
+        self.first = indptr[:-1].copy()
+        self.second = np.minimum(self.first + 1, self.ends)
+
+    def _advance(self, lines, pos):
+        pos = pos.copy()
+        ends = self.ends[lines]
+        pending = np.flatnonzero(pos < ends)
+        while pending.size:
+            stale = ~self.other_live[self.other_end(self.order[pos[pending]])]
+            pending = pending[stale]
+            pos[pending] += 1
+            pending = pending[pos[pending] < ends[pending]]
+        return pos
+
+    def _lane_at(self, lines, pos):
+        inside = pos < self.ends[lines]
+        lanes = np.full(len(lines), -1)
+        lanes[inside] = self.order[pos[inside]]
+        return lanes
+
+    def refresh(self, lines):
+        """Moves the pointers of lines past dead lanes; returns their two cheapest costs."""
+        first = self._advance(lines, self.first[lines])
+        second = self._advance(lines, np.maximum(self.second[lines], first + 1))
+        self.first[lines], self.second[lines] = first, second
+        values = []
+        for lane in (self._lane_at(lines, first), self._lane_at(lines, second)):
+            value = np.full(len(lines), np.inf)
+            value[lane >= 0] = self.lanes.costs(lane[lane >= 0])
+            values.append(value)
+        return values
+
+    def exhausted(self, lines):
+        return self.first[lines] >= self.ends[lines]
+
+    def cheapest(self, line):
+        """Lane id of the cheapest live lane of one line."""
+        return self.order[self.first[line]]
+
+    def touching(self, lines, other):
+        """The lines among lines whose two cheapest live lanes include the other end."""
+        hit = np.zeros(len(lines), dtype=bool)
+        for pos in (self.first[lines], self.second[lines]):
+            lane = self._lane_at(lines, pos)
+            hit |= (lane >= 0) & (self.other_end(np.maximum(lane, 0)) == other)
+        return lines[hit]
+
+
+def _vogel(lanes, supply, demand):
+    """
+    Vogel's approximation method on the allowed lanes.
+
+    Returns:
+    cells : dict - {(row, col): quantity} in allocation order
+    supply, demand : array - What is left unallocated (nonzero only when the remaining
+        sources have no allowed lane to the remaining destinations)
+    """
+    supply = supply.copy()
+    demand = demand.copy()
+    m, n = lanes.m, lanes.n
+    cells = {}
+
+    row_live = np.ones(m, dtype=bool)
+    col_live = np.ones(n, dtype=bool)
+    rows = _Pointers(lanes, *lanes.by_row(), lanes.cols, col_live)
+    cols = _Pointers(lanes, *lanes.by_col(), lanes.rows, row_live)
+    row_pen = np.zeros(m)
+    col_pen = np.zeros(n)
+
+    def refresh_rows(lines):
+        v1, v2 = rows.refresh(lines)
+        # Rows with fewer than two finite costs get a zero penalty; rows with no
+        # live lane left cannot be picked at all
+        with np.errstate(invalid="ignore"):
+            row_pen[lines] = np.where(np.isfinite(v1) & np.isfinite(v2), v2 - v1, 0.0)
+        row_pen[lines[rows.exhausted(lines)]] = -np.inf
+
+    def refresh_cols(lines):
+        w1, w2 = cols.refresh(lines)
+        # Columns follow the partition-based OTTools penalty: inf with one
+        # finite cost left, nan with none
+        with np.errstate(invalid="ignore"):
+            col_pen[lines] = w2 - w1
+
+    refresh_rows(np.arange(m))
+    refresh_cols(np.arange(n))
+
+    while np.any(supply > 0) and np.any(demand > 0):
+        max_row_pen = row_pen.max()
+        max_col_pen = np.nanmax(col_pen) if not np.all(np.isnan(col_pen)) else -np.inf
+        if max_row_pen == -np.inf and max_col_pen == -np.inf:
+            break
+
+        if max_row_pen >= max_col_pen:
+            row = int(np.argmax(row_pen))
+            col = int(lanes.cols(rows.cheapest(row)))
+        else:
+            col = int(np.nanargmax(col_pen))
+            row = int(lanes.rows(cols.cheapest(col)))
+
+        alloc = min(supply[row], demand[col])
+        cells[row, col] = alloc
+        supply[row] -= alloc
+        demand[col] -= alloc
+
+        if supply[row] == 0:
+            row_live[row] = False
+            row_pen[row] = -np.inf
+            refresh_cols(cols.touching(np.flatnonzero(col_live), row))
+        else:
+            col_live[col] = False
+            col_pen[col] = np.nan
+            refresh_rows(rows.touching(np.flatnonzero(row_live), col))
+
+    return cells, supply, demand
+
+
+def _north_west_cells(supply, demand):
+    """North-west corner staircase over the positive supplies and demands."""
+    rows, cols = np.flatnonzero(supply > 0), np.flatnonzero(demand > 0)
+    supply = supply[rows].tolist()
+    demand = demand[cols].tolist()
+    cells = {}
+    i, j = 0, 0
+    while i < len(rows) and j < len(cols):
+        amount = min(supply[i], demand[j])
+        cells[int(rows[i]), int(cols[j])] = amount
+        supply[i] -= amount
+        demand[j] -= amount
+        if supply[i] <= 0:
+            i += 1
+        else:
+            j += 1
+    return cells
+
+
+def _stranded_error():
+    return ValueError("No feasible allocation uses only the allowed lanes.")
+
+
+class _NetworkSimplex:
+    """
+    Transportation MODI on an explicit basis tree.
+
+    Sources are nodes 0..m-1 and destinations m..m+n-1, rooted at node 0. Every
+    non-root node stores the basic cell joining it to its parent (flow and cost)
+    and its depth; the thread keeps all nodes in preorder with subtree sizes, so
+    any subtree is one contiguous slice. A pivot walks the closed loop up the tree
+    and only re-hangs, re-prices and re-threads the subtree cut off by the leaving
+    cell.
+
+    Cells outside the allowed lanes may be basic as virtual cells priced at a big-M
+    cost; they never re-enter, and flow left on one means the problem is infeasible.
+    """
+
+    def __init__(self, lanes):
+        self.lanes = lanes
+        self.m, self.n = lanes.m, lanes.n
+        size = self.m + self.n
+        self.parent = [-1] * size
+        self.flow = [0.0] * size
+        self.arc_cost = [0.0] * size
+        self.depth = np.zeros(size, dtype=np.intp)
+        self.thread = np.arange(size)
+        self.position = np.arange(size)
+        self.subtree_size = np.ones(size, dtype=np.intp)
+        self.potential = np.zeros(size)
+        self.iterations = 0
+
+        scale = lanes.scale()
+        self.tolerance = MODI_TOLERANCE * scale
+        self.virtual_cost = (scale + 1.0) * size
+        self.block_size = lanes.block_size()
+        self.next_block = 0
+
+    def cell(self, node):
+        """Basic cell (row, col) joining a non-root node to its parent."""
+        other = self.parent[node]
+        return (node, other - self.m) if node < self.m else (other, node - self.m)
+
+    def cell_cost(self, i, j):
+        lane = self.lanes.lane(i, j)
+        return float(self.lanes.costs(lane)) if lane >= 0 else self.virtual_cost
+
+    def build(self, cells):
+        """Builds a spanning tree from a forest of cells {(row, col): quantity}."""
+        edges = [cell for cell, quantity in cells.items() if quantity > 0]
+        edges += self._connecting_cells(edges)
+        self._grow(edges, cells)
+
+    def restart(self, basis, supply, demand):
+        """
+        Rebuilds a previous basis tree for new supply and demand.
+
+        Costs may have changed, so potentials are recomputed along the tree; flows are
+        whatever the new supply and demand force onto it. When some are negative but
+        the old potentials are still dual feasible, dual pivots repair the flows.
+
+        Returns:
+        False when the tree is neither primal nor dual feasible, True otherwise
+        """
+        self._grow([(int(i), int(j)) for i, j in basis], {})
+        residual = np.concatenate((supply, demand)).astype(float).tolist()
+        for node in reversed(self.thread[1:].tolist()):
+            self.flow[node] = residual[node]
+            residual[self.parent[node]] -= residual[node]
+        if min(self.flow[1:]) >= -self.tolerance:
+            return True
+        if any(self._reduced(start, min(start + self.block_size, self.lanes.count)).min() < -self.tolerance
+               for start in range(0, self.lanes.count, self.block_size)):
+            return False
+        self.repair()
+        return True
+
+    def _grow(self, edges, cells):
+        m, n = self.m, self.n
+
+        neighbours = [[] for _ in range(m + n)]
+        for i, j in edges:
+            neighbours[i].append(m + j)
+            neighbours[m + j].append(i)
+
+        order = []
+        stack = [0]
+        seen = [False] * (m + n)
+        seen[0] = True
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            for other in neighbours[node]:
+                if not seen[other]:
+                    seen[other] = True
+                    self.parent[other] = node
+                    self.depth[other] = self.depth[node] + 1
+                    i, j = self.cell(other)
+                    cost = self.cell_cost(i, j)
+                    self.flow[other] = float(cells.get((i, j), 0.0))
+                    self.arc_cost[other] = cost
+                    self.potential[other] = cost - self.potential[node]
+                    stack.append(other)
+        self.thread = np.array(order)
+        self.position[self.thread] = np.arange(m + n)
+        for node in reversed(order[1:]):
+            self.subtree_size[self.parent[node]] += self.subtree_size[node]
+
+    def _connecting_cells(self, edges):
+        """Zero-flow cells joining the components of a degenerate basis to node 0's."""
+        m, n = self.m, self.n
+        lanes = self.lanes
+        label = np.arange(m + n)
+
+        def find(node):
+            while label[node] != node:
+                label[node] = label[label[node]]
+                node = label[node]
+            return node
+
+        for i, j in edges:
+            label[find(i)] = find(m + j)
+        roots = np.array([find(node) for node in range(m + n)])
+        main = roots == roots[0]
+        components = [np.flatnonzero(roots == root) for root in np.unique(roots[~main])]
+        # Components with a destination first, so the main tree has one before
+        # isolated sources need it
+        components.sort(key=lambda nodes: nodes[-1] < m)
+
+        extra = []
+        for nodes in components:
+            # Cheapest allowed lane from the component's last node into the main
+            # tree, or a virtual cell when there is none
+            if nodes[-1] >= m:
+                j = nodes[-1] - m
+                order, indptr = lanes.by_col()
+                candidates = lanes.rows(order[indptr[j]:indptr[j + 1]])
+                linked = candidates[main[candidates]]
+                i = linked[0] if linked.size else np.flatnonzero(main[:m])[0]
+            else:
+                i = nodes[0]
+                order, indptr = lanes.by_row()
+                candidates = lanes.cols(order[indptr[i]:indptr[i + 1]])
+                linked = candidates[main[m + candidates]]
+                j = linked[0] if linked.size else np.flatnonzero(main[m:])[0]
+            extra.append((int(i), int(j)))
+            main[nodes] = True
+        return extra
+
+    def _reduced(self, start, stop):
+        return self.lanes.reduced(start, stop, self.potential[:self.m], self.potential[self.m:])
+
+    def price(self):
+        """Block pricing: most negative reduced cost in the first block that has one."""
+        lanes = self.lanes
+        blocks = math.ceil(lanes.count / self.block_size)
+        for _ in range(blocks):
+            start = self.next_block * self.block_size
+            stop = min(start + self.block_size, lanes.count)
+            self.next_block = (self.next_block + 1) % blocks
+            reduced = self._reduced(start, stop)
+            k = int(np.argmin(reduced))
+            if reduced[k] < -self.tolerance:
+                lane = start + k
+                return int(lanes.rows(lane)), int(lanes.cols(lane)), float(reduced[k])
+        return None
+
+    def pivot(self, i, j, reduced, leaving=None):
+        """Enters cell (i, j); leaving is the node whose cell must leave (dual pivots)."""
+        m = self.m
+        parent, depth, flow = self.parent, self.depth, self.flow
+
+        # --- Closed loop: walk both ends of the entering cell up to their apex ---
+        a, b = i, m + j
+        up_a, up_b = [], []
+        while a != b:
+            if depth[a] >= depth[b]:
+                up_a.append(a)
+                a = parent[a]
+            else:
+                up_b.append(b)
+                b = parent[b]
+        loop = up_b + up_a[::-1]
+
+        # Loop cells alternate -, +, -, ... starting next to the destination; the
+        # leaving cell is the last blocking one met from the apex (Cunningham's rule)
+        if leaving is not None:
+            # The leaving cell sits on a + position and is pushed up to zero
+            leave = loop.index(leaving)
+            theta = -flow[leaving]
+        else:
+            theta = min(flow[node] for node in loop[0::2])
+            leave = None
+            for k in range(0, len(up_b), 2):
+                if flow[loop[k]] == theta:
+                    leave = k
+            if leave is None:
+                for k in range(len(up_b) + (len(up_b) % 2), len(loop), 2):
+                    if flow[loop[k]] == theta:
+                        leave = k
+        for k, node in enumerate(loop):
+            flow[node] += theta if k % 2 else -theta
+
+        q = loop[leave]
+        if leave < len(up_b):
+            inner, outer = m + j, i
+            old_above, new_above = up_b[leave + 1:], up_a
+        else:
+            inner, outer = i, m + j
+            old_above, new_above = up_a[len(loop) - leave:], up_b
+        self._rehang(q, inner, outer, theta, self.cell_cost(i, j), reduced,
+                     old_above, new_above)
+        self.iterations += 1
+
+    def _rehang(self, q, inner, outer, theta, cost, reduced, old_above, new_above):
+        """
+        Cuts the subtree under q and re-roots it at inner below outer.
+
+        old_above and new_above are the nodes strictly between q and the loop apex,
+        and between outer and the apex; only their subtree sizes change.
+        """
+        m = self.m
+        parent, depth, thread = self.parent, self.depth, self.thread
+        position, size = self.position, self.subtree_size
+
+        path = [inner]
+        while path[-1] != q:
+            path.append(parent[path[-1]])
+
+        # New preorder of the cut subtree: inner's own subtree, then each node on
+        # the old path to q with the part of its subtree not already emitted
+        top = depth[outer] + 1
+        pieces, depths = [], []
+        below = None
+        for t, node in enumerate(path):
+            start, stop = position[node], position[node] + size[node]
+            if below is None:
+                piece = thread[start:stop]
+            else:
+                hole, hole_end = position[below], position[below] + size[below]
+                piece = np.concatenate((thread[start:hole], thread[hole_end:stop]))
+            pieces.append(piece)
+            depths.append(depth[piece] - depth[node] + top + t)
+            below = node
+        cut = size[q]
+        new_sizes = [cut] + [cut - size[node] for node in path[:-1]]
+
+        for k in range(len(path) - 1, 0, -1):
+            child, above = path[k], path[k - 1]
+            parent[child] = above
+            self.flow[child] = self.flow[above]
+            self.arc_cost[child] = self.arc_cost[above]
+        parent[inner] = outer
+        self.flow[inner] = theta
+        self.arc_cost[inner] = cost
+
+        size[path] = new_sizes
+        size[old_above] -= cut
+        size[new_above] += cut
+
+        subtree = np.concatenate(pieces)
+        depth[subtree] = np.concatenate(depths)
+        # Potentials move by the entering reduced cost on the re-hung side only
+        shift = np.where(subtree < m, reduced, -reduced)
+        self.potential[subtree] += shift if inner < m else -shift
+
+        start = position[q]
+        rest = np.concatenate((thread[:start], thread[start + cut:]))
+        at = position[outer] + 1 - (cut if position[outer] > start else 0)
+        self.thread = np.concatenate((rest[:at], subtree, rest[at:]))
+        position[self.thread] = np.arange(len(self.thread))
+
+    def repair(self):
+        """
+        Dual network simplex: pivots out negative flows while keeping reduced costs
+        non-negative.
+
+        The most negative cell leaves; the entering cell is the cheapest in reduced
+        cost among those crossing the cut it leaves in the direction that can carry
+        the missing flow.
+        """
+        m, lanes = self.m, self.lanes
+        while True:
+            q = min(range(1, m + self.n), key=self.flow.__getitem__)
+            if self.flow[q] >= -self.tolerance:
+                return
+            inside = np.zeros(m + self.n, dtype=bool)
+            inside[self.thread[self.position[q]:self.position[q] + self.subtree_size[q]]] = True
+            # A source below its parent cell needs outside supply into the cut's
+            # destinations; a destination needs the cut's supply to leave it
+            sources = ~inside[:m] if q < m else inside[:m]
+            destinations = inside[m:] if q < m else ~inside[m:]
+            if lanes.dense is not None:
+                rows, cols = np.flatnonzero(sources), np.flatnonzero(destinations)
+                reduced = (lanes.submatrix(rows, cols) - self.potential[rows, None]
+                           - self.potential[None, m + cols])
+                if reduced.size == 0:
+                    raise _stranded_error()
+                k = int(np.argmin(reduced))
+                i, j = int(rows[k // len(cols)]), int(cols[k % len(cols)])
+                reduced = float(reduced.flat[k])
+            else:
+                ids = np.flatnonzero(sources[lanes.rows(np.arange(lanes.count))]
+                                     & destinations[lanes.cols(np.arange(lanes.count))])
+                if ids.size == 0:
+                    raise _stranded_error()
+                reduced = lanes.costs(ids) - self.potential[lanes.rows(ids)] - self.potential[m + lanes.cols(ids)]
+                k = int(np.argmin(reduced))
+                i, j = int(lanes.rows(ids[k])), int(lanes.cols(ids[k]))
+                reduced = float(reduced[k])
+            self.pivot(i, j, reduced, leaving=q)
+
+    def run(self):
+        while True:
+            entering = self.price()
+            if entering is None:
+                break
+            self.pivot(*entering)
+        if any(self.arc_cost[node] == self.virtual_cost and self.flow[node] > self.tolerance
+               for node in range(1, self.m + self.n)):
+            raise _stranded_error()
+
+    def solution(self):
+        nodes = [node for node in range(1, self.m + self.n) if self.flow[node] > 0]
+        rows, cols = np.array([self.cell(node) for node in nodes], dtype=np.intp).reshape(-1, 2).T
+        solution = TransportationSolution(
+            rows, cols, [self.flow[node] for node in nodes], [self.arc_cost[node] for node in nodes],
+            (self.m, self.n), is_sparse=self.lanes.dense is None, real_shape=self.lanes.real_shape,
+            u=self.potential[:self.m].copy(), v=self.potential[self.m:].copy())
+        solution.basis = np.array([self.cell(node) for node in range(1, self.m + self.n)], dtype=np.intp)
+        solution.iterations = self.iterations
+        return solution
+
+
+def _full_matching(cost_matrix):
+    """Minimum cost full matching (rows, cols) of a square CSR lane matrix."""
+    # The matching treats stored zeros as missing lanes, so every cost is shifted
+    # above zero; all full matchings move by the same constant
+    weights = cost_matrix.copy()
+    if weights.nnz:
+        weights.data = weights.data - weights.data.min() + 1.0
+    try:
+        return min_weight_full_bipartite_matching(weights)
+    except ValueError:
+        raise _stranded_error() from None
+
+
+class _Auction:
+    """
+    Jacobi auction for the assignment problem, with ε-scaling (Bertsekas).
+
+    Destinations carry prices. Every unassigned source bids for the destination with
+    the least cost plus price, raising its price by the margin over the second best
+    plus ε; each destination goes to its highest bidder, unseating the previous one.
+    A phase ends with every source assigned and within ε of its best choice; each
+    phase divides ε, keeps the prices and the assignments still within the new ε,
+    so the final phase only fixes up a nearly optimal assignment.
+
+    Prices only rise, so on dense costs each source remembers its AUCTION_CANDIDATES
+    cheapest destinations and the next cost plus price after them: while its best two
+    candidates stay below that bound they are its best two overall, and the source
+    bids without scanning its row. Bids are priced in blocks of AUCTION_BLOCK cost entries, spread over an executor
+    when one is given (NumPy releases the GIL, so threads share the costs and prices
+    without copying them).
+    """
+
+    def __init__(self, cost_matrix, executor=None):
+        self.executor = executor
+        self.n = cost_matrix.shape[0]
+        if sparse.issparse(cost_matrix):
+            self.csr = cost_matrix
+            self.dense = None
+            values = cost_matrix.data
+            self.block_rows = max(1, AUCTION_BLOCK * self.n // max(cost_matrix.nnz, 1))
+        else:
+            self.csr = None
+            self.dense = np.asarray(cost_matrix, dtype=float)
+            values = self.dense
+            self.block_rows = max(1, AUCTION_BLOCK // self.n)
+            if self.n > AUCTION_CANDIDATES:
+                self.candidates = np.zeros((self.n, AUCTION_CANDIDATES), dtype=np.intp)
+                self.candidate_costs = np.zeros((self.n, AUCTION_CANDIDATES))
+                self.bound = np.full(self.n, -np.inf)
+        # Margin of a source with a single lane, which has no second best
+        self.span = float(values.max() - values.min()) if values.size else 0.0
+        self.prices = np.zeros(self.n)
+        self.assigned = np.full(self.n, -1, dtype=np.intp)
+        self.owner = np.full(self.n, -1, dtype=np.intp)
+        self.iterations = 0
+
+    def _best_two(self, rows):
+        """Best destination of each source in rows, with its cost plus price and the runner-up's."""
+        if self.dense is not None and self.n > AUCTION_CANDIDATES:
+            candidates = self.candidates[rows]
+            values = self.candidate_costs[rows] + self.prices[candidates]
+            at = np.arange(len(rows))
+            best = values.argmin(axis=1)
+            first = values[at, best]
+            values[at, best] = np.inf
+            second = values.min(axis=1)
+            best = candidates[at, best]
+            stale = np.flatnonzero(second > self.bound[rows])
+            if len(stale):
+                best[stale], first[stale], second[stale] = self._scan(rows[stale])
+            return best, first, second
+        if self.dense is not None:
+            values = self.dense[rows]
+            values += self.prices
+            best = values.argmin(axis=1)
+            at = np.arange(len(rows))
+            first = values[at, best]
+            values[at, best] = np.inf
+            return best, first, values.min(axis=1)
+        block = self.csr[rows]
+        values = block.data + self.prices[block.indices]
+        starts = block.indptr[:-1]
+        first = np.minimum.reduceat(values, starts)
+        owner = np.repeat(np.arange(len(rows)), np.diff(block.indptr))
+        position = np.where(values == first[owner], np.arange(len(values)), len(values))
+        position = np.minimum.reduceat(position, starts)
+        values[position] = np.inf
+        return block.indices[position], first, np.minimum.reduceat(values, starts)
+
+    def _scan(self, rows):
+        """_best_two over full dense rows, refreshing their candidate lists."""
+        values = self.dense[rows]
+        values += self.prices
+        nearest = np.argpartition(values, AUCTION_CANDIDATES, axis=1)[:, :AUCTION_CANDIDATES + 1]
+        nearest_values = np.take_along_axis(values, nearest, axis=1)
+        order = np.argsort(nearest_values, axis=1)
+        nearest = np.take_along_axis(nearest, order, axis=1)
+        nearest_values = np.take_along_axis(nearest_values, order, axis=1)
+        self.candidates[rows] = nearest[:, :AUCTION_CANDIDATES]
+        self.candidate_costs[rows] = self.dense[rows[:, None], nearest[:, :AUCTION_CANDIDATES]]
+        self.bound[rows] = nearest_values[:, AUCTION_CANDIDATES]
+        return nearest[:, 0], nearest_values[:, 0], nearest_values[:, 1]
+
+    def _bids(self, persons, epsilon):
+        if len(persons) <= self.block_rows:
+            targets, first, second = self._best_two(persons)
+        else:
+            blocks = [persons[k:k + self.block_rows] for k in range(0, len(persons), self.block_rows)]
+            mapper = map if self.executor is None else self.executor.map
+            targets, first, second = map(np.concatenate, zip(*mapper(self._best_two, blocks)))
+        margin = np.where(np.isfinite(second), second - first, self.span)
+        return targets, self.prices[targets] + margin + epsilon
+
+    def phase(self, epsilon, rounds):
+        """Runs one ε phase for at most rounds bidding rounds; returns the rounds used."""
+        # Assignments already within the new ε of their source's best choice are kept
+        persons = np.flatnonzero(self.assigned >= 0)
+        if len(persons):
+            best = self._first(persons)
+            objects = self.assigned[persons]
+            loose = persons[self._cost(persons, objects) + self.prices[objects] > best + epsilon]
+            self.owner[self.assigned[loose]] = -1
+            self.assigned[loose] = -1
+        used = 0
+        persons = np.flatnonzero(self.assigned < 0)
+        while used < rounds and len(persons):
+            targets, bids = self._bids(persons, epsilon)
+            # --- Each destination takes its highest bid ---
+            order = np.lexsort((-bids, targets))
+            targets = targets[order]
+            winning = np.ones(len(order), dtype=bool)
+            winning[1:] = targets[1:] != targets[:-1]
+            won, winners = targets[winning], persons[order[winning]]
+            self.prices[won] = bids[order[winning]]
+            unseated = self.owner[won]
+            self.assigned[unseated[unseated >= 0]] = -1
+            self.owner[won] = winners
+            self.assigned[winners] = won
+            persons = np.concatenate((persons[order[~winning]], unseated[unseated >= 0]))
+            used += 1
+        self.iterations += used
+        return used
+
+    def finish(self):
+        """Assigns the sources a capped phase left over, exactly, to the free destinations."""
+        rows = np.flatnonzero(self.assigned < 0)
+        if not len(rows):
+            return
+        cols = np.flatnonzero(self.owner < 0)
+        if self.dense is not None:
+            picked, chosen = linear_sum_assignment(self.dense[np.ix_(rows, cols)])
+        else:
+            try:
+                picked, chosen = _full_matching(self.csr[rows][:, cols])
+            except ValueError:
+                # The partial assignment blocks every completion: match all sources exactly
+                picked, chosen = _full_matching(self.csr)
+                rows = cols = np.arange(self.n)
+                self.owner[:] = -1
+        self.assigned[rows[picked]] = cols[chosen]
+        self.owner[cols[chosen]] = rows[picked]
+
+    def _first(self, persons):
+        """Least cost plus price of each source in persons."""
+        return np.concatenate([self._best_two(persons[k:k + self.block_rows])[1]
+                               for k in range(0, len(persons), self.block_rows)])
+
+    def _cost(self, rows, cols):
+        if self.dense is not None:
+            return self.dense[rows, cols]
+        return np.asarray(self.csr[rows, cols]).ravel()
+
+    def duals(self):
+        """(u, v) with u_i + v_j <= c_ij on every lane, tight to within ε on the assignment."""
+        return self._first(np.arange(self.n)), -self.prices
+
+
+class TransportationSolution:
+    """
+    Basic-cell form of a transportation solution: one entry per used route.
+
+    A basic solution ships on at most m+n-1 routes, so this keeps three short
+    arrays instead of an m×n allocation matrix and builds the matrix only when
+    asked for.
+
+    Attributes:
+    rows, cols : array - Source and destination index of each used route
+    quantities : array - Units shipped on each route
+    costs : array - Unit cost of each route
+    total_cost : float - Total transportation cost, penalties for the dummy included
+    shape : tuple - (sources, destinations) of the balanced problem
+    real_shape : tuple - (sources, destinations) before balancing; a row or column
+        past these is the dummy, whose allocations are reported by unused_supply,
+        unmet_demand and penalty_cost
+    u, v : array or None - MODI dual values of the sources and destinations
+        (c_ij = u_i + v_j on every basic cell; for AUCTION to within ε on every
+        used route); None for the other methods
+    basis : array or None - MODI only: all m+n-1 basic cells (row, col), degenerate
+        ones included, for warm-starting a later solve
+    prices : array or None - AUCTION only: final destination prices (v = -prices)
+    iterations : int - MODI pivots taken, or AUCTION bidding rounds
+    warm_started : bool - Whether MODI re-optimized from a previous basis
+    """
+
+    def __init__(self, rows, cols, quantities, costs, shape, is_sparse=False, u=None, v=None,
+                 real_shape=None):
+        self.rows = np.asarray(rows, dtype=np.intp)
+        self.cols = np.asarray(cols, dtype=np.intp)
+        self.quantities = np.asarray(quantities, dtype=float)
+        self.costs = np.asarray(costs, dtype=float)
+        self.total_cost = float(self.quantities @ self.costs)
+        self.shape = shape
+        self.real_shape = tuple(shape) if real_shape is None else tuple(real_shape)
+        self.is_sparse = is_sparse
+        self.u = u
+        self.v = v
+        self.basis = None
+        self.prices = None
+        self.iterations = 0
+        self.warm_started = False
+        self._dense = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def dummy(self):
+        """Mask of the routes from the dummy source or to the dummy destination."""
+        return (self.rows >= self.real_shape[0]) | (self.cols >= self.real_shape[1])
+
+    @property
+    def unused_supply(self):
+        """Supply of each source left with the dummy destination."""
+        to_dummy = self.cols >= self.real_shape[1]
+        return np.bincount(self.rows[to_dummy], self.quantities[to_dummy], minlength=self.real_shape[0])
+
+    @property
+    def unmet_demand(self):
+        """Demand of each destination covered only by the dummy source."""
+        from_dummy = self.rows >= self.real_shape[0]
+        return np.bincount(self.cols[from_dummy], self.quantities[from_dummy], minlength=self.real_shape[1])
+
+    @property
+    def penalty_cost(self):
+        """Part of total_cost charged for unused supply and unmet demand."""
+        dummy = self.dummy
+        return float(self.quantities[dummy] @ self.costs[dummy])
+
+    def to_dense(self):
+        """m×n allocation matrix, built on first use."""
+        if self._dense is None:
+            self._dense = np.zeros(self.shape)
+            self._dense[self.rows, self.cols] = self.quantities
+        return self._dense
+
+    def to_sparse(self):
+        """Allocation as a scipy.sparse COO matrix."""
+        return sparse.coo_matrix((self.quantities, (self.rows, self.cols)), shape=self.shape)
+
+    def to_matrix(self):
+        """Allocation in the problem's own format, as returned by solve()."""
+        return self.to_sparse() if self.is_sparse else self.to_dense()
+
+    def __array__(self, dtype=None, copy=None):
+        return self.to_dense() if dtype is None else self.to_dense().astype(dtype)
+
+
+class TransportationProblem:
+    """
+    NumPy-backed drop-in for OTTools.TransportationProblem; it does not import OTTools,
+    whose module-level demo prints to stdout.
+
+    solve('NWCR' | 'LCM' | 'VAM' | 'MODI') keeps its signature. The initial-solution
+    methods return the same allocations as OTTools without rescanning the whole
+    cost matrix after every allocation, and MODI pivots on a network-simplex basis
+    tree instead of recomputing potentials and searching for loops from scratch.
+
+    cost_matrix may also be a scipy.sparse matrix whose stored entries are the only
+    allowed lanes (see from_lanes); every method then works on the lane list alone
+    and returns a sparse COO allocation.
+
+    solve(method, compact=True) returns a TransportationSolution holding only the
+    used routes, total cost and (for MODI) the dual values instead of a matrix.
+    """
+
+    def __init__(self, cost_matrix, supply, demand, auto_balance=True,
+                 surplus_cost=0.0, shortage_cost=0.0):
+        """
+        Parameters:
+        cost_matrix : 2D array or scipy.sparse matrix - Unit cost of every lane
+        supply : array - Supply of each source
+        demand : array - Demand of each destination
+        auto_balance : bool - Balance unequal totals with a dummy source or destination
+        surplus_cost : float or array - Cost per unit of supply left unused, for every
+            source (the lanes of a dummy destination)
+        shortage_cost : float or array - Cost per unit of demand left unmet, for every
+            destination (the lanes of a dummy source)
+        """
+        if sparse.issparse(cost_matrix):
+            self.cost_matrix = sparse.csr_matrix(cost_matrix, dtype=float)
+            self.cost_matrix.sum_duplicates()
+        else:
+            self.cost_matrix = np.asarray(cost_matrix)
+        self.supply = np.array(supply)
+        self.demand = np.array(demand)
+        m, n = self.cost_matrix.shape
+        self.surplus_cost = np.broadcast_to(np.asarray(surplus_cost, dtype=float), (m,))
+        self.shortage_cost = np.broadcast_to(np.asarray(shortage_cost, dtype=float), (n,))
+        self.dummy_supply = 0.0
+        self.dummy_demand = 0.0
+        self.allocation = None
+        if auto_balance:
+            self.balance_problem()
+
+    @classmethod
+    def from_lanes(cls, rows, cols, costs, supply, demand, auto_balance=True,
+                   surplus_cost=0.0, shortage_cost=0.0):
+        """
+        Builds a problem from a list of allowed lanes, one entry per lane.
+
+        Parameters:
+        rows, cols : array - Source and destination index of each lane (0-based)
+        costs : array - Unit cost of each lane
+        supply : array - Supply of each source
+        demand : array - Demand of each destination
+        """
+        shape = (len(supply), len(demand))
+        cost_matrix = sparse.coo_matrix((costs, (rows, cols)), shape=shape)
+        return cls(cost_matrix, supply, demand, auto_balance, surplus_cost, shortage_cost)
+
+    def balance_problem(self):
+        """
+        Balances unequal totals with a dummy destination taking the surplus supply, or a
+        dummy source covering the shortage.
+
+        The dummy is virtual: cost_matrix, supply and demand keep their shapes, and every
+        method adds the dummy line (priced by surplus_cost or shortage_cost) on the fly.
+        """
+        total_supply = np.sum(self.supply)
+        total_demand = np.sum(self.demand)
+        self.dummy_demand = max(total_supply - total_demand, 0.0)
+        self.dummy_supply = max(total_demand - total_supply, 0.0)
+
+    def _lanes(self):
+        if self.dummy_demand > 0:
+            return _Lanes(self.cost_matrix, dummy_col=self.surplus_cost)
+        if self.dummy_supply > 0:
+            return _Lanes(self.cost_matrix, dummy_row=self.shortage_cost)
+        return _Lanes(self.cost_matrix)
+
+    def _amounts(self):
+        """Supply and demand with the dummy source or destination appended."""
+        supply = np.append(self.supply, self.dummy_supply) if self.dummy_supply > 0 else self.supply
+        demand = np.append(self.demand, self.dummy_demand) if self.dummy_demand > 0 else self.demand
+        return supply, demand
+
+    def is_assignment(self):
+        """Whether the problem is square with every supply and demand the same amount."""
+        m, n = self.cost_matrix.shape
+        if m != n or m == 0:
+            return False
+        amount = self.supply.flat[0]
+        return bool(amount > 0 and np.all(self.supply == amount) and np.all(self.demand == amount))
+
+    def NorthWestSolver(self, compact=False):
+        lanes = self._lanes()
+        supply, demand = self._amounts()
+        supply = supply.tolist()
+        demand = demand.tolist()
+        cells = {}
+        i, j = 0, 0
+        while i < len(supply) and j < len(demand):
+            if supply[i] == 0:
+                i += 1
+            elif demand[j] == 0:
+                j += 1
+            else:
+                if lanes.lane(i, j) < 0:
+                    raise ValueError(f"The north-west corner path needs lane S{i + 1} -> D{j + 1}, "
+                                     "which is not allowed.")
+                amount = min(supply[i], demand[j])
+                cells[i, j] = amount
+                supply[i] -= amount
+                demand[j] -= amount
+        return self._result(self._cells_solution(lanes, cells), compact)
+
+    def LeastCostMethod(self, compact=False):
+        lanes = self._lanes()
+        supply, demand = self._amounts()
+        supply = supply.copy()
+        demand = demand.copy()
+        cells = {}
+
+        # One stable sort of the lane costs gives the same row-major tie-breaking
+        # as a full rescan after every allocation
+        order = lanes.by_cost()
+        open_rows = np.count_nonzero(supply > 0)
+        for start in range(0, len(order), LCM_CHUNK):
+            if open_rows == 0:
+                break
+            chunk = order[start:start + LCM_CHUNK]
+            chunk_rows, chunk_cols = lanes.rows(chunk), lanes.cols(chunk)
+            candidates = np.flatnonzero((supply[chunk_rows] > 0) & (demand[chunk_cols] > 0))
+            for k in candidates:
+                i, j = int(chunk_rows[k]), int(chunk_cols[k])
+                if supply[i] > 0 and demand[j] > 0:
+                    alloc = min(supply[i], demand[j])
+                    cells[i, j] = alloc
+                    supply[i] -= alloc
+                    demand[j] -= alloc
+                    if supply[i] <= 0:
+                        open_rows -= 1
+        if lanes.dense is None and np.any(supply > 0) and np.any(demand > 0):
+            raise _stranded_error()
+        return self._result(self._cells_solution(lanes, cells), compact)
+
+    def VogelSolver(self, compact=False):
+        lanes = self._lanes()
+        cells, supply, demand = _vogel(lanes, *self._amounts())
+        if lanes.dense is None and np.any(supply > 0) and np.any(demand > 0):
+            raise _stranded_error()
+        return self._result(self._cells_solution(lanes, cells), compact)
+
+    def ModiMethod(self, compact=False, warm_start=None):
+        """
+        Parameters:
+        compact : bool - Return a TransportationSolution instead of the allocation matrix
+        warm_start : TransportationSolution - Earlier MODI solution of a problem with the
+            same shape. Its basis is re-optimized after cost edits and repaired by dual
+            pivots after supply/demand edits; when both broke it, MODI starts over.
+        """
+        lanes = self._lanes()
+        amounts = self._amounts()
+        network = _NetworkSimplex(lanes)
+        warm = (warm_start is not None and warm_start.basis is not None
+                and tuple(warm_start.shape) == (lanes.m, lanes.n)
+                and network.restart(warm_start.basis, *amounts))
+        if not warm:
+            cells, supply, demand = _vogel(lanes, *amounts)
+            # Supply stranded by Vogel's method goes on virtual cells between the
+            # leftover lines. Each Vogel component holds at most one leftover line,
+            # so the staircase cannot close a loop with the cells already placed.
+            cells.update(_north_west_cells(supply, demand))
+            network = _NetworkSimplex(lanes)
+            network.build(cells)
+        network.run()
+        solution = network.solution()
+        solution.warm_started = warm
+        return self._result(solution, compact)
+
+    def AssignmentMethod(self, compact=False):
+        """
+        Optimal solution of an assignment-shaped problem (see is_assignment): every
+        source ships its whole supply to a single destination.
+
+        Dense costs are solved by a Jonker-Volgenant shortest augmenting path in O(n³);
+        sparse costs by a minimum weight full bipartite matching over the allowed lanes.
+        The solution carries no dual values. Its basis is the matching joined into a
+        spanning tree by zero-flow cells, so MODI can warm-start from it.
+        """
+        if not self.is_assignment():
+            raise ValueError("The assignment method needs a square problem whose supplies "
+                             "and demands are all equal.")
+        lanes = self._lanes()
+        if lanes.dense is None:
+            rows, cols = _full_matching(self.cost_matrix)
+        else:
+            rows, cols = linear_sum_assignment(lanes.dense)
+        amount = float(self.supply.flat[0])
+        solution = TransportationSolution(
+            rows, cols, np.full(len(rows), amount), lanes.costs(lanes.lookup(rows, cols)),
+            (lanes.m, lanes.n), is_sparse=lanes.dense is None, real_shape=lanes.real_shape)
+        network = _NetworkSimplex(lanes)
+        network.build({(i, j): amount for i, j in zip(rows.tolist(), cols.tolist())})
+        solution.basis = np.array([network.cell(node) for node in range(1, lanes.m + lanes.n)], dtype=np.intp)
+        return self._result(solution, compact)
+
+    def AuctionMethod(self, compact=False, epsilon=None, epsilon_scale=7.0, final_epsilon=None,
+                      max_iterations=None, executor=None):
+        """
+        Assignment-shaped problems (see is_assignment) by an ε-scaling auction, for
+        instances too large for the O(n³) assignment method.
+
+        Parameters:
+        compact : bool - Return a TransportationSolution instead of the allocation matrix
+        epsilon : float - ε of the first phase (default: a quarter of the cost range)
+        epsilon_scale : float - Factor ε shrinks by between phases
+        final_epsilon : float - ε of the last phase (default: 1/(n+1), which is optimal for
+            integer costs); the total cost is always within n·final_epsilon of optimal
+        max_iterations : int - Cap on bidding rounds over all phases; sources still unassigned
+            at the cap are matched exactly to the free destinations
+        executor : Executor - Thread pool to spread each round's bids over (default: serial)
+
+        Returns:
+        Allocation as for the other methods; a compact solution also carries the final
+        prices, with u and v as duals
+        """
+        if not self.is_assignment():
+            raise ValueError("The auction method needs a square problem whose supplies "
+                             "and demands are all equal.")
+        n = self.cost_matrix.shape[0]
+        if sparse.issparse(self.cost_matrix) and np.any(
+                maximum_bipartite_matching(self.cost_matrix, perm_type="column") < 0):
+            raise _stranded_error()
+        auction = _Auction(self.cost_matrix, executor)
+        final_epsilon = 1.0 / (n + 1) if final_epsilon is None else final_epsilon
+        epsilon = max(auction.span / 4 if epsilon is None else epsilon, final_epsilon)
+        rounds = math.inf if max_iterations is None else max_iterations
+        while rounds > 0:
+            rounds -= auction.phase(epsilon, rounds)
+            if epsilon <= final_epsilon:
+                break
+            epsilon = max(epsilon / epsilon_scale, final_epsilon)
+        auction.finish()
+
+        lanes = self._lanes()
+        rows = np.arange(n)
+        cols = auction.assigned
+        solution = TransportationSolution(
+            rows, cols, np.full(n, float(self.supply.flat[0])), lanes.costs(lanes.lookup(rows, cols)),
+            (lanes.m, lanes.n), is_sparse=lanes.dense is None, real_shape=lanes.real_shape)
+        solution.u, solution.v = auction.duals()
+        solution.prices = auction.prices
+        solution.iterations = auction.iterations
+        return self._result(solution, compact)
+
+    def solve(self, method='VAM', compact=False, warm_start=None, **options):
+        """
+        Solves with the given method.
+
+        MODI on an assignment-shaped problem (see is_assignment) is answered by the
+        assignment method, which reaches the same optimal cost without MODI's
+        degenerate pivots. A warm_start with a basis takes precedence: MODI then
+        re-optimizes that basis instead. The assignment method's solution carries a
+        basis too, so it can warm-start the next MODI solve.
+
+        Parameters:
+        method : str - 'NWCR', 'LCM', 'VAM', 'MODI', 'ASSIGNMENT' or 'AUCTION'
+        compact : bool - Return a TransportationSolution instead of the allocation matrix
+        warm_start : TransportationSolution - MODI only: previous solution to re-optimize from
+        options : AUCTION only: its ε schedule, iteration cap and executor (see AuctionMethod)
+
+        Returns:
+        Allocation matrix (dense or sparse like the cost matrix), or a TransportationSolution
+        """
+        solvers = {'NWCR': self.NorthWestSolver, 'VAM': self.VogelSolver,
+                   'LCM': self.LeastCostMethod, 'MODI': self.ModiMethod,
+                   'ASSIGNMENT': self.AssignmentMethod, 'AUCTION': self.AuctionMethod}
+        if method not in solvers:
+            raise ValueError("Invalid method. Choose NWCR, VAM, LCM, MODI, ASSIGNMENT, or AUCTION.")
+        if method == 'MODI' and self.is_assignment() and (warm_start is None or warm_start.basis is None):
+            self.allocation = self.AssignmentMethod(compact=compact)
+        elif method == 'MODI':
+            self.allocation = self.ModiMethod(compact=compact, warm_start=warm_start)
+        else:
+            self.allocation = solvers[method](compact=compact, **options)
+        return self.allocation
+
+    @staticmethod
+    def _cells_solution(lanes, cells):
+        cells = {cell: quantity for cell, quantity in cells.items() if quantity > 0}
+        rows, cols = np.array(list(cells), dtype=np.intp).reshape(-1, 2).T
+        costs = lanes.costs(lanes.lookup(rows, cols))
+        return TransportationSolution(rows, cols, list(cells.values()), costs, (lanes.m, lanes.n),
+                                      is_sparse=lanes.dense is None, real_shape=lanes.real_shape)
+
+    @staticmethod
+    def _result(solution, compact):
+        return solution if compact else solution.to_matrix()
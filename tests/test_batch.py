@@ -0,0 +1,61 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.optimize import linprog
+
+from solvers import solve_batch
+
+
+def _optimal_cost(cost, supply, demand):
+    """Minimum cost of the balanced problem by linprog."""
+    cost = np.asarray(cost, dtype=float)
+    m, n = cost.shape
+    A_eq = np.vstack([np.kron(np.eye(m), np.ones(n)), np.kron(np.ones(m), np.eye(n))])
+    return linprog(cost.ravel(), A_eq=A_eq, b_eq=np.concatenate([supply, demand])).fun
+
+
+def _instances(count, method="MODI"):
+    rng = np.random.default_rng(1)
+    for _ in range(count):
+        m, n = rng.integers(2, 7, size=2)
+        supply = rng.integers(1, 20, size=m)
+        demand = rng.multinomial(supply.sum(), np.full(n, 1 / n))
+        yield rng.integers(1, 30, size=(m, n)), supply, demand, method
+
+
+@pytest.mark.parametrize("ordered", [False, True])
+@pytest.mark.parametrize("shared_memory_bytes", [0, 1 << 20])
+def test_solve_batch(ordered, shared_memory_bytes):
+    instances = list(_instances(12))
+    results = list(solve_batch(iter(instances), max_workers=2, ordered=ordered,
+                               shared_memory_bytes=shared_memory_bytes))
+    assert sorted(index for index, _ in results) == list(range(12))
+    if ordered:
+        assert [index for index, _ in results] == list(range(12))
+    for index, solution in results:
+        cost, supply, demand, _ = instances[index]
+        assert solution.total_cost == pytest.approx(_optimal_cost(cost, supply, demand))
+
+
+def test_solve_batch_sparse_and_executor():
+    cost, supply, demand, _ = next(_instances(1))
+    with ProcessPoolExecutor(2) as executor:
+        results = dict(solve_batch([(sparse.csr_matrix(cost), supply, demand, "MODI"),
+                                    (cost, supply, demand, "VAM")], executor=executor))
+        # The pool is left running for the caller
+        assert executor.submit(abs, -1).result() == 1
+    assert sparse.issparse(results[0].to_matrix())
+    assert results[0].total_cost == pytest.approx(_optimal_cost(cost, supply, demand))
+    assert results[1].total_cost >= results[0].total_cost - 1e-9
+
+
+def test_solve_batch_exceptions():
+    instances = list(_instances(3))
+    instances[1] = instances[1][:3] + ("SIMPLEX",)
+    results = dict(solve_batch(instances, max_workers=2, return_exceptions=True))
+    assert isinstance(results[1], ValueError)
+    assert results[0].total_cost == pytest.approx(_optimal_cost(*instances[0][:3]))
+    with pytest.raises(ValueError):
+        list(solve_batch(instances, max_workers=2))
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from solvers import SolveCache, TransportationProblem, simplex_method
+
+
+@pytest.mark.parametrize("first, second", [
+    ([1, 2], np.array([1.0, 2.0])),
+    ((np.arange(3), "MODI"), [np.array([0, 1, 2]), "MODI"]),
+    ({"cuts": None, "max_workers": 2}, {"max_workers": 2, "cuts": None}),
+    (sparse.csr_matrix([[1, 0], [0, 2]]), sparse.coo_matrix(([2, 1], ([1, 0], [1, 0])), shape=(2, 2))),
+])
+def test_equal_keys(first, second):
+    assert SolveCache.key("solve", first) == SolveCache.key("solve", second)
+
+
+@pytest.mark.parametrize("first, second", [
+    ([1, 2], [2, 1]),
+    ([[1, 2]], [1, 2]),
+    ({"max_workers": 1}, {"max_workers": 2}),
+    ({"cuts": None}, {"cuts": "root"}),
+    (np.zeros((2, 3)), np.zeros((3, 2))),
+    (sparse.csr_matrix(np.eye(2)), np.eye(2)),
+    (1, "1"),
+])
+def test_different_keys(first, second):
+    assert SolveCache.key("solve", first) != SolveCache.key("solve", second)
+
+
+def test_fetch():
+    cache = SolveCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return simplex_method([3, 2], [[2, 1], [1, 2]], [8, 6])
+
+    first, hit = cache.fetch("simplex_method", ([3, 2], [[2, 1], [1, 2]], [8, 6]), compute)
+    assert not hit
+    second, hit = cache.fetch("simplex_method", (np.array([3, 2]), np.array([[2, 1], [1, 2]]), [8, 6]), compute)
+    assert hit
+    assert len(calls) == 1
+    assert second[0] == pytest.approx(38 / 3)
+    assert np.array_equal(first[1], second[1])
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 1
+
+
+def test_exceptions_not_cached():
+    cache = SolveCache()
+    with pytest.raises(ValueError):
+        cache.call(TransportationProblem([[1]], [1], [1]).solve, "SIMPLEX")
+    assert cache.stats()["entries"] == 0
+
+
+def test_memory_cap():
+    cache = SolveCache(max_bytes=2000)
+    for i in range(10):
+        cache.fetch("zeros", i, lambda: np.zeros(100))
+    assert cache.stats()["bytes"] <= 2000
+    # The oldest entries were evicted first
+    assert cache.fetch("zeros", 9, lambda: None)[1]
+    assert not cache.fetch("zeros", 0, lambda: None)[1]
+
+
+def test_disk_tier_shared(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    problem = TransportationProblem([[19, 30, 50, 10], [70, 30, 40, 60], [40, 8, 70, 20]], [7, 9, 18], [5, 8, 7, 14])
+    solution, hit = SolveCache(path=path).fetch("modi", problem.cost_matrix,
+                                                lambda: problem.solve("MODI", compact=True))
+    assert not hit
+    # Another process (here: another cache object) finds it on disk
+    cached, hit = SolveCache(path=path).fetch("modi", problem.cost_matrix, lambda: None)
+    assert hit
+    assert cached.total_cost == solution.total_cost == pytest.approx(743)
+
+
+def test_disk_cap(tmp_path):
+    cache = SolveCache(max_bytes=0, path=str(tmp_path / "cache.sqlite"), max_disk_bytes=3000)
+    for i in range(10):
+        cache.fetch("zeros", i, lambda: np.zeros(100))
+    assert cache.fetch("zeros", 9, lambda: None)[1]
+    assert not cache.fetch("zeros", 0, lambda: None)[1]
+    cache.clear()
+    assert not cache.fetch("zeros", 9, lambda: None)[1]
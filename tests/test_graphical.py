@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from solvers import graphical_method
+
+
+@pytest.mark.parametrize("c, A, b, types, Min, expected", [
+    # '=' rows with an unbounded ray along which the objective is constant
+    ([1, -1], [[1, -1]], [-1], ['='], False, -1.0),
+    ([-2, 2], [[-2, 2]], [1], ['='], True, 1.0),
+    ([1, -1], [[1, -1], [1, 1]], [-1, 100], ['=', '<='], False, -1.0),
+    # Unbounded region, bounded objective
+    ([-1, 0], [[1, -1]], [1], ['<='], False, 0.0),
+    ([3, 2], [[2, 1], [1, 2]], [8, 6], ['<=', '<='], False, 38 / 3),
+    ([1, 0], [[1, 0], [0, 1]], [2, 3], ['=', '='], False, 2.0),
+])
+def test_optimal(c, A, b, types, Min, expected):
+    value, solution = graphical_method(c, A, b, types, Min=Min)
+    assert value == pytest.approx(expected, abs=1e-12)
+    assert np.all(solution >= 0)
+
+
+@pytest.mark.parametrize("c, A, b, types, Min, status", [
+    ([1, 1], [[1, -1]], [-1], ['='], False, "unbounded"),
+    ([1, 1], [[1, -1]], [1], ['<='], False, "unbounded"),
+    ([1, 0], [[1, 0], [1, 0]], [2, 3], ['=', '='], False, "infeasible"),
+    ([1, 0], [[0, 0]], [1], ['='], False, "infeasible"),
+    ([1, 1], [[1, 1]], [-1], ['>='], True, "optimal"),
+])
+def test_status(c, A, b, types, Min, status):
+    value, _ = graphical_method(c, A, b, types, Min=Min)
+    assert (value if isinstance(value, str) else "Problem is optimal") == f"Problem is {status}"
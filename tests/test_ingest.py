@@ -0,0 +1,88 @@
+import io
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from solvers.ingest import BATCH_ROWS, allocate, read_matrix, read_vector, table_shape
+
+
+def _write_csv(path, matrix, header=False):
+    lines = [",".join(f"c{j}" for j in range(matrix.shape[1]))] if header else []
+    lines += [",".join(f"{value:g}" for value in row) for row in matrix]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def _write_parquet(path, matrix):
+    pq.write_table(pa.table({f"c{j}": matrix[:, j] for j in range(matrix.shape[1])}), path)
+    return path
+
+
+# More rows than one batch, so the reader has to stitch batches together
+MATRIX = np.random.default_rng(0).integers(0, 100, size=(BATCH_ROWS + 37, 5)).astype(float)
+
+
+@pytest.mark.parametrize("header", [False, True])
+def test_csv(tmp_path, header):
+    path = _write_csv(tmp_path / "cost.csv", MATRIX, header)
+    assert table_shape(str(path), header=header) == MATRIX.shape
+    assert np.array_equal(read_matrix(str(path), header=header), MATRIX)
+
+
+def test_parquet(tmp_path):
+    path = _write_parquet(tmp_path / "cost.parquet", MATRIX)
+    assert table_shape(str(path)) == MATRIX.shape
+    assert np.array_equal(read_matrix(str(path)), MATRIX)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_file_object(tmp_path, fmt):
+    path = (_write_csv if fmt == "csv" else _write_parquet)(tmp_path / f"cost.{fmt}", MATRIX[:50])
+    upload = io.BytesIO(path.read_bytes())
+    assert table_shape(upload, fmt) == (50, 5)
+    assert np.array_equal(read_matrix(upload, fmt), MATRIX[:50])
+
+
+def test_memmap(tmp_path):
+    path = _write_csv(tmp_path / "cost.csv", MATRIX)
+    out = read_matrix(str(path), out=allocate(MATRIX.shape, str(tmp_path / "cost.bin")))
+    assert isinstance(out, np.memmap)
+    assert np.array_equal(out, MATRIX)
+
+
+def test_empty_cells(tmp_path):
+    path = tmp_path / "cost.csv"
+    path.write_text("1,2,3\n4,,6\n7,8.5,9\n")
+    out = read_matrix(str(path))
+    assert np.isnan(out[1, 1])
+    assert out[2, 1] == 8.5
+
+
+@pytest.mark.parametrize("text", ["1,2,3\n4,5\n", "1,2,3\n4,5,6,7\n"])
+def test_ragged_rows(tmp_path, text):
+    path = tmp_path / "cost.csv"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        read_matrix(str(path))
+
+
+def test_wrong_row_count(tmp_path):
+    path = _write_csv(tmp_path / "cost.csv", MATRIX[:10])
+    with pytest.raises(ValueError):
+        read_matrix(str(path), out=np.zeros((11, 5)))
+
+
+@pytest.mark.parametrize("text", ["5\n7\n9\n", "5,7,9\n"])
+def test_vector(tmp_path, text):
+    path = tmp_path / "supply.csv"
+    path.write_text(text)
+    assert np.array_equal(read_vector(str(path)), [5, 7, 9])
+
+
+def test_vector_needs_one_line(tmp_path):
+    path = tmp_path / "supply.csv"
+    path.write_text("1,2\n3,4\n")
+    with pytest.raises(ValueError):
+        read_vector(str(path))
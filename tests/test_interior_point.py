@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.optimize import linprog
+
+from solvers import interior_point_method, two_phase_method
+
+
+def _linprog(c, A, b, types, Min):
+    """Optimal value by linprog, or the status ("infeasible", "unbounded") it reports."""
+    A, b, types = np.asarray(A, dtype=float), np.asarray(b, dtype=float), np.asarray(types)
+    sign = np.where(types == '>=', -1.0, 1.0)
+    ineq = types != '='
+    result = linprog(np.asarray(c) * (1 if Min else -1),
+                     A_ub=(A * sign[:, None])[ineq] if ineq.any() else None,
+                     b_ub=(b * sign)[ineq] if ineq.any() else None,
+                     A_eq=A[~ineq] if (~ineq).any() else None, b_eq=b[~ineq] if (~ineq).any() else None)
+    if result.status == 0:
+        return result.fun * (1 if Min else -1)
+    return {2: "infeasible", 3: "unbounded"}[result.status]
+
+
+CASES = [
+    ([3, 2], [[2, 1], [1, 2]], [8, 6], ['<=', '<='], False),
+    ([2, 3], [[1, 1], [1, -1], [0, 1]], [4, 1, 3], ['>=', '<=', '='], True),
+    # Degenerate: the whole edge x1 + x2 = 4 is optimal
+    ([1, 1], [[1, 1], [1, 0], [0, 1]], [4, 3, 3], ['<=', '<=', '<='], False),
+    # Redundant equalities
+    ([1, 2, 3], [[1, 1, 1], [2, 2, 2], [1, 0, 1]], [4, 8, 2], ['=', '=', '>='], True),
+    ([1, 0], [[1, 1], [1, 1]], [2, 1], ['>=', '<='], False),
+    ([1, 1], [[1, -1]], [1], ['>='], False),
+    ([0, 0], [[1, 1]], [0], ['<='], False),
+]
+
+
+@pytest.mark.parametrize("presolve", [True, False])
+@pytest.mark.parametrize("crossover", [False, True])
+@pytest.mark.parametrize("c, A, b, types, Min", CASES)
+def test_interior_point(c, A, b, types, Min, crossover, presolve):
+    value, solution = interior_point_method(c, A, b, types, Min=Min, crossover=crossover, presolve=presolve)
+    expected = _linprog(c, A, b, types, Min)
+    if isinstance(expected, str):
+        assert value == f"Problem is {expected}"
+        return
+    assert value == pytest.approx(expected, rel=1e-6, abs=1e-6)
+    assert np.all(solution >= -1e-6)
+    activity = np.asarray(A, dtype=float) @ solution
+    for row, rhs, kind in zip(activity, b, types):
+        assert {'<=': row <= rhs + 1e-6, '>=': row >= rhs - 1e-6, '=': abs(row - rhs) <= 1e-6}[kind]
+
+
+def test_crossover_corner_point():
+    c, A, b, types, Min = CASES[2]
+    _, middle = interior_point_method(c, A, b, types, Min=Min, presolve=False)
+    value, corner = interior_point_method(c, A, b, types, Min=Min, crossover=True, presolve=False)
+    # The interior point stops inside the optimal edge, crossover at one of its ends
+    assert np.all(middle > 0.5)
+    assert sorted(corner) == pytest.approx([1, 3])
+    assert value == pytest.approx(two_phase_method(c, A, b, types, Min=Min)[0], abs=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(15))
+def test_interior_point_random(seed):
+    rng = np.random.default_rng(seed)
+    m, n = rng.integers(2, 8), rng.integers(2, 10)
+    A = rng.integers(-3, 8, size=(m, n)).astype(float)
+    b = rng.integers(0, 30, size=m).astype(float)
+    types = list(rng.choice(['<=', '>=', '='], size=m, p=[0.6, 0.25, 0.15]))
+    c = rng.integers(-4, 9, size=n).astype(float)
+    value, solution = interior_point_method(c, A, b, types, Min=bool(seed % 2))
+    if isinstance(value, str):
+        # Boxed in, an unbounded problem has an optimum and an infeasible one stays infeasible
+        boxed = _linprog(c, np.vstack([A, np.eye(n)]), np.append(b, np.full(n, 1e6)), types + ['<='] * n, True)
+        assert value == ("Problem is infeasible" if boxed == "infeasible" else "Problem is unbounded")
+    else:
+        assert value == pytest.approx(_linprog(c, A, b, types, bool(seed % 2)), rel=1e-6, abs=1e-6)
+
+
+def test_interior_point_sparse_stats():
+    rng = np.random.default_rng(0)
+    A = sparse.random(60, 120, density=0.05, random_state=1, format="csr") + sparse.hstack([sparse.eye(60)] * 2)
+    b = rng.uniform(1, 10, 60)
+    c = rng.uniform(0, 5, 120)
+    value, _, stats = interior_point_method(c, A, b, Min=False, return_stats=True)
+    assert value == pytest.approx(_linprog(c, A.toarray(), b, ['<='] * 60, False), rel=1e-6)
+    assert 0 < stats["iterations"] < 200
+    assert stats["crossover_pivots"] is None
+    assert max(stats["primal_residual"], stats["dual_residual"]) < 1e-6
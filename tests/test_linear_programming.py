@@ -0,0 +1,278 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.optimize import LinearConstraint, linprog, milp
+
+from solvers import (BranchAndBound, big_m_method, integer_simplex, interior_point_method,
+                     simplex_method, two_phase_method)
+from solvers.linear_programming import CUT_ROUNDS
+
+
+def _linprog(c, A, b, types, Min):
+    """Optimal value by linprog, or the status ("infeasible", "unbounded") it reports."""
+    A, b, types = np.asarray(A, dtype=float), np.asarray(b, dtype=float), np.asarray(types)
+    sign = np.where(types == '>=', -1.0, 1.0)
+    ineq = types != '='
+    result = linprog(np.asarray(c) * (1 if Min else -1),
+                     A_ub=(A * sign[:, None])[ineq] if ineq.any() else None,
+                     b_ub=(b * sign)[ineq] if ineq.any() else None,
+                     A_eq=A[~ineq] if (~ineq).any() else None, b_eq=b[~ineq] if (~ineq).any() else None)
+    if result.status == 0:
+        return result.fun * (1 if Min else -1)
+    return {2: "infeasible", 3: "unbounded"}[result.status]
+
+
+def _check(value, solution, c, A, b, types, Min, tolerance=1e-8):
+    expected = _linprog(c, A, b, types, Min)
+    if isinstance(expected, str):
+        assert value == f"Problem is {expected}"
+        return
+    assert value == pytest.approx(expected, rel=tolerance, abs=tolerance)
+    assert np.dot(c, solution) == pytest.approx(value, rel=tolerance, abs=tolerance)
+    assert np.all(solution >= -tolerance)
+    activity = np.asarray(A, dtype=float) @ solution
+    for row, rhs, kind in zip(activity, b, types):
+        assert {'<=': row <= rhs + tolerance, '>=': row >= rhs - tolerance,
+                '=': abs(row - rhs) <= tolerance}[kind]
+
+
+SIMPLEX_CASES = [
+    ([3, 2], [[2, 1], [1, 2]], [8, 6], False),
+    ([3, 2], [[2, 1], [1, 2]], [8, 6], True),
+    # Beale's example, which cycles under the textbook pivoting rule
+    ([0.75, -150, 0.02, -6], [[0.25, -60, -0.04, 9], [0.5, -90, -0.02, 3], [0, 0, 1, 0]], [0, 0, 1], False),
+    # Degenerate vertex shared by three constraints
+    ([1, 1], [[1, 0], [0, 1], [1, 1]], [1, 1, 2], False),
+    # Negative right-hand side: the first phase finds a feasible basis
+    ([1, 2], [[-1, -1], [1, 0], [0, 1]], [-2, 5, 5], True),
+    ([1, 1], [[1, -1]], [1], False),
+    ([1, 1], [[1, 1]], [-1], False),
+    ([-1, -1], [[1, -1], [-1, 1]], [0, 0], False),
+]
+
+
+@pytest.mark.parametrize("presolve", [True, False])
+@pytest.mark.parametrize("c, A, b, Min", SIMPLEX_CASES)
+def test_simplex(c, A, b, Min, presolve):
+    value, solution = simplex_method(c, A, b, Min=Min, presolve=presolve)
+    _check(value, solution, c, A, b, ['<='] * len(b), Min)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_simplex_random(seed):
+    rng = np.random.default_rng(seed)
+    m, n = rng.integers(2, 8, size=2)
+    A = rng.integers(-3, 8, size=(m, n)).astype(float)
+    b = rng.integers(-2, 20, size=m).astype(float)
+    c = rng.integers(-4, 9, size=n).astype(float)
+    Min = bool(seed % 2)
+    value, solution = simplex_method(c, A, b, Min=Min)
+    _check(value, solution, c, A, b, ['<='] * m, Min)
+
+
+def _formats(A):
+    dense = np.asarray(A, dtype=float)
+    rows, cols = np.nonzero(dense)
+    return [dense, sparse.csr_matrix(dense), sparse.coo_matrix(dense), (dense[rows, cols], (rows, cols))]
+
+
+MIXED_CASES = [
+    ([2, 3], [[1, 1], [1, -1], [0, 1]], [4, 1, 3], ['>=', '<=', '='], True),
+    ([3, 2], [[2, 1], [1, 2], [1, 1]], [8, 6, 1], ['<=', '<=', '>='], False),
+    ([1, 0], [[1, 1], [1, 1]], [2, 1], ['>=', '<='], False),
+    ([1, 1], [[1, -1]], [1], ['>='], False),
+]
+
+
+@pytest.mark.parametrize("c, A, b, types, Min", MIXED_CASES)
+@pytest.mark.parametrize("method", [big_m_method, two_phase_method, interior_point_method])
+@pytest.mark.parametrize("form", range(4))
+def test_sparse_constraints(c, A, b, types, Min, method, form):
+    value, solution = method(c, _formats(A)[form], b, types, Min=Min)
+    # The interior point stops within a relative gap of IPM_TOLERANCE
+    _check(value, solution, c, A, b, types, Min, 1e-6 if method is interior_point_method else 1e-8)
+
+
+@pytest.mark.parametrize("c, A, b, Min", SIMPLEX_CASES)
+@pytest.mark.parametrize("form", range(4))
+def test_sparse_simplex(c, A, b, Min, form):
+    value, solution = simplex_method(c, _formats(A)[form], b, Min=Min)
+    _check(value, solution, c, A, b, ['<='] * len(b), Min)
+
+
+@pytest.mark.parametrize("form", range(4))
+def test_sparse_integer(form):
+    A = [[6, 4, 0], [1, 2, 0], [0, 1, 3]]
+    value, solution = integer_simplex([5, 4, 1], _formats(A)[form], [24, 6, 7])
+    expected = milp([-5, -4, -1], constraints=LinearConstraint(A, -np.inf, [24, 6, 7]), integrality=np.ones(3))
+    assert value == pytest.approx(-expected.fun)
+    assert solution == pytest.approx(np.round(solution))
+
+
+WARM_BASE = ([3, 2, 4], [[2, 1, 1], [1, 2, 3], [2, 2, 1]], [8, 6, 7])
+
+
+@pytest.mark.parametrize("edit", ["rhs", "row", "objective", "infeasible row"])
+def test_simplex_warm_start(edit):
+    c, A, b = (np.array(part, dtype=float) for part in WARM_BASE)
+    _, _, basis = simplex_method(c, A, b, return_basis=True)
+    if edit == "rhs":
+        b = b + [-1, 2, -3]
+    elif edit == "row":
+        A, b = np.vstack([A, [1, 0, 1]]), np.append(b, 1.5)
+    elif edit == "objective":
+        c = np.array([1, 5, 1.0])
+    else:
+        A, b = np.vstack([A, [-1, -1, -1]]), np.append(b, -20)
+    value, solution, warm = simplex_method(c, A, b, warm_start=basis, return_basis=True)
+    _check(value, solution, c, A, b, ['<='] * len(b), False)
+    if edit == "infeasible row":
+        assert warm is None
+    else:
+        assert warm.warm_started
+        assert warm.shape == A.shape
+
+
+@pytest.mark.parametrize("method", [big_m_method, two_phase_method])
+def test_mixed_warm_start(method):
+    c, A, b, types, Min = MIXED_CASES[1]
+    _, _, basis = method(c, A, b, types, Min=Min, return_basis=True)
+    b = [7, 6, 2]
+    value, solution, warm = method(c, A, b, types, Min=Min, warm_start=basis, return_basis=True)
+    _check(value, solution, c, A, b, types, Min)
+    assert warm.warm_started
+
+
+def test_warm_start_other_variables():
+    _, _, basis = simplex_method(*WARM_BASE, return_basis=True)
+    value, solution, warm = simplex_method([3, 2], [[2, 1], [1, 2]], [8, 6], warm_start=basis, return_basis=True)
+    assert value == pytest.approx(38 / 3)
+    assert not warm.warm_started
+
+
+def _milp(c, A, b, Min):
+    """Optimal integer value by milp, or -inf (inf when minimizing) with no integer solution."""
+    result = milp(np.asarray(c, dtype=float) * (1 if Min else -1),
+                  constraints=LinearConstraint(A, -np.inf, b), integrality=np.ones(len(c)))
+    if result.status == 0:
+        return result.fun * (1 if Min else -1)
+    return np.inf if Min else -np.inf
+
+
+INTEGER_CASES = [
+    ([5, 4], [[6, 4], [1, 2]], [24, 6], False),
+    ([3, 2], [[2, 1], [1, 2]], [8, 6], False),
+    # 0-1 knapsack
+    ([8, 11, 6, 4], [[5, 7, 4, 3], [1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]], [14, 1, 1, 1, 1], False),
+    ([1, 1], [[-2, -2]], [-3], True),
+    ([2, 3, 1], [[-1, -1, -1], [-2, 0, -1], [1, 1, 1]], [-4.5, -3, 10], True),
+    # LP feasible, no integer point: x1 = 0.5
+    ([1, 0], [[2, 0], [-2, 0]], [1, -1], False),
+    ([1, 0], [[2, 0], [-2, 0]], [1, -1], True),
+    ([1, 1], [[1, 1]], [-1], False),
+]
+
+
+@pytest.mark.parametrize("c, A, b, Min", INTEGER_CASES)
+@pytest.mark.parametrize("branching", ["pseudocost", "most_fractional"])
+def test_branch_and_bound(c, A, b, Min, branching):
+    value, solution = integer_simplex(c, A, b, Min=Min, branching=branching)
+    expected = _milp(c, A, b, Min)
+    assert value == pytest.approx(expected)
+    if np.isfinite(expected):
+        assert solution == pytest.approx(np.round(solution), abs=1e-6)
+        assert np.all(np.asarray(A) @ solution <= np.asarray(b) + 1e-9)
+
+
+def test_branch_and_bound_unbounded():
+    assert integer_simplex([1, 1], [[1, -1]], [1]) == ("Problem is unbounded", None)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_branch_and_bound_random(seed):
+    rng = np.random.default_rng(seed)
+    A = rng.integers(1, 10, size=(4, 6)).astype(float)
+    b = rng.integers(10, 40, size=4).astype(float)
+    c = rng.integers(1, 10, size=6).astype(float)
+    tree = BranchAndBound(c, A, b, max_workers=1 + seed % 2)
+    value, solution = tree.run()
+    assert value == pytest.approx(_milp(c, A, b, False))
+    assert tree.stats()["gap"] == pytest.approx(0)
+    assert tree.stats()["open_nodes"] == 0
+
+
+def test_branch_and_bound_gap():
+    c, A, b, _ = INTEGER_CASES[2]
+    tree = BranchAndBound(c, A, b, mip_gap=0.5)
+    value, _ = tree.run()
+    assert value <= _milp(c, A, b, False)
+    assert tree.gap <= 0.5
+
+
+@pytest.mark.parametrize("c, A, b, Min", INTEGER_CASES)
+@pytest.mark.parametrize("cuts", ["root", "nodes"])
+def test_gomory_cuts(c, A, b, Min, cuts):
+    value, solution = integer_simplex(c, A, b, Min=Min, cuts=cuts)
+    assert value == pytest.approx(_milp(c, A, b, Min))
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_gomory_cuts_tighten_root(seed):
+    rng = np.random.default_rng(seed)
+    A = rng.integers(1, 10, size=(4, 6)).astype(float)
+    b = rng.integers(10, 40, size=4).astype(float)
+    c = rng.integers(1, 10, size=6).astype(float)
+    plain = BranchAndBound(c, A, b)
+    tree = BranchAndBound(c, A, b, cuts="root")
+    assert tree.run()[0] == pytest.approx(plain.run()[0])
+    stats = tree.stats()
+    # Cuts only remove fractional points: the root bound can drop, never below the optimum
+    assert tree.incumbent - 1e-9 <= stats["cut_bound"] <= stats["root_bound"] + 1e-9
+    assert len(stats["cut_rounds"]) <= CUT_ROUNDS
+
+
+ARTIFICIAL_CASES = MIXED_CASES + [
+    # Costs and right-hand sides larger than the Big M penalty
+    ([5000, 1], [[1, 1], [1, 0]], [2, 1], ['=', '>='], False),
+    ([1, 1], [[1, 1], [1, -1]], [5000, 1], ['>=', '='], True),
+    # Redundant equality: one artificial stays basic at zero
+    ([1, 2, 3], [[1, 1, 1], [2, 2, 2], [1, 0, 1]], [4, 8, 2], ['=', '=', '>='], True),
+    ([1, 1], [[1, 1], [1, 1]], [1, 2], ['=', '='], True),
+    ([-1, 0], [[1, -1]], [-1], ['='], True),
+]
+
+
+@pytest.mark.parametrize("presolve", [True, False])
+@pytest.mark.parametrize("c, A, b, types, Min", ARTIFICIAL_CASES)
+@pytest.mark.parametrize("method", [big_m_method, two_phase_method])
+def test_artificial_methods(c, A, b, types, Min, method, presolve):
+    value, solution = method(c, A, b, types, Min=Min, presolve=presolve)
+    _check(value, solution, c, A, b, types, Min)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_big_m_matches_two_phase(seed):
+    rng = np.random.default_rng(seed)
+    m, n = rng.integers(2, 6), rng.integers(2, 8)
+    A = rng.integers(-3, 8, size=(m, n)).astype(float)
+    b = rng.integers(0, 30, size=m).astype(float)
+    types = list(rng.choice(['<=', '>=', '='], size=m, p=[0.6, 0.25, 0.15]))
+    c = rng.integers(-4, 9, size=n).astype(float)
+    big_m = big_m_method(c, A, b, types, Min=bool(seed % 2))
+    two_phase = two_phase_method(c, A, b, types, Min=bool(seed % 2))
+    if isinstance(two_phase[0], str):
+        assert big_m[0] == two_phase[0]
+        # Boxed in, an unbounded problem has an optimum and an infeasible one stays infeasible
+        boxed = _linprog(c, np.vstack([A, np.eye(n)]), np.append(b, np.full(n, 1e6)), types + ['<='] * n, True)
+        assert two_phase[0] == ("Problem is infeasible" if boxed == "infeasible" else "Problem is unbounded")
+    else:
+        assert big_m[0] == pytest.approx(two_phase[0], abs=1e-8)
+        _check(*two_phase, c, A, b, types, bool(seed % 2))
+
+
+def test_phase_one_iterations():
+    c, A, b, types, Min = MIXED_CASES[0]
+    _, _, big_m = big_m_method(c, A, b, types, Min=Min, return_basis=True)
+    _, _, two_phase = two_phase_method(c, A, b, types, Min=Min, return_basis=True)
+    assert big_m.phase_one_iterations == 0
+    assert 0 < two_phase.phase_one_iterations <= two_phase.iterations
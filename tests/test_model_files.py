@@ -0,0 +1,226 @@
+import gzip
+import io
+import json
+
+import numpy as np
+import pytest
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+from solvers import read_lp, read_model, read_mps
+from solvers.__main__ import main
+
+TESTLP_MPS = """\
+NAME          TESTLP
+ROWS
+ N  COST
+ L  LIM1
+ G  LIM2
+ E  MYEQN
+COLUMNS
+    XONE      COST         1.0   LIM1         1.0
+    XONE      LIM2         1.0
+    YTWO      COST         2.0   LIM1         1.0
+    YTWO      MYEQN       -1.0
+    ZTHREE    COST        -1.0   MYEQN        1.0
+RHS
+    RHS       COST        -5.0
+    RHS       LIM1         4.0   LIM2         1.0
+    RHS       MYEQN        7.0
+RANGES
+    RNG       LIM1         2.5
+BOUNDS
+ UP BND       XONE         4.0
+ LO BND       YTWO         1.0
+ UP BND       YTWO         3.0
+ENDATA
+"""
+
+TESTLP_LP = """\
+\\ The same model as TESTLP_MPS
+Minimize
+ obj: x1 + 2 y2 - z3 + 5
+Subject To
+ lim1: x1 + y2 <= 4
+ lim1r: x1 + y2 >= 1.5
+ lim2: x1 >= 1
+ myeqn: - y2
+   + z3 = 7
+Bounds
+ x1 <= 4
+ 1 <= y2 <= 3
+End
+"""
+
+
+def _milp(c, A, b, types, Min, upper=None, integer=None):
+    """Optimal value by milp, or the status ("infeasible", "unbounded") it reports."""
+    c, A, b = (np.asarray(part, dtype=float) for part in (c, A, b))
+    types = np.asarray(types)
+    low = np.where(types == '<=', -np.inf, b)
+    high = np.where(types == '>=', np.inf, b)
+    result = milp(c if Min else -c, constraints=LinearConstraint(A, low, high),
+                  bounds=Bounds(0, np.inf if upper is None else upper),
+                  integrality=None if integer is None else integer.astype(int))
+    if result.status == 0:
+        return result.fun * (1 if Min else -1)
+    return {2: "infeasible", 3: "unbounded"}[result.status]
+
+
+def _to_mps(c, A, b, types, Min, upper, integer):
+    lines = ["NAME          RANDOM", "OBJSENSE", "    MAX" if not Min else "    MIN", "ROWS", " N  OBJ"]
+    lines += [f" {dict(zip(['<=', '>=', '='], 'LGE'))[kind]}  R{i}" for i, kind in enumerate(types)]
+    lines.append("COLUMNS")
+    for j in range(len(c)):
+        if integer[j]:
+            lines.append("    M         'MARKER'                 'INTORG'")
+        lines.append(f"    X{j}        OBJ       {c[j]:g}")
+        lines += [f"    X{j}        R{i}        {A[i, j]:g}" for i in np.flatnonzero(A[:, j])]
+        if integer[j]:
+            lines.append("    M         'MARKER'                 'INTEND'")
+    lines.append("RHS")
+    lines += [f"    RHS       R{i}        {value:g}" for i, value in enumerate(b)]
+    lines.append("BOUNDS")
+    lines += [f" UP BND       X{j}        {value:g}" for j, value in enumerate(upper) if np.isfinite(value)]
+    return "\n".join(lines + ["ENDATA", ""])
+
+
+def _to_lp(c, A, b, types, Min, upper, integer):
+    def terms(row):
+        return " ".join(f"{'-' if value < 0 else '+'} {abs(value):g} X{j}" for j, value in enumerate(row))
+    lines = ["Minimize" if Min else "Maximize", f" obj: {terms(c)}", "Subject To"]
+    lines += [f" R{i}: {terms(row)} {kind} {value:g}" for i, (row, kind, value) in enumerate(zip(A, types, b))]
+    lines.append("Bounds")
+    lines += [f" X{j} <= {value:g}" for j, value in enumerate(upper) if np.isfinite(value)]
+    lines += ["Generals", " " + " ".join(f"X{j}" for j in np.flatnonzero(integer))] if integer.any() else []
+    return "\n".join(lines + ["End", ""])
+
+
+def _random_model(seed):
+    rng = np.random.default_rng(seed)
+    m, n = rng.integers(2, 6), rng.integers(2, 7)
+    A = rng.integers(-3, 8, size=(m, n)).astype(float)
+    A[np.arange(m), rng.integers(0, n, size=m)] = rng.integers(1, 8, size=m)
+    b = rng.integers(0, 30, size=m).astype(float)
+    types = list(rng.choice(['<=', '>=', '='], size=m, p=[0.6, 0.25, 0.15]))
+    c = rng.integers(-4, 9, size=n).astype(float)
+    upper = np.where(rng.random(n) < 0.4, rng.integers(1, 10, size=n), np.inf)
+    integer = rng.random(n) < 0.3
+    return c, A, b, types, bool(seed % 2), upper, integer
+
+
+def test_testlp():
+    mps = read_mps(io.StringIO(TESTLP_MPS))
+    lp = read_lp(io.StringIO(TESTLP_LP))
+    assert mps.name == "TESTLP"
+    assert mps.Min and lp.Min
+    assert mps.offset == lp.offset == 5
+    expected = _milp([1, 2, -1], [[1, 1, 0], [1, 1, 0], [1, 0, 0], [0, -1, 1], [0, 1, 0]], [4, 1.5, 1, 7, 1],
+                     ['<=', '>=', '>=', '=', '>='], True, upper=[4, 3, np.inf]) + 5
+    assert mps.solve()[0] == pytest.approx(expected)
+    assert lp.solve()[0] == pytest.approx(expected)
+    assert mps.constraints[-4:] == ["LIM1.range", "XONE.upper", "YTWO.lower", "YTWO.upper"]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_round_trip(seed):
+    c, A, b, types, Min, upper, integer = _random_model(seed)
+    mps = read_mps(io.StringIO(_to_mps(c, A, b, types, Min, upper, integer)))
+    lp = read_lp(io.StringIO(_to_lp(c, A, b, types, Min, upper, integer)))
+    for model in (mps, lp):
+        assert model.variables == [f"X{j}" for j in range(len(c))]
+        assert model.Min == Min
+        assert np.array_equal(model.c, c)
+        assert np.array_equal(model.A.toarray()[:len(b)], A)
+        assert np.array_equal(model.b[:len(b)], b)
+        assert model.constraint_types[:len(b)] == types
+        assert np.array_equal(model.integer, integer)
+        assert model.A.shape[0] == len(b) + np.isfinite(upper).sum()
+    expected = _milp(c, A, b, types, Min, upper)
+    value, solution = mps.solve('two_phase')
+    assert lp.solve('two_phase')[0] == value
+    if isinstance(expected, str):
+        assert value == f"Problem is {expected}"
+    else:
+        assert value == pytest.approx(expected, abs=1e-8)
+        assert np.all(solution <= upper + 1e-9)
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_integer_model(seed):
+    c, A, b, types, Min, upper, _ = _random_model(seed)
+    integer = np.ones(len(c), dtype=bool)
+    model = read_lp(io.StringIO(_to_lp(c, A, b, types, Min, upper, integer)))
+    assert model.default_method() == 'integer'
+    assert model.relaxed_integers('integer') == 0
+    expected = _milp(c, A, b, types, Min, upper, integer)
+    value, _ = model.solve()
+    if isinstance(expected, str):
+        assert value == f"Problem is {expected}"
+    else:
+        assert value == pytest.approx(expected, abs=1e-8)
+
+
+def test_mixed_integer_relaxed():
+    c, A, b, types, Min, upper, integer = _random_model(4)
+    integer[:] = False
+    integer[0] = True
+    model = read_mps(io.StringIO(_to_mps(c, A, b, types, Min, upper, integer)))
+    method = model.default_method()
+    assert method in ('simplex', 'two_phase')
+    assert model.relaxed_integers(method) == 1
+    assert model.solve()[0] == pytest.approx(_milp(c, A, b, types, Min, upper))
+    with pytest.raises(ValueError):
+        model.solve('integer')
+
+
+@pytest.mark.parametrize("text, fmt", [
+    ("NAME X\nSECTION\nENDATA\n", "mps"),
+    ("ROWS\n N OBJ\nCOLUMNS\n    X1 R9 1\nENDATA\n", "mps"),
+    ("ROWS\n N OBJ\n L R1\nCOLUMNS\n    X1 R1 1\nBOUNDS\n MI BND X1\nENDATA\n", "mps"),
+    ("ROWS\n N OBJ\n L R1\nCOLUMNS\n    X1 R1 one\nENDATA\n", "mps"),
+    ("Maximize\n x + y\nSubject To\n c1: x + y\nEnd\n", "lp"),
+    ("Maximize\n x\nSubject To\n c1: x <= 1\nBounds\n x free\nEnd\n", "lp"),
+    ("x + y <= 1\n", "lp"),
+])
+def test_errors(text, fmt):
+    with pytest.raises(ValueError):
+        read_model(io.StringIO(text), fmt)
+
+
+def test_gzip(tmp_path):
+    path = tmp_path / "testlp.mps.gz"
+    with gzip.open(path, "wt") as stream:
+        stream.write(TESTLP_MPS)
+    assert read_model(str(path)).solve()[0] == pytest.approx(read_mps(io.StringIO(TESTLP_MPS)).solve()[0])
+
+
+def test_cli(tmp_path, capsys):
+    models = tmp_path / "models"
+    for sub in ("east", "west"):
+        (models / sub).mkdir(parents=True)
+    (models / "testlp.mps").write_text(TESTLP_MPS)
+    (models / "east" / "model.lp").write_text(TESTLP_LP)
+    (models / "west" / "model.lp").write_text("Maximize\n x + y\nSubject To\n c1: x - y <= 1\nEnd\n")
+    (models / "broken.lp").write_text("Maximize\n x +\nSubject To\n c1: x <= \nEnd\n")
+    out = tmp_path / "out"
+
+    assert main([str(models), "-o", str(out), "--recursive", "--workers", "2"]) == 1
+    expected = read_mps(io.StringIO(TESTLP_MPS)).solve()[0]
+    results = {path.relative_to(out).as_posix(): json.loads(path.read_text()) for path in out.rglob("*.json")}
+    assert set(results) == {"testlp.mps.json", "east/model.lp.json", "west/model.lp.json", "broken.lp.json"}
+    assert results["testlp.mps.json"]["objective"] == pytest.approx(expected)
+    assert results["testlp.mps.json"]["variables"]["XONE"] >= 0
+    assert results["east/model.lp.json"]["objective"] == pytest.approx(expected)
+    assert results["west/model.lp.json"]["status"] == "unbounded"
+    assert results["broken.lp.json"]["status"] == "error"
+    assert "4 models, 1 failed" in capsys.readouterr().out
+
+    # Without --recursive only the top-level files are solved
+    (models / "broken.lp").unlink()
+    assert main([str(models), "-o", str(tmp_path / "top")]) == 0
+    assert [path.name for path in (tmp_path / "top").rglob("*.json")] == ["testlp.mps.json"]
+
+
+def test_cli_no_models(tmp_path):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path)])
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.optimize import LinearConstraint, milp
+
+from solvers import presolve
+
+
+def _optimum(c, A, b, types, Min, integer=False):
+    """(value, x) by milp, or (status, None) for "infeasible" and "unbounded"."""
+    c = np.asarray(c, dtype=float)
+    A = A.toarray() if sparse.issparse(A) else np.asarray(A, dtype=float).reshape(len(b), len(c))
+    types = np.asarray(types)
+    low = np.where(types == '<=', -np.inf, b)
+    high = np.where(types == '>=', np.inf, b)
+    constraints = LinearConstraint(A, low, high) if len(b) else None
+    result = milp(c if Min else -c, constraints=constraints, integrality=np.full(len(c), int(integer)))
+    if result.status == 0:
+        return c @ result.x, result.x
+    return {2: "infeasible", 3: "unbounded"}.get(result.status, "infeasible or unbounded"), None
+
+
+def _random_problem(seed):
+    rng = np.random.default_rng(seed)
+    m, n = rng.integers(2, 7), rng.integers(2, 7)
+    A = rng.integers(-2, 6, size=(m, n)) * (rng.random((m, n)) < 0.6)
+    # Singleton rows become bounds, and duplicated rows are merged
+    bounds = np.eye(n)[rng.choice(n, size=rng.integers(1, n + 1), replace=False)]
+    A = np.vstack([A, bounds, 2 * A[:1]]).astype(float)
+    b = np.concatenate([rng.integers(1, 20, size=m), rng.integers(1, 6, size=len(bounds)), [0]]).astype(float)
+    b[-1] = 2 * b[0]
+    types = np.where(rng.random(len(b)) < 0.8, '<=', '>=')
+    types[m:m + len(bounds)] = '<='
+    types[-1] = types[0]
+    c = rng.integers(-3, 8, size=n).astype(float)
+    return c, A, b, list(types), bool(seed % 2)
+
+
+CASES = [
+    ([3, 2], [[2, 1], [1, 2]], [8, 6], ['<=', '<='], False),
+    ([2, 3], [[1, 1], [1, -1], [0, 1]], [4, 1, 3], ['>=', '<=', '='], True),
+    # Duplicate and empty rows
+    ([1, 2], [[1, 1], [2, 2], [0, 0]], [4, 8, 0], ['<=', '<=', '<='], False),
+    # Singleton rows only: presolve solves it
+    ([1, 1], [[1, 0], [0, 1], [1, 1]], [3, 4, 10], ['<=', '<=', '<='], False),
+    ([3, 2], [[1, 0], [0, 1], [1, 1]], [2.5, 3.5, 5], ['<=', '<=', '<='], False),
+]
+
+
+@pytest.mark.parametrize("integer", [False, True])
+@pytest.mark.parametrize("c, A, b, types, Min", CASES + [_random_problem(seed) for seed in range(30)])
+def test_postsolve_optimal(c, A, b, types, Min, integer):
+    reduced = presolve(c, A, b, types, Min=Min, integer=integer)
+    expected, _ = _optimum(c, A, b, types, Min, integer)
+    if reduced.status in ('infeasible', 'unbounded'):
+        assert expected in (reduced.status, "infeasible or unbounded")
+        return
+    if reduced.status == 'solved':
+        x = reduced.postsolve(np.empty(0))
+    else:
+        value, x = _optimum(reduced.c, reduced.A, reduced.b, reduced.constraint_types, Min, integer)
+        if isinstance(value, str):
+            assert expected in (value, "infeasible or unbounded")
+            return
+        x = reduced.postsolve(x)
+        assert np.dot(c, x) == pytest.approx(value + reduced.offset, abs=1e-7)
+    assert np.dot(c, x) == pytest.approx(expected, abs=1e-7)
+    assert np.all(x >= -1e-9)
+    activity = np.asarray(A, dtype=float) @ x
+    for row, rhs, kind in zip(activity, b, types):
+        assert {'<=': row <= rhs + 1e-7, '>=': row >= rhs - 1e-7, '=': abs(row - rhs) <= 1e-7}[kind]
+
+
+@pytest.mark.parametrize("integer", [False, True])
+@pytest.mark.parametrize("seed", range(30))
+def test_rows_never_grow(seed, integer):
+    c, A, b, types, Min = _random_problem(seed)
+    reduced = presolve(c, A, b, types, Min=Min, integer=integer)
+    if reduced.status == 'reduced':
+        assert reduced.summary["rows_after"] <= reduced.summary["rows_before"]
+        assert reduced.A.shape[0] == len(reduced.b) == reduced.summary["rows_after"]
+
+
+def test_implied_bounds_add_no_rows():
+    # Each variable is bounded by a singleton row that the knapsack row already implies
+    A = np.vstack([np.full((1, 15), 1.0), np.eye(15)[:5]])
+    reduced = presolve(np.arange(1, 16), A, [3] + [5] * 5, ['<='] * 6)
+    assert reduced.A.shape[0] == 1
+
+
+@pytest.mark.parametrize("c, A, b, types, status", [
+    ([1, 2], [[0, 0]], [-1], ['<='], 'infeasible'),
+    ([1, 1], [[1, 0], [1, 0]], [2, 3], ['=', '='], 'infeasible'),
+    ([1, 2], [[1, 0]], [3], ['<='], 'unbounded'),
+    ([1, -1], [[1, 0]], [3], ['<='], 'solved'),
+])
+def test_status(c, A, b, types, status):
+    reduced = presolve(c, A, b, types)
+    assert reduced.status == status
+    assert reduced.describe()
+
+
+def test_sparse_input_stays_sparse():
+    c, A, b, types, Min = CASES[2]
+    reduced = presolve(c, sparse.csr_matrix(A), b, types, Min=Min)
+    assert sparse.issparse(reduced.A)
+    assert reduced.summary["duplicate_rows"] == 1
+    assert reduced.summary["empty_rows"] == 1
@@ -0,0 +1,234 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.optimize import linear_sum_assignment, linprog
+
+from solvers import TransportationProblem
+
+
+def _optimal_cost(cost, supply, demand):
+    """Minimum cost of the balanced problem by linprog; np.inf in cost forbids a lane."""
+    cost = np.asarray(cost, dtype=float)
+    m, n = cost.shape
+    allowed = np.isfinite(cost)
+    rows, cols = np.nonzero(allowed)
+    A_eq = np.zeros((m + n, len(rows)))
+    A_eq[rows, np.arange(len(rows))] = 1
+    A_eq[m + cols, np.arange(len(rows))] = 1
+    result = linprog(cost[allowed], A_eq=A_eq, b_eq=np.concatenate([supply, demand]))
+    return result.fun if result.status == 0 else None
+
+
+def _check_feasible(allocation, supply, demand):
+    allocation = np.asarray(allocation.toarray() if sparse.issparse(allocation) else allocation)
+    assert np.all(allocation >= 0)
+    assert allocation.sum(axis=1) == pytest.approx(supply)
+    assert allocation.sum(axis=0) == pytest.approx(demand)
+
+
+CASES = [
+    ([[19, 30, 50, 10], [70, 30, 40, 60], [40, 8, 70, 20]], [7, 9, 18], [5, 8, 7, 14]),
+    ([[4, 8, 8], [16, 24, 16], [8, 16, 24]], [76, 82, 77], [72, 102, 61]),
+    # Degenerate: partial supplies and demands coincide
+    ([[2, 3, 1], [5, 4, 8], [5, 6, 8]], [20, 30, 50], [20, 30, 50]),
+    ([[3, 1, 7, 4], [2, 6, 5, 9], [8, 3, 3, 2]], [300, 400, 500], [250, 350, 400, 200]),
+]
+
+
+@pytest.mark.parametrize("cost, supply, demand", CASES)
+@pytest.mark.parametrize("method", ["NWCR", "LCM", "VAM"])
+def test_initial_solution_feasible(cost, supply, demand, method):
+    allocation = TransportationProblem(cost, supply, demand).solve(method)
+    _check_feasible(allocation, supply, demand)
+    assert np.count_nonzero(allocation) <= len(supply) + len(demand) - 1
+    assert np.sum(allocation * np.asarray(cost)) >= _optimal_cost(cost, supply, demand) - 1e-9
+
+
+@pytest.mark.parametrize("cost, supply, demand", CASES)
+def test_modi_optimal(cost, supply, demand):
+    solution = TransportationProblem(cost, supply, demand).solve("MODI", compact=True)
+    _check_feasible(solution.to_dense(), supply, demand)
+    assert solution.total_cost == pytest.approx(_optimal_cost(cost, supply, demand))
+    # The duals price every basic cell exactly and leave no lane with a negative reduced cost
+    reduced = np.asarray(cost) - solution.u[:, None] - solution.v[None, :]
+    assert np.all(reduced >= -1e-9)
+    assert reduced[tuple(solution.basis.T)] == pytest.approx(0, abs=1e-9)
+    assert len(solution.basis) == len(supply) + len(demand) - 1
+
+
+def test_invalid_method():
+    with pytest.raises(ValueError):
+        TransportationProblem(*CASES[0]).solve("SIMPLEX")
+
+
+@pytest.mark.parametrize("cost, supply, demand", CASES)
+@pytest.mark.parametrize("method", ["NWCR", "LCM", "VAM", "MODI"])
+def test_sparse_all_lanes_matches_dense(cost, supply, demand, method):
+    dense = TransportationProblem(cost, supply, demand).solve(method)
+    allocation = TransportationProblem(sparse.csr_matrix(cost), supply, demand).solve(method)
+    assert sparse.issparse(allocation)
+    assert np.sum(allocation.toarray() * np.asarray(cost)) == pytest.approx(np.sum(dense * np.asarray(cost)))
+
+
+@pytest.mark.parametrize("rows, cols, costs, supply, demand", [
+    ([0, 0, 0, 1, 1, 2, 2, 2], [0, 1, 2, 1, 2, 0, 1, 3], [19, 30, 50, 30, 40, 40, 8, 20],
+     [7, 9, 18], [5, 8, 7, 14]),
+    ([0, 0, 1, 1, 2, 2], [0, 1, 1, 2, 2, 0], [1, 5, 1, 5, 1, 5], [4, 4, 4], [4, 4, 4]),
+])
+def test_sparse_lanes_optimal(rows, cols, costs, supply, demand):
+    solution = TransportationProblem.from_lanes(rows, cols, costs, supply, demand).solve("MODI", compact=True)
+    dense = np.full((len(supply), len(demand)), np.inf)
+    dense[rows, cols] = costs
+    assert solution.total_cost == pytest.approx(_optimal_cost(dense, supply, demand))
+    assert np.all(np.isfinite(dense[solution.rows, solution.cols]))
+    _check_feasible(solution.to_sparse(), supply, demand)
+
+
+@pytest.mark.parametrize("method", ["NWCR", "LCM", "VAM", "MODI"])
+def test_sparse_lanes_infeasible(method):
+    # Source 2 can only ship to destination 1, which needs less than it supplies
+    problem = TransportationProblem.from_lanes([0, 0, 1], [0, 1, 0], [1, 2, 3], [5, 5], [3, 7])
+    with pytest.raises(ValueError):
+        problem.solve(method)
+
+
+@pytest.mark.parametrize("edit", ["cost", "amounts", "both"])
+def test_modi_warm_start(edit):
+    cost, supply, demand = (np.array(part, dtype=float) for part in CASES[3])
+    previous = TransportationProblem(cost, supply, demand).solve("MODI", compact=True)
+    if edit in ("cost", "both"):
+        cost[0, 1] += 6
+        cost[2, 3] -= 1
+    if edit in ("amounts", "both"):
+        supply[1] += 50
+        demand[2] += 50
+    solution = TransportationProblem(cost, supply, demand).solve("MODI", compact=True, warm_start=previous)
+    _check_feasible(solution.to_dense(), supply, demand)
+    assert solution.total_cost == pytest.approx(_optimal_cost(cost, supply, demand))
+    if edit != "both":
+        assert solution.warm_started
+
+
+def test_modi_warm_start_other_shape():
+    previous = TransportationProblem(*CASES[0]).solve("MODI", compact=True)
+    cost, supply, demand = CASES[2]
+    solution = TransportationProblem(cost, supply, demand).solve("MODI", compact=True, warm_start=previous)
+    assert not solution.warm_started
+    assert solution.total_cost == pytest.approx(_optimal_cost(cost, supply, demand))
+
+
+@pytest.mark.parametrize("supply, demand, surplus_cost, shortage_cost", [
+    ([10, 9, 18], [5, 8, 7, 14], 2.0, 0.0),
+    ([10, 9, 18], [5, 8, 7, 14], [0.0, 30.0, 5.0], 0.0),
+    ([5, 9, 18], [5, 8, 7, 14], 0.0, [100.0, 1.0, 1.0, 1.0]),
+    ([5, 9, 18], [5, 8, 7, 14], 0.0, 0.0),
+])
+@pytest.mark.parametrize("method", ["NWCR", "LCM", "VAM", "MODI"])
+def test_dummy_balancing(supply, demand, surplus_cost, shortage_cost, method):
+    cost = np.array(CASES[0][0], dtype=float)
+    problem = TransportationProblem(cost, supply, demand, surplus_cost=surplus_cost, shortage_cost=shortage_cost)
+    solution = problem.solve(method, compact=True)
+    surplus = sum(supply) - sum(demand)
+    # The dummy is a priced extra column (surplus) or row (shortage) of the balanced problem
+    if surplus > 0:
+        balanced = np.column_stack([cost, np.broadcast_to(surplus_cost, len(supply))])
+        supply_b, demand_b = supply, demand + [surplus]
+        assert solution.unused_supply.sum() == pytest.approx(surplus)
+    else:
+        balanced = np.vstack([cost, np.broadcast_to(shortage_cost, len(demand))])
+        supply_b, demand_b = supply + [-surplus], demand
+        assert solution.unmet_demand.sum() == pytest.approx(-surplus)
+    assert problem.cost_matrix.shape == cost.shape
+    assert solution.real_shape == cost.shape
+    _check_feasible(solution.to_dense(), supply_b, demand_b)
+    assert solution.total_cost == pytest.approx(np.sum(solution.to_dense() * balanced))
+    assert solution.penalty_cost == pytest.approx(solution.total_cost - np.sum(solution.to_dense()[:len(supply), :len(demand)] * cost))
+    optimal = _optimal_cost(balanced, supply_b, demand_b)
+    if method == "MODI":
+        assert solution.total_cost == pytest.approx(optimal)
+    else:
+        assert solution.total_cost >= optimal - 1e-9
+
+
+ASSIGNMENTS = [
+    [[4, 1, 3], [2, 0, 5], [3, 2, 2]],
+    [[9, 2, 7, 8], [6, 4, 3, 7], [5, 8, 1, 8], [7, 6, 9, 4]],
+    # Degenerate: every assignment costs the same
+    [[1, 1, 1], [1, 1, 1], [1, 1, 1]],
+    np.random.default_rng(3).integers(0, 100, (12, 12)).tolist(),
+]
+
+
+@pytest.mark.parametrize("cost", ASSIGNMENTS)
+@pytest.mark.parametrize("method", ["ASSIGNMENT", "MODI"])
+def test_assignment_optimal(cost, method):
+    n = len(cost)
+    rows, cols = linear_sum_assignment(cost)
+    solution = TransportationProblem(cost, [2] * n, [2] * n).solve(method, compact=True)
+    assert solution.total_cost == pytest.approx(2 * np.asarray(cost)[rows, cols].sum())
+    _check_feasible(solution.to_dense(), [2] * n, [2] * n)
+    assert len(solution.basis) == 2 * n - 1
+
+
+@pytest.mark.parametrize("cost", ASSIGNMENTS)
+def test_assignment_sparse(cost):
+    n = len(cost)
+    cost = np.asarray(cost, dtype=float) + 1
+    cost[np.eye(n, k=1, dtype=bool)] = 0
+    rows, cols = linear_sum_assignment(np.where(cost > 0, cost, np.inf))
+    solution = TransportationProblem(sparse.csr_matrix(cost), [1] * n, [1] * n).solve("ASSIGNMENT", compact=True)
+    assert solution.total_cost == pytest.approx(cost[rows, cols].sum())
+    assert np.all(cost[solution.rows, solution.cols] > 0)
+
+
+def test_assignment_warm_starts_modi():
+    cost = np.array(ASSIGNMENTS[1], dtype=float)
+    previous = TransportationProblem(cost, [1] * 4, [1] * 4).solve("ASSIGNMENT", compact=True)
+    cost[0, 1] += 10
+    solution = TransportationProblem(cost, [1] * 4, [1] * 4).solve("MODI", compact=True, warm_start=previous)
+    assert solution.warm_started
+    rows, cols = linear_sum_assignment(cost)
+    assert solution.total_cost == pytest.approx(cost[rows, cols].sum())
+
+
+def test_assignment_needs_assignment_shape():
+    with pytest.raises(ValueError):
+        TransportationProblem(*CASES[0]).solve("ASSIGNMENT")
+    with pytest.raises(ValueError):
+        TransportationProblem(ASSIGNMENTS[0], [1, 2, 1], [1, 2, 1]).solve("ASSIGNMENT")
+
+
+@pytest.mark.parametrize("cost", ASSIGNMENTS)
+@pytest.mark.parametrize("threads", [None, 2])
+def test_auction_integer_costs_optimal(cost, threads):
+    n = len(cost)
+    rows, cols = linear_sum_assignment(cost)
+    problem = TransportationProblem(cost, [1] * n, [1] * n)
+    if threads is None:
+        solution = problem.solve("AUCTION", compact=True)
+    else:
+        with ThreadPoolExecutor(threads) as executor:
+            solution = problem.solve("AUCTION", compact=True, executor=executor)
+    assert solution.total_cost == pytest.approx(np.asarray(cost)[rows, cols].sum())
+    assert sorted(solution.cols) == list(range(n))
+
+
+def test_auction_fractional_costs_within_epsilon():
+    cost = np.random.default_rng(5).random((15, 15))
+    rows, cols = linear_sum_assignment(cost)
+    solution = TransportationProblem(cost, [1] * 15, [1] * 15).solve("AUCTION", compact=True, final_epsilon=1e-4)
+    assert cost[rows, cols].sum() - 1e-12 <= solution.total_cost <= cost[rows, cols].sum() + 15 * 1e-4
+
+
+def test_auction_iteration_cap_still_assigns():
+    cost = ASSIGNMENTS[3]
+    solution = TransportationProblem(cost, [1] * 12, [1] * 12).solve("AUCTION", compact=True, max_iterations=1)
+    assert sorted(solution.cols) == list(range(12))
+
+
+def test_auction_sparse_infeasible():
+    cost = sparse.csr_matrix([[1, 2, 0], [3, 4, 0], [5, 6, 0]])
+    with pytest.raises(ValueError):
+        TransportationProblem(cost, [1] * 3, [1] * 3).solve("AUCTION")